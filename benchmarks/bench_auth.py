@@ -0,0 +1,53 @@
+"""Microbenchmark for `AuthManager.is_token_expired`.
+
+Compares decoding the access token's `exp` claim on every call with the
+memoized check, which decodes each token once and then only compares a
+monotonic deadline. The token lives in a real `curl_cffi` cookie jar, so
+the cookie lookup is part of the measured cost.
+
+Usage:
+    python benchmarks/bench_auth.py [--iterations N]
+"""
+
+import argparse
+import base64
+import json
+import time
+
+from curl_cffi import AsyncSession
+
+from vinted.auth import AuthManager
+
+
+def _make_token() -> str:
+    payload = json.dumps({"exp": int(time.time()) + 3600}).encode()
+    return "header.%s.signature" % base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def main(iterations: int) -> None:
+    session = AsyncSession()
+    session.cookies.set("access_token_web", _make_token(), domain=".vinted.fr")
+    auth = AuthManager(session, domain="www.vinted.fr")
+    token = auth._get_access_token()
+    assert token is not None
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        AuthManager._validate_jwt_expiration(token)
+    uncached = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        auth.is_token_expired()
+    cached = time.perf_counter() - started
+
+    print(f"{'check':<12}{'us/call':>10}")
+    print(f"{'decode':<12}{uncached / iterations * 1e6:>10.2f}")
+    print(f"{'memoized':<12}{cached / iterations * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,88 @@
+"""Requests-per-second benchmark for cookie persistence.
+
+Runs `HttpSession.request` against an in-process stub transport (no
+network) with cookie persistence disabled and enabled for every storage
+format, so the cost of the cookie path is the only thing measured.
+
+Usage:
+    python benchmarks/bench_cookie_persistence.py [--requests N]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from vinted.session import HttpSession
+from vinted.storage import CookieStorage, JsonStorage, MozillaStorage, PickleStorage
+
+BASE_URL = "https://www.vinted.com"
+API_URL = f"{BASE_URL}/api/v2/catalog/items"
+
+
+class _StubResponse:
+    status_code = 200
+    reason = "OK"
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def _make_token() -> str:
+    payload = json.dumps({"exp": int(time.time()) + 3600}).encode()
+    return "header.%s.signature" % base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _install_stub_transport(session: HttpSession) -> None:
+    token = _make_token()
+
+    async def head(*args, **kwargs):
+        session.session.cookies.set("access_token_web", token, domain=".vinted.com")
+        return _StubResponse()
+
+    async def get(*args, **kwargs):
+        return _StubResponse()
+
+    session.session.head = head  # type: ignore[method-assign]
+    session.session.get = get  # type: ignore[method-assign]
+
+
+async def _run(storage: CookieStorage | None, requests: int) -> float:
+    session = HttpSession(storage=storage)
+    _install_stub_transport(session)
+
+    await session.request(API_URL)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await session.request(API_URL)
+    elapsed = time.perf_counter() - started
+
+    await session.close()
+    return requests / elapsed
+
+
+async def main(requests: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cookies_dir = Path(tmp)
+        scenarios: dict[str, CookieStorage | None] = {
+            "persistence off": None,
+            "json": JsonStorage(cookies_dir / "cookies.json"),
+            "pickle": PickleStorage(cookies_dir / "cookies.pk"),
+            "mozilla": MozillaStorage(cookies_dir / "cookies.txt"),
+        }
+
+        print(f"{'scenario':<18}{'req/s':>12}")
+        for name, storage in scenarios.items():
+            rps = await _run(storage, requests)
+            print(f"{name:<18}{rps:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
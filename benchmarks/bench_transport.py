@@ -0,0 +1,117 @@
+"""Throughput benchmark for `TransportConfig` settings.
+
+Sends concurrent GETs through `TransportSession` to a local threaded
+HTTP/1.1 stub server and reports requests per second together with the
+number of TCP connections the server saw, which shows how pool size and
+per-host limits affect connection reuse. Failed requests (e.g. timeouts
+under a tight per-host limit) are counted per scenario instead of
+aborting the run.
+
+Usage:
+    python benchmarks/bench_transport.py [--requests N] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from vinted.models.config import TransportConfig
+from vinted.transport import TransportSession
+
+BODY = b'{"items": []}'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.connections.add(self.client_address)  # type: ignore[attr-defined]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args) -> None:
+        return None
+
+
+def _start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.connections = set()  # type: ignore[attr-defined]
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run(
+    url: str,
+    transport: TransportConfig,
+    headers: dict[str, str],
+    requests: int,
+    concurrency: int,
+) -> tuple[float, int, str]:
+    """Return successful requests per second, failed requests and the first error."""
+    session = TransportSession(transport)
+    semaphore = asyncio.Semaphore(concurrency)
+    errors: list[str] = []
+
+    async def fetch() -> bool:
+        async with semaphore:
+            try:
+                response = await session.get(url, headers=headers)
+                response.raise_for_status()
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                return False
+            return True
+
+    try:
+        await fetch()
+        errors.clear()
+        started = time.perf_counter()
+        ok = sum(await asyncio.gather(*(fetch() for _ in range(requests))))
+        elapsed = time.perf_counter() - started
+    finally:
+        await session.close()
+    return ok / elapsed, requests - ok, errors[0] if errors else ""
+
+
+async def main(requests: int, concurrency: int) -> None:
+    close = {"Connection": "close"}
+    scenarios: dict[str, tuple[TransportConfig, dict[str, str]]] = {
+        "default": (TransportConfig(), {}),
+        "max_clients=32": (TransportConfig(max_clients=32), {}),
+        "max_clients=32 pool=64": (TransportConfig(max_clients=32, pool_size=64), {}),
+        "max_clients=32 host=4": (TransportConfig(max_clients=32, max_host_connections=4), {}),
+        "http/1.1 no tcp probes": (TransportConfig(http_version="v1", keep_alive=False), {}),
+        "http/1.1 no reuse": (TransportConfig(http_version="v1"), close),
+        "dns cache off": (TransportConfig(dns_cache_ttl=0), {}),
+    }
+
+    print(f"{'scenario':<26}{'req/s':>10}{'connections':>14}{'errors':>8}")
+    for name, (transport, headers) in scenarios.items():
+        server = _start_server()
+        url = f"http://127.0.0.1:{server.server_address[1]}/api/v2/catalog/items"
+        try:
+            rps, failed, error = await _run(url, transport, headers, requests, concurrency)
+        except Exception as e:
+            print(f"{name:<26}  failed: {type(e).__name__}: {e}")
+            continue
+        finally:
+            server.shutdown()
+            server.server_close()
+        connections = len(server.connections)  # type: ignore[attr-defined]
+        print(f"{name:<26}{rps:>10.0f}{connections:>14}{failed:>8}")
+        if error:
+            print(f"{'':<26}  first error: {error}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -1,16 +1,18 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from vinted.api.catalog import CatalogAPI
+from vinted.cache import MemoryCache
+from vinted.exceptions import VintedNetworkError, VintedValidationError
+from vinted.models.config import WatchConfig
 from vinted.models.item import CatalogItem
 
 
 @pytest.fixture
 def mock_session():
     session = MagicMock()
-    session.base_url = "https://www.vinted.com"
-    session.configure_from_url = MagicMock()
     return session
 
 
@@ -71,6 +73,19 @@ async def test_catalog_search_with_order(mock_session):
     assert "order" in call_args.kwargs["params"]
 
 
+@pytest.mark.asyncio
+async def test_catalog_search_uses_url_host(mock_session):
+    catalog = CatalogAPI(mock_session)
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"items": []}
+    mock_session.request = AsyncMock(return_value=mock_response)
+
+    await catalog.search(url="https://www.vinted.de/catalog?search_text=nike")
+
+    assert mock_session.request.call_args.args[0] == "https://www.vinted.de/api/v2/catalog/items"
+
+
 def test_extract_catalog_id_from_path():
     catalog = CatalogAPI(MagicMock())
 
@@ -96,3 +111,343 @@ def test_build_params():
     assert params["brand_ids"] == "53"
     assert params["per_page"] == 20
     assert params["page"] == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_cache_ignores_time_but_not_page(mock_session):
+    mock_response = MagicMock(content=b'{"items": [{"id": 1}]}')
+    mock_response.json.return_value = {"items": [{"id": 1}]}
+    mock_session.request = AsyncMock(return_value=mock_response)
+
+    catalog = CatalogAPI(mock_session, cache=MemoryCache(), cache_ttl=30)
+    url = "https://www.vinted.com/catalog?search_text=test"
+
+    await catalog.search(url=url, timestamp=1, raw_data=True)
+    await catalog.search(url=url, timestamp=2, raw_data=True)
+    await catalog.search(url=url, page=2, raw_data=True)
+
+    assert mock_session.request.await_count == 2
+
+
+def paged_session(mock_session, pages):
+    """Serve `pages[n - 1]` item ids for page n and record the requested params."""
+    requested = []
+
+    async def request(api_url, params=None, **kwargs):
+        requested.append(dict(params))
+        ids = pages[params["page"] - 1] if params["page"] <= len(pages) else []
+        response = MagicMock()
+        response.json.return_value = {"items": [{"id": i, "title": str(i)} for i in ids]}
+        return response
+
+    mock_session.request = AsyncMock(side_effect=request)
+    return requested
+
+
+@pytest.mark.asyncio
+async def test_catalog_iter_search_walks_pages_until_short_page(mock_session):
+    requested = paged_session(mock_session, [[1, 2], [3, 4], [5]])
+    catalog = CatalogAPI(mock_session)
+
+    items = [
+        item async for item in catalog.iter_search("https://www.vinted.fr/catalog", per_page=2)
+    ]
+
+    assert [item.id for item in items] == [1, 2, 3, 4, 5]
+    assert [p["page"] for p in requested] == [1, 2, 3]
+    assert len({p["time"] for p in requested}) == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_iter_search_prefetches_next_page(mock_session):
+    requested = paged_session(mock_session, [[1, 2], [3, 4]])
+    catalog = CatalogAPI(mock_session)
+    iterator = catalog.iter_search("https://www.vinted.fr/catalog", per_page=2, raw_data=True)
+
+    first = await anext(iterator)
+    await asyncio.sleep(0)
+
+    assert first["id"] == 1
+    assert [p["page"] for p in requested] == [1, 2]
+    await iterator.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "limits,expected_ids,expected_pages",
+    [
+        ({"max_items": 3}, [1, 2, 3], [1, 2]),
+        ({"max_pages": 2}, [1, 2, 3, 4], [1, 2]),
+        ({"max_items": 0}, [], []),
+    ],
+)
+async def test_catalog_iter_search_limits(mock_session, limits, expected_ids, expected_pages):
+    requested = paged_session(mock_session, [[1, 2], [3, 4], [5, 6]])
+    catalog = CatalogAPI(mock_session)
+
+    items = [
+        item
+        async for item in catalog.iter_search(
+            "https://www.vinted.fr/catalog", per_page=2, **limits
+        )
+    ]
+
+    assert [item.id for item in items] == expected_ids
+    assert [p["page"] for p in requested] == expected_pages
+
+
+@pytest.mark.asyncio
+async def test_catalog_iter_search_early_exit_cancels_prefetch(mock_session):
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def request(api_url, params=None, **kwargs):
+        if params["page"] == 2:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        response = MagicMock()
+        response.json.return_value = {"items": [{"id": 1}, {"id": 2}]}
+        return response
+
+    mock_session.request = AsyncMock(side_effect=request)
+    catalog = CatalogAPI(mock_session)
+    iterator = catalog.iter_search("https://www.vinted.fr/catalog", per_page=2)
+
+    await anext(iterator)
+    await started.wait()
+    await iterator.aclose()
+    await asyncio.wait_for(cancelled.wait(), 1.0)
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_pages_orders_and_deduplicates(mock_session):
+    # Page 2 overlaps page 1 by one listing, as happens when items shift.
+    pages = [[1, 2, 3], [3, 4, 5], [6, 7, 8], []]
+    requested = paged_session(mock_session, pages)
+    catalog = CatalogAPI(mock_session)
+
+    items = await catalog.search_pages(
+        "https://www.vinted.fr/catalog", pages=range(4, 0, -1), per_page=3, concurrency=2
+    )
+
+    assert [item.id for item in items] == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert sorted(p["page"] for p in requested) == [1, 2, 3, 4]
+    assert len({p["time"] for p in requested}) == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_pages_limits_concurrency(mock_session):
+    active = 0
+    peak = 0
+
+    async def request(api_url, params=None, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        response = MagicMock()
+        response.json.return_value = {"items": [{"id": params["page"]}]}
+        return response
+
+    mock_session.request = AsyncMock(side_effect=request)
+    catalog = CatalogAPI(mock_session)
+
+    items = await catalog.search_pages(
+        "https://www.vinted.fr/catalog", pages=range(1, 7), concurrency=2, raw_data=True
+    )
+
+    assert [item["id"] for item in items] == [1, 2, 3, 4, 5, 6]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_many_reports_each_url(mock_session):
+    ok_url = "https://www.vinted.fr/catalog?search_text=ok"
+    bad_url = "https://www.vinted.de/catalog?search_text=bad"
+
+    async def request(api_url, params=None, **kwargs):
+        if params["search_text"] == "bad":
+            raise VintedNetworkError("boom", Exception("reset"))
+        response = MagicMock()
+        response.json.return_value = {"items": [{"id": 1, "title": "ok"}]}
+        return response
+
+    mock_session.request = AsyncMock(side_effect=request)
+    catalog = CatalogAPI(mock_session)
+
+    batch = await catalog.search_many([ok_url, bad_url], per_page=5)
+
+    assert [o.url for o in batch.outcomes] == [ok_url, bad_url]
+    assert [item.id for item in batch.outcomes[0].items] == [1]
+    assert isinstance(batch.outcomes[1].error, VintedNetworkError)
+    params = [call.kwargs["params"] for call in mock_session.request.call_args_list]
+    assert {p["per_page"] for p in params} == {5}
+    assert len({p["time"] for p in params}) == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_pages_cancels_other_pages_on_error(mock_session):
+    finished = []
+
+    async def request(api_url, params=None, **kwargs):
+        if params["page"] == 1:
+            raise VintedNetworkError("boom", Exception("reset"))
+        await asyncio.sleep(0.05)
+        finished.append(params["page"])
+        response = MagicMock()
+        response.json.return_value = {"items": []}
+        return response
+
+    mock_session.request = AsyncMock(side_effect=request)
+    catalog = CatalogAPI(mock_session)
+
+    with pytest.raises(VintedNetworkError):
+        await catalog.search_pages("https://www.vinted.fr/catalog", pages=range(1, 4))
+    await asyncio.sleep(0.1)
+
+    assert finished == []
+
+
+def test_build_params_reuses_parsed_filters():
+    catalog = CatalogAPI(MagicMock())
+    url = "https://www.vinted.fr/catalog/123-shoes?search_text=nike&order=newest_first"
+    CatalogAPI._parse_filters.cache_clear()
+
+    first = catalog._build_params(url, per_page=20, page=1)
+    second = catalog._build_params(url, per_page=20, page=2)
+    first["search_text"] = "changed"
+
+    assert CatalogAPI._parse_filters.cache_info().hits == 1
+    assert second == {
+        "search_text": "nike",
+        "catalog_ids": "123",
+        "page": 2,
+        "per_page": 20,
+        "order": "newest_first",
+    }
+    assert list(second)[-1] == "order"
+
+
+def feed_session(mock_session, polls):
+    """Serve `polls[n][page - 1]` ids on poll n (counted on page 1 requests).
+
+    Missing pages are empty; an exception in place of a page is raised.
+    """
+    requested = []
+
+    async def request(api_url, params=None, **kwargs):
+        requested.append(dict(params))
+        poll = sum(p["page"] == 1 for p in requested) - 1
+        pages = polls[min(poll, len(polls) - 1)]
+        result = pages[params["page"] - 1] if params["page"] <= len(pages) else []
+        if isinstance(result, Exception):
+            raise result
+        response = MagicMock()
+        response.json.return_value = {"items": [{"id": i, "title": str(i)} for i in result]}
+        return response
+
+    mock_session.request = AsyncMock(side_effect=request)
+    return requested
+
+
+async def take(iterator, count):
+    items = []
+    async for item in iterator:
+        items.append(item)
+        if len(items) == count:
+            break
+    await iterator.aclose()
+    return items
+
+
+FAST_WATCH = {"min_interval": 0.0, "max_interval": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_catalog_watch_yields_only_new_items(mock_session):
+    requested = feed_session(mock_session, [[[3, 2, 1]], [[4, 3, 2]], [[6, 5, 4]]])
+    catalog = CatalogAPI(mock_session)
+    config = WatchConfig(per_page=3, **FAST_WATCH)
+
+    items = await take(catalog.watch("https://www.vinted.fr/catalog?order=price", config), 3)
+
+    assert [item.id for item in items] == [4, 5, 6]
+    assert all(isinstance(item, CatalogItem) for item in items)
+    assert {p["order"] for p in requested} == {"newest_first"}
+
+
+@pytest.mark.asyncio
+async def test_catalog_watch_include_existing(mock_session):
+    feed_session(mock_session, [[[2, 1]]])
+    catalog = CatalogAPI(mock_session)
+    config = WatchConfig(per_page=3, include_existing=True, **FAST_WATCH)
+
+    items = await take(catalog.watch("https://www.vinted.fr/catalog", config), 2)
+
+    assert [item.id for item in items] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_catalog_watch_fetches_more_pages_while_all_new(mock_session):
+    requested = feed_session(mock_session, [[[2, 1]], [[6, 5], [4, 3]], [[6, 5], [4, 3]]])
+    catalog = CatalogAPI(mock_session)
+    config = WatchConfig(per_page=2, max_pages=2, **FAST_WATCH)
+
+    items = await take(catalog.watch("https://www.vinted.fr/catalog", config), 4)
+
+    assert [item.id for item in items] == [3, 4, 5, 6]
+    assert [p["page"] for p in requested[:4]] == [1, 2, 1, 2]
+    assert requested[2]["time"] == requested[3]["time"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_watch_survives_failed_polls(mock_session):
+    error = VintedNetworkError("boom", Exception("reset"))
+    feed_session(mock_session, [[[1]], [error], [[2, 1]]])
+    catalog = CatalogAPI(mock_session)
+    config = WatchConfig(per_page=3, **FAST_WATCH)
+
+    items = await take(catalog.watch("https://www.vinted.fr/catalog", config), 1)
+
+    assert [item.id for item in items] == [2]
+
+
+@pytest.mark.asyncio
+async def test_catalog_watch_keeps_items_of_poll_failing_on_later_page(mock_session):
+    error = VintedNetworkError("boom", Exception("reset"))
+    feed_session(mock_session, [[[8, 7]], [[10, 9], error], [[10, 9], [8, 7]]])
+    catalog = CatalogAPI(mock_session)
+    config = WatchConfig(per_page=2, max_pages=2, **FAST_WATCH)
+
+    watcher = catalog.watch("https://www.vinted.fr/catalog", config)
+    items = await asyncio.wait_for(take(watcher, 2), timeout=1.0)
+
+    assert [item.id for item in items] == [9, 10]
+
+
+@pytest.mark.asyncio
+async def test_catalog_watch_raises_validation_errors(mock_session):
+    feed_session(mock_session, [[VintedValidationError("bad url")]])
+    catalog = CatalogAPI(mock_session)
+
+    with pytest.raises(VintedValidationError):
+        await take(catalog.watch("https://www.vinted.fr/catalog", WatchConfig(**FAST_WATCH)), 1)
+
+
+@pytest.mark.asyncio
+async def test_catalog_watch_bypasses_response_cache(mock_session):
+    requested = feed_session(mock_session, [[[1]], [[2, 1]]])
+    catalog = CatalogAPI(mock_session, cache=MemoryCache(), cache_ttl=30)
+    config = WatchConfig(per_page=3, **FAST_WATCH)
+
+    watcher = catalog.watch("https://www.vinted.fr/catalog", config)
+    items = await asyncio.wait_for(take(watcher, 1), timeout=1.0)
+
+    assert [item.id for item in items] == [2]
+    assert len(requested) == 2
+    assert all(call.kwargs["use_cache"] is False for call in mock_session.request.call_args_list)
@@ -1,16 +1,21 @@
-from unittest.mock import AsyncMock, MagicMock
+import json
+import sqlite3
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from vinted.api.items import ItemsAPI
+from vinted.cache import MemoryCache
+from vinted.exceptions import VintedNotFoundError
+from vinted.models.config import NegativeCacheConfig
 from vinted.models.item import DetailedItem
+from vinted.pool import SessionPool
 
 
 @pytest.fixture
 def mock_session():
     session = MagicMock()
-    session.base_url = "https://www.vinted.com"
-    session.configure_from_url = MagicMock()
     return session
 
 
@@ -62,3 +67,109 @@ def test_extract_product_id_complex():
     )
 
     assert product_id == "9876"
+
+
+@pytest.mark.asyncio
+async def test_items_get_details_hedges_through_pool(sample_detailed_item_data):
+    pool = MagicMock(spec=SessionPool)
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"item": sample_detailed_item_data}
+    pool.request = AsyncMock(return_value=mock_response)
+
+    await ItemsAPI(pool).get_details(url="https://www.vinted.com/items/123-test-item")
+
+    pool.request.assert_awaited_once_with(
+        "https://www.vinted.com/api/v2/items/123/details", hedge=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_items_get_details_served_from_cache(mock_session, sample_detailed_item_data):
+    body = json.dumps({"item": sample_detailed_item_data}).encode()
+    mock_response = MagicMock(content=body)
+    mock_response.json.return_value = {"item": sample_detailed_item_data}
+    mock_session.request = AsyncMock(return_value=mock_response)
+
+    cache = MemoryCache()
+    items_api = ItemsAPI(mock_session, cache=cache, cache_ttl=60)
+    url = "https://www.vinted.com/items/123-test-item"
+
+    first = await items_api.get_details(url=url)
+    raw = await items_api.get_details(url=url, raw_data=True)
+    raw["id"] = 0
+    again = await items_api.get_details(url=url, raw_data=True)
+
+    assert mock_session.request.await_count == 1
+    assert isinstance(first, DetailedItem)
+    assert again["id"] == 456
+    assert cache.stats().hits == 2
+
+
+@pytest.mark.asyncio
+async def test_items_get_details_survives_broken_cache(mock_session, sample_detailed_item_data):
+    mock_response = MagicMock(content=b"{}")
+    mock_response.json.return_value = {"item": sample_detailed_item_data}
+    mock_session.request = AsyncMock(return_value=mock_response)
+
+    cache = MagicMock()
+    cache.get = AsyncMock(side_effect=sqlite3.OperationalError("disk I/O error"))
+    cache.set = AsyncMock(side_effect=sqlite3.OperationalError("disk I/O error"))
+    items_api = ItemsAPI(mock_session, cache=cache, cache_ttl=60)
+
+    item = await items_api.get_details(url="https://www.vinted.com/items/123-test-item")
+
+    assert item.id == 456
+    cache.set.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_items_get_details_empty_item_raises_not_found(mock_session):
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"item": None}
+    mock_session.request = AsyncMock(return_value=mock_response)
+
+    with pytest.raises(VintedNotFoundError) as exc_info:
+        await ItemsAPI(mock_session).get_details(url="https://www.vinted.com/items/123-gone")
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "outcome",
+    [
+        VintedNotFoundError("HTTP 404: Not Found", status_code=404),
+        MagicMock(json=MagicMock(return_value={"item": {}})),
+    ],
+)
+async def test_items_negative_cache_short_circuits_missing_items(mock_session, outcome):
+    if isinstance(outcome, Exception):
+        mock_session.request = AsyncMock(side_effect=outcome)
+    else:
+        mock_session.request = AsyncMock(return_value=outcome)
+    items_api = ItemsAPI(mock_session, negative_cache=NegativeCacheConfig(ttl=60))
+    url = "https://www.vinted.com/items/123-gone"
+
+    for _ in range(3):
+        with pytest.raises(VintedNotFoundError):
+            await items_api.get_details(url=url)
+
+    assert mock_session.request.await_count == 1
+    assert items_api.negative_cache_stats().hits == 2
+
+
+@pytest.mark.asyncio
+async def test_items_negative_cache_expires(mock_session, sample_detailed_item_data):
+    mock_response = MagicMock()
+    mock_response.json.side_effect = [{"item": {}}, {"item": sample_detailed_item_data}]
+    mock_session.request = AsyncMock(return_value=mock_response)
+    items_api = ItemsAPI(mock_session, negative_cache=NegativeCacheConfig(ttl=10))
+    url = "https://www.vinted.com/items/123-relisted"
+
+    with pytest.raises(VintedNotFoundError):
+        await items_api.get_details(url=url)
+
+    with patch("vinted.cache.memory.time.monotonic", return_value=time.monotonic() + 11):
+        item = await items_api.get_details(url=url)
+
+    assert item.id == 456
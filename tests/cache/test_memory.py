@@ -0,0 +1,84 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from vinted.cache import MemoryCache, cache_key
+
+
+def test_cache_key_ignores_time_and_param_order():
+    url = "https://www.vinted.fr/api/v2/catalog/items"
+
+    assert cache_key(url, {"page": 1, "search_text": "nike", "time": 1}) == cache_key(
+        url, {"time": 2, "search_text": "nike", "page": "1"}
+    )
+    assert cache_key(url) == url
+    assert cache_key(url, {"page": 2}) == f"{url}?page=2"
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_hit_and_miss_counters():
+    cache = MemoryCache()
+
+    assert await cache.get("a") is None
+    await cache.set("a", b"payload", ttl=60)
+    assert await cache.get("a") == b"payload"
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.size) == (1, 1, 1, 7)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_entries():
+    cache = MemoryCache()
+    await cache.set("a", b"payload", ttl=10)
+
+    with patch("vinted.cache.memory.time.monotonic", return_value=time.monotonic() + 11):
+        assert await cache.get("a") is None
+
+    assert cache.stats().entries == 0
+    assert cache.stats().size == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used_by_count():
+    cache = MemoryCache(max_entries=2)
+    await cache.set("a", b"1", ttl=60)
+    await cache.set("b", b"2", ttl=60)
+    await cache.get("a")
+    await cache.set("c", b"3", ttl=60)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1"
+    assert await cache.get("c") == b"3"
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_by_byte_size():
+    cache = MemoryCache(max_bytes=10)
+    await cache.set("a", b"12345", ttl=60)
+    await cache.set("b", b"12345", ttl=60)
+    await cache.set("c", b"123", ttl=60)
+
+    assert await cache.get("a") is None
+    assert cache.stats().size == 8
+
+    await cache.set("huge", b"x" * 11, ttl=60)
+    assert await cache.get("huge") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_overwrite_delete_and_clear():
+    cache = MemoryCache()
+    await cache.set("a", b"old", ttl=60)
+    await cache.set("a", b"newer", ttl=60)
+    assert cache.stats().size == 5
+
+    await cache.delete("a")
+    assert await cache.get("a") is None
+
+    await cache.set("b", b"1", ttl=60)
+    await cache.clear()
+    assert cache.stats().entries == 0
+    assert cache.stats().size == 0
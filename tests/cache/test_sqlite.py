@@ -0,0 +1,92 @@
+import sqlite3
+import time
+from unittest.mock import patch
+
+import pytest
+
+from vinted.cache import SqliteCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "responses.sqlite3"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_roundtrip_is_compressed_and_persistent(cache_path):
+    body = b'{"item": {"id": 1}}' * 100
+    cache = SqliteCache(cache_path)
+    await cache.set("k", body, ttl=60)
+    await cache.close()
+
+    reopened = SqliteCache(cache_path)
+    assert await reopened.get("k") == body
+    stats = reopened.stats()
+    assert stats.hits == 1
+    assert stats.entries == 1
+    assert stats.size < len(body)
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_uses_wal_mode(cache_path):
+    cache = SqliteCache(cache_path)
+    await cache.set("k", b"v", ttl=60)
+
+    conn = sqlite3.connect(cache_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_expiry_and_ignore_expiry(cache_path):
+    cache = SqliteCache(cache_path)
+    await cache.set("k", b"v", ttl=10)
+
+    later = time.time() + 11
+    with patch("vinted.cache.sqlite.time.time", return_value=later):
+        offline = SqliteCache(cache_path, ignore_expiry=True)
+        assert await offline.get("k") == b"v"
+        await offline.close()
+
+        assert await cache.get("k") is None
+
+    assert cache.stats().misses == 1
+    assert cache.stats().entries == 0
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_evicts_least_recently_used_over_size_cap(cache_path):
+    cache = SqliteCache(cache_path, max_bytes=70, compress_level=0)
+
+    now = time.time()
+    with patch("vinted.cache.sqlite.time.time", side_effect=[now + i for i in range(4)]):
+        await cache.set("a", b"a" * 20, ttl=60)
+        await cache.set("b", b"b" * 20, ttl=60)
+        await cache.get("a")
+        await cache.set("c", b"c" * 20, ttl=60)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"a" * 20
+    assert await cache.get("c") == b"c" * 20
+    assert cache.stats().evictions == 1
+    assert cache.stats().size <= 70
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_delete_and_clear(cache_path):
+    cache = SqliteCache(cache_path)
+    await cache.set("a", b"1", ttl=60)
+    await cache.set("b", b"2", ttl=60)
+
+    await cache.delete("a")
+    assert await cache.get("a") is None
+    assert cache.stats().entries == 1
+
+    await cache.clear()
+    assert cache.stats().entries == 0
+    assert cache.stats().size == 0
+    await cache.close()
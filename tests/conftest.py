@@ -1,8 +1,14 @@
+import asyncio
+import base64
+import json
+from http import HTTPStatus
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from curl_cffi.requests import Response
 
+from vinted.session import HttpSession
+
 
 @pytest.fixture
 def sample_catalog_item_data():
@@ -72,3 +78,77 @@ def temp_cookies_dir(tmp_path):
     cookies_dir = tmp_path / "cookies"
     cookies_dir.mkdir()
     return cookies_dir
+
+
+@pytest.fixture
+def make_token():
+    """Return a factory for unsigned access tokens expiring at `exp`."""
+
+    def factory(exp):
+        payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode()
+        return f"header.{payload}.signature"
+
+    return factory
+
+
+@pytest.fixture
+def make_response():
+    """Return a factory for mock HTTP responses with a status and headers."""
+
+    def factory(status_code=200, headers=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.reason = HTTPStatus(status_code).phrase
+        response.headers = headers or {}
+        return response
+
+    return factory
+
+
+@pytest.fixture
+def make_http_session():
+    """Return a factory for `HttpSession`s whose cookies count as loaded."""
+
+    def factory(**kwargs):
+        session = HttpSession(**kwargs)
+        session._cookies_ready = True
+        return session
+
+    return factory
+
+
+@pytest.fixture
+def make_proxy_session():
+    """Return a factory for mock proxy sessions as used by the pool and warm-up.
+
+    `request` and `warm_up` wait `delay` seconds, then raise `error` or
+    (for `request`) return `session.response`. `active` and `peak` track
+    concurrent calls.
+    """
+
+    def factory(proxy, delay=0.0, error=None):
+        session = MagicMock()
+        session.proxy = proxy
+        session.offline = False
+        session.response = MagicMock(status_code=200)
+        session.active = 0
+        session.peak = 0
+
+        async def respond(*args, **kwargs):
+            session.active += 1
+            session.peak = max(session.peak, session.active)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                session.active -= 1
+            if error:
+                raise error
+            return session.response
+
+        session.request = AsyncMock(side_effect=respond)
+        session.warm_up = MagicMock(side_effect=respond)
+        session.close = AsyncMock()
+        session.circuit_open = MagicMock(return_value=False)
+        return session
+
+    return factory
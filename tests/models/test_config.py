@@ -45,3 +45,8 @@ def test_config_string_path_conversion():
 def test_config_valid_storage_formats(format):
     config = ClientConfig(storage_format=format)
     assert config.storage_format == format
+
+
+def test_config_proxy_list():
+    assert ClientConfig().proxy_list == [None]
+    assert ClientConfig(proxy="a:1", proxies=["b:1", "a:1"]).proxy_list == ["a:1", "b:1"]
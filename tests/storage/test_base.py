@@ -0,0 +1,120 @@
+import asyncio
+import os
+from http.cookiejar import CookieJar
+from unittest.mock import patch
+
+import pytest
+
+from vinted.storage import (
+    AsyncCookieStorage,
+    JsonStorage,
+    MozillaStorage,
+    PickleStorage,
+    StorageStats,
+)
+from vinted.storage.sqlite import SqliteStorage
+
+from .test_sqlite import make_cookie, make_jar
+
+
+@pytest.mark.asyncio
+async def test_async_roundtrip_runs_in_worker_thread(temp_cookies_dir):
+    storage = JsonStorage(temp_cookies_dir / "cookies.json")
+    assert isinstance(storage, AsyncCookieStorage)
+
+    with patch("vinted.storage.base.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        await storage.asave(make_jar(make_cookie("access_token_web", "abc")))
+        jar = make_jar(make_cookie("stale", "gone", domain=".vinted.de"))
+        await storage.aload(jar)
+
+    assert to_thread.call_count == 2
+    # Like the sync load(), the jar is replaced by what is persisted.
+    assert [(c.name, c.value) for c in jar] == [("access_token_web", "abc")]
+
+    await storage.aclear()
+    assert not storage.exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_class", [JsonStorage, PickleStorage, MozillaStorage])
+async def test_load_and_aload_both_replace_the_jar(temp_cookies_dir, storage_class):
+    storage = storage_class(temp_cookies_dir / "cookies")
+    storage.save(make_jar(make_cookie("access_token_web", "abc")))
+
+    synced = make_jar(make_cookie("stale", "gone", domain=".vinted.de"))
+    storage.load(synced)
+    awaited = make_jar(make_cookie("stale", "gone", domain=".vinted.de"))
+    await storage.aload(awaited)
+
+    expected = [("access_token_web", "abc")]
+    assert [(c.name, c.value) for c in synced] == expected
+    assert [(c.name, c.value) for c in awaited] == expected
+
+
+@pytest.mark.asyncio
+async def test_aload_without_persisted_cookies_keeps_jar(temp_cookies_dir):
+    storage = JsonStorage(temp_cookies_dir / "missing.json")
+    jar = make_jar(make_cookie("token", "in-memory"))
+
+    await storage.aload(jar)
+
+    assert [c.value for c in jar] == ["in-memory"]
+
+
+@pytest.mark.asyncio
+async def test_asave_snapshots_jar_before_writing(temp_cookies_dir):
+    storage = SqliteStorage(temp_cookies_dir / "cookies.sqlite3", identity="a:1")
+    jar = make_jar(make_cookie("token", "one"))
+
+    save = asyncio.create_task(storage.asave(jar))
+    await asyncio.sleep(0)  # the task snapshots the jar, then waits on the worker thread
+    jar.set_cookie(make_cookie("late", "x"))
+    await save
+
+    loaded = CookieJar()
+    await storage.aload(loaded)
+    assert [c.name for c in loaded] == ["token"]
+    storage.database.close()
+
+
+def test_storage_stats_record():
+    stats = StorageStats()
+
+    stats.record(0.2, blocking=True)
+    stats.record(0.05, blocking=True)
+    stats.record(1.0, blocking=False)
+
+    assert (stats.calls, stats.blocking_calls) == (3, 2)
+    assert stats.blocking_time == pytest.approx(0.25)
+    assert stats.max_blocking == 0.2
+    assert stats.offloaded_time == 1.0
+
+
+@pytest.mark.asyncio
+async def test_save_is_compact_and_atomic(temp_cookies_dir):
+    storage = JsonStorage(temp_cookies_dir / "cookies.json")
+    storage.save(make_jar(make_cookie("token", "old")))
+    assert "\n" not in storage.filepath.read_text()
+
+    with patch("vinted.storage.json.json.dump", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            storage.save(make_jar(make_cookie("token", "new")))
+
+    jar = CookieJar()
+    storage.load(jar)
+    assert [c.value for c in jar] == ["old"]
+    assert [p.name for p in temp_cookies_dir.iterdir()] == ["cookies.json"]
+
+
+@pytest.mark.parametrize("storage_class", [PickleStorage, MozillaStorage])
+def test_file_storages_replace_atomically(temp_cookies_dir, storage_class):
+    storage = storage_class(temp_cookies_dir / "cookies")
+
+    with patch("vinted.storage.base.os.replace", wraps=os.replace) as replace:
+        storage.save(make_jar(make_cookie("token", "abc")))
+
+    replace.assert_called_once()
+    jar = CookieJar()
+    storage.load(jar)
+    assert [c.value for c in jar] == ["abc"]
+    assert [p.name for p in temp_cookies_dir.iterdir()] == ["cookies"]
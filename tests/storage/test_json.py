@@ -93,3 +93,17 @@ def test_json_storage_empty_file(temp_cookies_dir):
     storage.load(mock_jar)
 
     mock_jar.clear.assert_called_once()
+
+
+def test_json_storage_revision(temp_cookies_dir):
+    storage = JsonStorage(temp_cookies_dir / "cookies.json")
+    assert storage.revision() is None
+
+    with storage.filepath.open("w") as f:
+        json.dump({}, f)
+    first = storage.revision()
+    assert first is not None
+
+    with storage.filepath.open("w") as f:
+        json.dump({"a": 1}, f)
+    assert storage.revision() != first
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from vinted.storage.lock import FileLock
+
+
+@pytest.mark.asyncio
+async def test_file_lock_excludes_other_holders(temp_cookies_dir):
+    path = temp_cookies_dir / "cookies.json.lock"
+    first = FileLock(path, poll_interval=0.01)
+    second = FileLock(path, poll_interval=0.01)
+
+    await first.acquire()
+    waiter = asyncio.create_task(second.acquire())
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    first.release()
+    await asyncio.wait_for(waiter, 1.0)
+    assert second.locked and not first.locked
+    second.release()
+
+
+@pytest.mark.asyncio
+async def test_file_lock_serialises_tasks_in_one_process(temp_cookies_dir):
+    lock = FileLock(temp_cookies_dir / "cookies.lock", poll_interval=0.01)
+    active = 0
+    peak = 0
+
+    async def critical_section():
+        nonlocal active, peak
+        async with lock:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(critical_section() for _ in range(3)))
+
+    assert peak == 1
+    assert not lock.locked
+
+
+@pytest.mark.asyncio
+async def test_file_lock_cancelled_waiter_does_not_hold(temp_cookies_dir):
+    path = temp_cookies_dir / "cookies.lock"
+    holder = FileLock(path, poll_interval=0.01)
+    waiter = FileLock(path, poll_interval=0.01)
+
+    await holder.acquire()
+    task = asyncio.create_task(waiter.acquire())
+    await asyncio.sleep(0.03)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    holder.release()
+
+    await asyncio.wait_for(waiter.acquire(), 1.0)
+    waiter.release()
@@ -26,6 +26,7 @@ def test_pickle_storage_load(temp_cookies_dir):
 
     storage.load(load_jar)
 
+    load_jar.clear.assert_called_once_with()
     load_jar._cookies.update.assert_called_once_with({"domain": {"path": {"cookie": "value"}}})
 
 
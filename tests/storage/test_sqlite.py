@@ -0,0 +1,131 @@
+from http.cookiejar import Cookie, CookieJar
+from unittest.mock import patch
+
+import pytest
+
+from vinted.storage.sqlite import CookieDatabase, SqliteStorage
+
+
+def make_cookie(name, value, domain=".vinted.fr"):
+    return Cookie(
+        version=0,
+        name=name,
+        value=value,
+        port=None,
+        port_specified=False,
+        domain=domain,
+        domain_specified=True,
+        domain_initial_dot=domain.startswith("."),
+        path="/",
+        path_specified=True,
+        secure=True,
+        expires=None,
+        discard=False,
+        comment=None,
+        comment_url=None,
+        rest={},
+    )
+
+
+def make_jar(*cookies):
+    jar = CookieJar()
+    for cookie in cookies:
+        jar.set_cookie(cookie)
+    return jar
+
+
+@pytest.fixture
+def database(temp_cookies_dir):
+    database = CookieDatabase(temp_cookies_dir / "cookies.sqlite3")
+    yield database
+    database.close()
+
+
+def test_sqlite_storage_roundtrip(database):
+    storage = SqliteStorage(database.filepath, identity="1.2.3.4:8080", database=database)
+    assert not storage.exists()
+
+    storage.save(make_jar(make_cookie("access_token_web", "abc")))
+    jar = make_jar(make_cookie("stale", "x"))
+    storage.load(jar)
+
+    assert [(c.name, c.value, c.domain) for c in jar] == [
+        ("access_token_web", "abc", ".vinted.fr")
+    ]
+    assert storage.exists()
+
+
+def test_sqlite_storage_identities_are_isolated(database):
+    first = SqliteStorage(database.filepath, identity="a:1", database=database)
+    second = SqliteStorage(database.filepath, identity="b:2", database=database)
+
+    first.save(make_jar(make_cookie("token", "first")))
+    second.save(make_jar(make_cookie("token", "second"), make_cookie("other", "x")))
+    first.clear()
+
+    jar = CookieJar()
+    second.load(jar)
+    assert sorted(c.value for c in jar) == ["second", "x"]
+    assert first.revision() is None
+    assert not database.filepath.with_name("cookies_a_1.sqlite3").exists()
+
+
+def test_sqlite_storage_revision_changes_across_connections(database):
+    storage = SqliteStorage(database.filepath, identity="a:1", database=database)
+    other_process = SqliteStorage(database.filepath, identity="a:1")
+
+    storage.save(make_jar(make_cookie("token", "one")))
+    before = storage.revision()
+    other_process.save(make_jar(make_cookie("token", "two")))
+
+    assert storage.revision() != before
+    jar = CookieJar()
+    storage.load(jar)
+    assert [c.value for c in jar] == ["two"]
+    other_process.database.close()
+
+
+def test_sqlite_revision_does_not_wait_for_writes(database):
+    storage = SqliteStorage(database.filepath, identity="a:1", database=database)
+    storage.save(make_jar(make_cookie("token", "one")))
+
+    # A save in progress holds the write lock; revision checks must not queue behind it.
+    with database._lock:
+        assert storage.revision() == 1
+
+
+def test_sqlite_storage_load_missing_identity_leaves_jar(database):
+    storage = SqliteStorage(database.filepath, identity="nobody", database=database)
+    jar = make_jar(make_cookie("keep", "me"))
+
+    storage.load(jar)
+
+    assert [c.name for c in jar] == ["keep"]
+
+
+def test_cookie_database_preload_serves_first_load(database):
+    for identity in ("a:1", "b:2"):
+        SqliteStorage(database.filepath, identity=identity, database=database).save(
+            make_jar(make_cookie("token", identity))
+        )
+
+    fresh = CookieDatabase(database.filepath)
+    fresh.preload()
+    with patch.object(fresh, "_connect", wraps=fresh._connect) as connect:
+        assert fresh.load("a:1")[".vinted.fr|/|token"]["value"] == "a:1"
+    # The snapshot is consumed; later loads read the database again.
+    assert "a:1" not in fresh._preloaded
+    assert connect.call_count == 1
+    fresh.close()
+
+
+def test_cookie_database_preload_ignores_stale_snapshot(database):
+    storage = SqliteStorage(database.filepath, identity="a:1", database=database)
+    storage.save(make_jar(make_cookie("token", "old")))
+
+    fresh = CookieDatabase(database.filepath)
+    fresh.preload()
+    storage.save(make_jar(make_cookie("token", "new")))
+
+    assert fresh.load("a:1")[".vinted.fr|/|token"]["value"] == "new"
+    fresh.close()
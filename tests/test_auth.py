@@ -1,6 +1,9 @@
 import base64
 import json
 import time
+from unittest.mock import patch
+
+from curl_cffi import AsyncSession
 
 from vinted.auth import AuthManager
 
@@ -60,3 +63,71 @@ def test_validate_jwt_expiration_missing_exp():
 
     result = AuthManager._validate_jwt_expiration(token)
     assert result is True
+
+
+def test_is_token_expired_scoped_to_domain():
+    future_payload = {"exp": int(time.time()) + 3600}
+    payload_b64 = base64.b64encode(json.dumps(future_payload).encode()).decode()
+
+    session = AsyncSession()
+    session.cookies.set("access_token_web", f"h.{payload_b64}.s", domain=".vinted.fr")
+    session.cookies.set("access_token_web", "invalid", domain=".vinted.de")
+
+    assert AuthManager(session, domain="www.vinted.fr").is_token_expired() is False
+    assert AuthManager(session, domain="www.vinted.de").is_token_expired() is True
+    assert AuthManager(session, domain="www.vinted.it").is_token_expired() is True
+
+
+def test_token_expiry(mock_async_session):
+    exp = int(time.time()) + 3600
+    payload_b64 = base64.b64encode(json.dumps({"exp": exp}).encode()).decode()
+    mock_async_session.cookies.get.return_value = f"header.{payload_b64}.signature"
+
+    assert AuthManager(mock_async_session).token_expiry() == exp
+
+
+def test_token_expiry_missing_token(mock_async_session):
+    mock_async_session.cookies.get.return_value = None
+
+    assert AuthManager(mock_async_session).token_expiry() is None
+
+
+def test_is_token_expired_decodes_each_token_once(mock_async_session, make_token):
+    mock_async_session.cookies.get.return_value = make_token(int(time.time()) + 3600)
+    auth = AuthManager(mock_async_session)
+
+    with patch.object(AuthManager, "_decode_expiry", wraps=AuthManager._decode_expiry) as decode:
+        for _ in range(100):
+            assert auth.is_token_expired() is False
+        assert decode.call_count == 1
+
+        mock_async_session.cookies.get.return_value = make_token(int(time.time()) - 1)
+        assert auth.is_token_expired() is True
+        assert decode.call_count == 2
+
+
+def test_is_token_expired_applies_skew(mock_async_session, make_token):
+    mock_async_session.cookies.get.return_value = make_token(int(time.time()) + 30)
+
+    assert AuthManager(mock_async_session).is_token_expired() is False
+    assert AuthManager(mock_async_session, skew=60).is_token_expired() is True
+
+
+def test_is_token_expired_memoizes_cookie_jar_token(make_token):
+    session = AsyncSession()
+    session.cookies.set(
+        "access_token_web", make_token(int(time.time()) + 3600), domain=".vinted.fr"
+    )
+    auth = AuthManager(session, domain="www.vinted.fr")
+
+    with patch.object(AuthManager, "_decode_expiry", wraps=AuthManager._decode_expiry) as decode:
+        for _ in range(100):
+            assert auth.is_token_expired() is False
+        assert decode.call_count == 1
+
+        session.cookies.set(
+            "access_token_web", make_token(int(time.time()) + 7200), domain=".vinted.fr"
+        )
+        assert auth.is_token_expired() is False
+        assert auth.is_token_expired() is False
+        assert decode.call_count == 2
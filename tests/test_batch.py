@@ -0,0 +1,101 @@
+import asyncio
+from urllib.parse import urlparse
+
+import pytest
+
+from vinted.batch import run_search_batch
+from vinted.exceptions import VintedNetworkError
+
+
+def make_search(delay=0.0, errors=()):
+    state = {"active": {}, "peak": {}, "total": 0, "peak_total": 0, "started": []}
+
+    async def search(url):
+        domain = urlparse(url).netloc
+        state["started"].append(url)
+        state["active"][domain] = state["active"].get(domain, 0) + 1
+        state["total"] += 1
+        state["peak"][domain] = max(state["peak"].get(domain, 0), state["active"][domain])
+        state["peak_total"] = max(state["peak_total"], state["total"])
+        try:
+            await asyncio.sleep(delay)
+            if url in errors:
+                raise errors[url]
+            return [url]
+        finally:
+            state["active"][domain] -= 1
+            state["total"] -= 1
+
+    return search, state
+
+
+@pytest.mark.asyncio
+async def test_run_search_batch_keeps_input_order():
+    urls = [f"https://www.vinted.fr/catalog?search_text={i}" for i in range(5)]
+    search, _ = make_search()
+
+    batch = await run_search_batch(urls, search, concurrency=2)
+
+    assert [o.url for o in batch.outcomes] == urls
+    assert [o.items for o in batch.outcomes] == [[url] for url in urls]
+    assert len(batch.succeeded) == 5
+    assert batch.failed == []
+    assert batch.elapsed >= 0
+
+
+@pytest.mark.asyncio
+async def test_run_search_batch_isolates_failures():
+    urls = [f"https://www.vinted.fr/catalog?search_text={i}" for i in range(3)]
+    error = VintedNetworkError("boom", Exception("reset"))
+    search, _ = make_search(errors={urls[1]: error})
+
+    batch = await run_search_batch(urls, search)
+
+    assert [o.ok for o in batch.outcomes] == [True, False, True]
+    assert batch.outcomes[1].error is error
+    assert batch.outcomes[1].items is None
+    assert batch.failed == [batch.outcomes[1]]
+
+
+@pytest.mark.asyncio
+async def test_run_search_batch_isolates_unexpected_errors():
+    urls = ["https://www.vinted.fr/catalog?a=1", "https://www.vinted.fr/catalog?a=2"]
+    search, _ = make_search(errors={urls[0]: ValueError("bad json")})
+
+    batch = await run_search_batch(urls, search)
+
+    assert isinstance(batch.outcomes[0].error, ValueError)
+    assert batch.outcomes[1].ok
+
+
+@pytest.mark.asyncio
+async def test_run_search_batch_respects_limits():
+    urls = [f"https://www.vinted.fr/catalog?a={i}" for i in range(6)]
+    urls += [f"https://www.vinted.de/catalog?a={i}" for i in range(6)]
+    search, state = make_search(delay=0.01)
+
+    await run_search_batch(urls, search, concurrency=3, per_domain_limit=2)
+
+    assert state["peak_total"] == 3
+    assert state["peak"] == {"www.vinted.fr": 2, "www.vinted.de": 2}
+
+
+@pytest.mark.asyncio
+async def test_run_search_batch_interleaves_domains():
+    busy = [f"https://www.vinted.fr/catalog?a={i}" for i in range(10)]
+    quiet = ["https://www.vinted.de/catalog?a=0", "https://www.vinted.it/catalog?a=0"]
+    search, state = make_search(delay=0.01)
+
+    await run_search_batch(busy + quiet, search, concurrency=3)
+
+    # The domains listed last still start in the first round.
+    assert set(state["started"][:3]) == {busy[0], *quiet}
+
+
+@pytest.mark.asyncio
+async def test_run_search_batch_empty():
+    search, _ = make_search()
+
+    batch = await run_search_batch([], search)
+
+    assert batch.outcomes == []
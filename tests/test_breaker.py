@@ -0,0 +1,99 @@
+import pytest
+
+from vinted.breaker import CircuitBreaker, CircuitBreakerConfig
+from vinted.exceptions import VintedCircuitOpenError
+
+
+def make_breaker(changes=None, **overrides):
+    config = CircuitBreakerConfig(
+        failure_rate=0.5,
+        window=4,
+        min_calls=4,
+        open_seconds=10.0,
+        on_state_change=changes.append if changes is not None else None,
+        **overrides,
+    )
+    return CircuitBreaker(config, "www.vinted.fr", proxy="a:1")
+
+
+def fail(breaker, times, now=0.0):
+    for _ in range(times):
+        probe = breaker.acquire(now=now)
+        breaker.record(False, probe, now=now)
+
+
+def test_breaker_stays_closed_below_min_calls():
+    breaker = make_breaker()
+    fail(breaker, 3)
+    assert breaker.state == "closed"
+
+
+def test_breaker_opens_at_failure_rate_and_fails_fast():
+    changes = []
+    breaker = make_breaker(changes)
+
+    breaker.record(True)
+    breaker.record(True)
+    fail(breaker, 2, now=100.0)
+
+    assert breaker.state == "open"
+    assert [(c.old, c.new) for c in changes] == [("closed", "open")]
+    assert changes[0].netloc == "www.vinted.fr"
+    assert changes[0].proxy == "a:1"
+
+    with pytest.raises(VintedCircuitOpenError) as exc_info:
+        breaker.acquire(now=105.0)
+    assert exc_info.value.retry_after == pytest.approx(5.0)
+    assert exc_info.value.netloc == "www.vinted.fr"
+
+
+def test_half_open_probe_success_closes_breaker():
+    changes = []
+    breaker = make_breaker(changes)
+    fail(breaker, 4)
+
+    probe = breaker.acquire(now=11.0)
+    assert probe is True
+    assert breaker.state == "half_open"
+
+    with pytest.raises(VintedCircuitOpenError):
+        breaker.acquire(now=11.0)
+
+    breaker.record(True, probe)
+    assert breaker.state == "closed"
+    assert breaker.failure_rate == 0.0
+    assert [c.new for c in changes] == ["open", "half_open", "closed"]
+
+
+def test_half_open_probe_failure_reopens_breaker():
+    breaker = make_breaker()
+    fail(breaker, 4)
+
+    probe = breaker.acquire(now=11.0)
+    breaker.record(False, probe, now=11.0)
+
+    assert breaker.state == "open"
+    assert breaker.retry_after(now=12.0) == pytest.approx(9.0)
+
+
+def test_released_probe_frees_its_slot():
+    breaker = make_breaker()
+    fail(breaker, 4)
+
+    probe = breaker.acquire(now=11.0)
+    breaker.release(probe)
+
+    assert breaker.acquire(now=11.0) is True
+
+
+def test_late_results_do_not_count_as_probes():
+    breaker = make_breaker()
+    early = breaker.acquire(now=0.0)
+    fail(breaker, 4)
+    probe = breaker.acquire(now=11.0)
+
+    breaker.record(True, early)
+    assert breaker.state == "half_open"
+
+    breaker.record(True, probe)
+    assert breaker.state == "closed"
@@ -1,9 +1,18 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from vinted import VintedClient
+from vinted import (
+    CacheConfig,
+    DiskCacheConfig,
+    MemoryCache,
+    TransportConfig,
+    VintedClient,
+    VintedConfigError,
+    VintedValidationError,
+)
 from vinted.models.item import CatalogItem
+from vinted.retry import RetryPolicy
 
 
 @pytest.mark.asyncio
@@ -38,3 +47,169 @@ async def test_client_context_manager():
 async def test_client_proxy_configuration():
     client = VintedClient(proxy="user:pass@proxy.com:8080")
     assert client._session.proxy == "user:pass@proxy.com:8080"
+
+
+@pytest.mark.asyncio
+async def test_client_proxy_pool_sessions(temp_cookies_dir):
+    client = VintedClient(
+        proxy="a.example:8080",
+        proxies=["b.example:8080", "a.example:8080"],
+        cookies_dir=temp_cookies_dir,
+        persist_cookies=True,
+    )
+
+    sessions = client._pool.sessions
+    assert [s.proxy for s in sessions] == ["a.example:8080", "b.example:8080"]
+    assert sessions[0].storage.filepath.name == "cookies_a.example_8080.json"
+    assert sessions[1].storage.filepath.name == "cookies_b.example_8080.json"
+    assert len(client.proxy_stats()) == 2
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_shares_retry_budget_across_proxies():
+    client = VintedClient(proxies=["a.example:1", "b.example:1"], retry=RetryPolicy())
+
+    first, second = client._pool.sessions
+    assert first._retry_budget is not None
+    assert first._retry_budget is second._retry_budget
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_passes_transport_to_sessions():
+    transport = TransportConfig(max_clients=20, pool_size=40)
+    client = VintedClient(proxies=["a.example:8080", "b.example:8080"], transport=transport)
+
+    assert all(s.transport is transport for s in client._pool.sessions)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_cache_configuration():
+    backend = MemoryCache(max_entries=3)
+    client = VintedClient(cache=CacheConfig(item_ttl=10, catalog_ttl=0, backend=backend))
+
+    assert client._items.cache is backend
+    assert client._items.cache_ttl == 10
+    assert client._catalog.cache_ttl == 0
+    assert client.cache_stats().hits == 0
+    assert VintedClient().cache_stats() is None
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_disk_cache_shared_by_sessions(temp_cookies_dir):
+    client = VintedClient(
+        proxies=["a.example:8080", "b.example:8080"],
+        cookies_dir=temp_cookies_dir,
+        disk_cache=DiskCacheConfig(ttl=60, catalog_ttl=5, offline=True),
+    )
+
+    caches = {id(s.response_cache) for s in client._pool.sessions}
+    assert len(caches) == 1
+    assert client._disk_cache.filepath == temp_cookies_dir / "responses.sqlite3"
+    assert client._disk_cache.ignore_expiry is True
+    assert all(s.offline and s.response_cache_ttl == 60 for s in client._pool.sessions)
+    assert all(
+        s.response_ttl("https://www.vinted.fr/api/v2/catalog/items") == 5
+        and s.response_ttl("https://www.vinted.fr/api/v2/items/1/details") == 60
+        for s in client._pool.sessions
+    )
+    assert client.disk_cache_stats().entries == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_warm_up_selected_proxies():
+    client = VintedClient(proxies=["a.example:1", "b.example:1"])
+    for session in client._pool.sessions:
+        session.warm_up = AsyncMock()
+
+    results = await client.warm_up(locales=["fr", "de"], proxies=["b.example:1"])
+
+    assert [(r.proxy, r.url) for r in results] == [
+        ("b.example:1", "https://www.vinted.fr"),
+        ("b.example:1", "https://www.vinted.de"),
+    ]
+    client._pool.sessions[0].warm_up.assert_not_awaited()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_warm_up_rejects_bad_input():
+    client = VintedClient(proxy="a.example:1")
+
+    with pytest.raises(VintedValidationError):
+        await client.warm_up(locales=["xx"])
+    with pytest.raises(VintedConfigError):
+        await client.warm_up(locales=["fr"], proxies=["c.example:1"])
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_shared_cookies_get_refresh_lock(temp_cookies_dir):
+    client = VintedClient(cookies_dir=temp_cookies_dir, persist_cookies=True, share_cookies=True)
+
+    plain = VintedClient()
+
+    assert client._session.refresh_lock.path == temp_cookies_dir / "cookies.json.lock"
+    assert plain._session.refresh_lock is None
+    await client.close()
+    await plain.close()
+
+
+@pytest.mark.asyncio
+async def test_client_persisted_cookies_have_no_lock_by_default(temp_cookies_dir):
+    client = VintedClient(cookies_dir=temp_cookies_dir, persist_cookies=True)
+
+    assert client._session.refresh_lock is None
+    await client.close()
+    assert not list(temp_cookies_dir.glob("*.lock"))
+
+
+@pytest.mark.asyncio
+async def test_client_sqlite_storage_shares_one_database(temp_cookies_dir):
+    client = VintedClient(
+        proxies=["user:pass@1.2.3.4:8080", "5.6.7.8:3128"],
+        cookies_dir=temp_cookies_dir,
+        persist_cookies=True,
+        storage_format="sqlite",
+        share_cookies=True,
+    )
+
+    storages = [s.storage for s in client._pool.sessions]
+    assert {s.filepath for s in storages} == {temp_cookies_dir / "cookies.sqlite3"}
+    assert storages[0].database is storages[1].database
+    assert [s.identity for s in storages] == ["1.2.3.4:8080", "5.6.7.8:3128"]
+    assert [s.refresh_lock.path.name for s in client._pool.sessions] == [
+        "cookies_1.2.3.4_8080.sqlite3.lock",
+        "cookies_5.6.7.8_3128.sqlite3.lock",
+    ]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_storage_stats(temp_cookies_dir):
+    client = VintedClient(
+        proxies=["a.example:1", "b.example:1"], cookies_dir=temp_cookies_dir, persist_cookies=True
+    )
+    plain = VintedClient()
+
+    assert [s.calls for s in client.storage_stats()] == [0, 0]
+    assert plain.storage_stats() == []
+    await client.close()
+    await plain.close()
+
+
+@pytest.mark.asyncio
+async def test_client_cookie_save_delay(temp_cookies_dir):
+    client = VintedClient(cookies_dir=temp_cookies_dir, persist_cookies=True)
+    eager = VintedClient(cookies_dir=temp_cookies_dir, cookie_save_delay=None)
+
+    assert client._session.save_delay == 1.0
+    assert eager._session.save_delay is None
+    await client.close()
+    await eager.close()
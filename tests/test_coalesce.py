@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from vinted.coalesce import RequestCoalescer, request_key
+
+
+def test_request_key_ignores_time_and_param_order():
+    first = request_key("https://www.vinted.fr/api", {"page": 1, "search_text": "nike", "time": 1})
+    second = request_key(
+        "https://www.vinted.fr/api", {"time": 2, "search_text": "nike", "page": "1"}
+    )
+
+    assert first == second
+    assert request_key("https://www.vinted.fr/api", {"page": 2}) != first
+    assert request_key("https://www.vinted.fr/api") == request_key("https://www.vinted.fr/api", {})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return object()
+
+    results = await asyncio.gather(
+        *(coalescer.run("https://x/api", {"page": 1, "time": i}, fetch) for i in range(5))
+    )
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert coalescer.coalesced == 4
+    assert coalescer._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_sequential_requests_are_not_coalesced():
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await coalescer.run("https://x/api", None, fetch) == 1
+    assert await coalescer.run("https://x/api", None, fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_error_reaches_every_waiter():
+    coalescer = RequestCoalescer()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(coalescer.run("https://x/api", None, fetch) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_request():
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(coalescer.run("https://x/api", None, fetch))
+    second = asyncio.create_task(coalescer.run("https://x/api", None, fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from vinted.concurrency import AdaptiveLimiter, ConcurrencyLimiter
+from vinted.models.config import ConcurrencyConfig
+
+
+def make_limiter(**overrides):
+    config = ConcurrencyConfig(**{"initial_limit": 2, "min_limit": 1, "max_limit": 4, **overrides})
+    return AdaptiveLimiter(config)
+
+
+@pytest.mark.asyncio
+async def test_requests_over_limit_wait_in_order():
+    limiter = make_limiter()
+    await limiter.acquire()
+    await limiter.acquire()
+
+    order = []
+
+    async def waiter(name):
+        await limiter.acquire()
+        order.append(name)
+
+    tasks = [asyncio.create_task(waiter(name)) for name in ("a", "b")]
+    await asyncio.sleep(0)
+    assert limiter.queued == 2
+    assert limiter.in_flight == 2
+
+    limiter.release()
+    await asyncio.sleep(0)
+    assert order == ["a"]
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+    assert order == ["a", "b"]
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_healthy_responses_increase_limit_additively():
+    limiter = make_limiter()
+
+    for _ in range(4):
+        await limiter.acquire()
+        limiter.release(0.1)
+
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_limit_never_exceeds_max():
+    limiter = make_limiter(max_limit=3)
+
+    for _ in range(50):
+        await limiter.acquire()
+        limiter.release(0.1)
+
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_overload_cuts_limit_multiplicatively_once_per_round_trip():
+    limiter = make_limiter(initial_limit=4)
+    await limiter.acquire()
+    limiter.release(0.5, now=100.0)
+
+    for _ in range(2):
+        await limiter.acquire()
+    limiter.release(overloaded=True, now=101.0)
+    limiter.release(overloaded=True, now=101.1)
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_rising_latency_counts_as_overload():
+    limiter = make_limiter(initial_limit=4, latency_tolerance=2.0)
+    await limiter.acquire()
+    limiter.release(0.1, now=10.0)
+
+    await limiter.acquire()
+    limiter.release(0.5, now=20.0)
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_never_drops_below_min():
+    limiter = make_limiter()
+
+    for step in range(5):
+        await limiter.acquire()
+        limiter.release(overloaded=True, now=float(step))
+
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    limiter = make_limiter(initial_limit=1)
+    await limiter.acquire()
+
+    task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.queued == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+def test_registry_creates_one_limiter_per_key():
+    registry = ConcurrencyLimiter(ConcurrencyConfig())
+
+    assert registry.limiter("www.vinted.fr") is registry.limiter("www.vinted.fr")
+    assert registry.limiter("www.vinted.de") is not registry.limiter("www.vinted.fr")
+    assert [key for key, _ in registry.items()] == ["www.vinted.fr", "www.vinted.de"]
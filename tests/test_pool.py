@@ -0,0 +1,285 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from vinted.exceptions import VintedAPIError, VintedCircuitOpenError, VintedNetworkError
+from vinted.models.config import HedgingConfig, ProxyPoolConfig
+from vinted.pool import ProxyStats, SessionPool
+from vinted.session import CachedResponse
+
+
+def test_pool_requires_sessions():
+    with pytest.raises(ValueError):
+        SessionPool([])
+
+
+def test_proxy_stats_score_prefers_fast_and_healthy():
+    fast = ProxyStats(proxy="a", latency=0.1)
+    slow = ProxyStats(proxy="b", latency=2.0)
+    failing = ProxyStats(proxy="c", latency=0.1, error_rate=0.8)
+
+    assert fast.score > slow.score
+    assert fast.score > failing.score
+
+
+@pytest.mark.asyncio
+async def test_pool_records_success(make_proxy_session):
+    session = make_proxy_session("a:1")
+    pool = SessionPool([session])
+
+    await pool.request("https://www.vinted.com/api/v2/items/1/details")
+
+    stats = pool.stats()[0]
+    assert stats.requests == 1
+    assert stats.successes == 1
+    assert stats.latency >= 0.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error,field",
+    [
+        (VintedAPIError("blocked", status_code=403), "blocked"),
+        (VintedAPIError("slow down", status_code=429), "rate_limited"),
+        (VintedAPIError("bad gateway", status_code=502), "server_errors"),
+        (VintedAPIError("unavailable", status_code=503), "server_errors"),
+        (VintedNetworkError("timeout", Exception("t")), "network_errors"),
+    ],
+)
+async def test_pool_classifies_failures(error, field, make_proxy_session):
+    session = make_proxy_session("a:1")
+    session.request.side_effect = error
+    pool = SessionPool([session])
+
+    with pytest.raises(type(error)):
+        await pool.request("https://www.vinted.com/x")
+
+    stats = pool.stats()[0]
+    assert getattr(stats, field) == 1
+    assert stats.error_rate > 0
+
+
+@pytest.mark.asyncio
+async def test_pool_not_found_counts_as_healthy(make_proxy_session):
+    session = make_proxy_session("a:1")
+    session.request.side_effect = VintedAPIError("missing", status_code=404)
+    pool = SessionPool([session])
+
+    with pytest.raises(VintedAPIError):
+        await pool.request("https://www.vinted.com/x")
+
+    assert pool.stats()[0].successes == 1
+    assert pool.stats()[0].error_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_pool_quarantines_failing_proxy(make_proxy_session):
+    bad, good = make_proxy_session("bad:1"), make_proxy_session("good:1")
+    bad.request.side_effect = VintedAPIError("blocked", status_code=403)
+    config = ProxyPoolConfig(ewma_alpha=1.0, min_requests=1, quarantine_seconds=60)
+    pool = SessionPool([bad, good], config)
+
+    for _ in range(10):
+        try:
+            await pool.request("https://www.vinted.com/x")
+        except VintedAPIError:
+            pass
+
+    bad_stats, good_stats = pool.stats()
+    assert bad_stats.quarantines == 1
+    assert bad_stats.is_quarantined()
+    assert bad.request.await_count == 1
+    assert good_stats.successes == 9
+    assert all(pool.select() is good for _ in range(10))
+
+
+def test_pool_all_quarantined_uses_earliest_release(make_proxy_session):
+    first, second = make_proxy_session("a:1"), make_proxy_session("b:1")
+    pool = SessionPool([first, second])
+    pool._stats[id(first)].quarantined_until = 1e12
+    pool._stats[id(second)].quarantined_until = 1e11
+
+    assert pool.select() is second
+
+
+def test_pool_stats_are_snapshots(make_proxy_session):
+    pool = SessionPool([make_proxy_session("a:1")])
+    pool.stats()[0].requests = 100
+
+    assert pool.stats()[0].requests == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_close_closes_all_sessions(make_proxy_session):
+    sessions = [make_proxy_session("a:1"), make_proxy_session("b:1")]
+    pool = SessionPool(sessions)
+
+    await pool.close()
+
+    for session in sessions:
+        session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_pool_coalesces_identical_requests_across_proxies(make_proxy_session):
+    sessions = [make_proxy_session("a:1", 0.01), make_proxy_session("b:1", 0.01)]
+    pool = SessionPool(sessions)
+
+    url = "https://www.vinted.com/api/v2/items/1/details"
+    await asyncio.gather(*(pool.request(url) for _ in range(4)))
+
+    assert sum(s.request.await_count for s in sessions) == 1
+    assert sum(stats.requests for stats in pool.stats()) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_without_coalescing_sends_every_request(make_proxy_session):
+    session = make_proxy_session("a:1")
+    pool = SessionPool([session], coalesce=False)
+
+    url = "https://www.vinted.com/api/v2/items/1/details"
+    await asyncio.gather(*(pool.request(url) for _ in range(3)))
+
+    assert session.request.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_uses_faster_proxy_and_cancels_slow_one(make_proxy_session):
+    slow = make_proxy_session("slow:1", 1.0)
+    fast = make_proxy_session("fast:1", 0.0)
+    pool = SessionPool([slow, fast], hedging=HedgingConfig(delay=0.01))
+    pool.select = MagicMock(
+        side_effect=lambda exclude=None, netloc=None: fast if exclude else slow
+    )
+
+    response = await asyncio.wait_for(pool.request("https://x/items/1", hedge=True), 0.5)
+
+    assert response is fast.response
+    assert pool.hedges == 1
+    assert pool.hedge_wins == 1
+    assert slow.request.await_count == 1
+    # The slow primary is sampled for at least the hedge delay, not the hedge's own time.
+    assert len(pool._hedge_latencies) == 1
+    assert pool._hedge_latencies[0] >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged(make_proxy_session):
+    sessions = [make_proxy_session("a:1", 0.0), make_proxy_session("b:1", 0.0)]
+    pool = SessionPool(sessions, hedging=HedgingConfig(delay=0.5))
+
+    await pool.request("https://x/items/1", hedge=True)
+
+    assert pool.hedges == 0
+    assert sum(s.request.await_count for s in sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_waits_for_other_attempt_when_one_fails(make_proxy_session):
+    failing = make_proxy_session("a:1", 0.02, VintedNetworkError("reset", Exception("r")))
+    working = make_proxy_session("b:1", 0.05)
+    pool = SessionPool([failing, working], hedging=HedgingConfig(delay=0.01))
+    pool.select = MagicMock(
+        side_effect=lambda exclude=None, netloc=None: working if exclude else failing
+    )
+
+    response = await pool.request("https://x/items/1", hedge=True)
+
+    assert response is working.response
+
+
+@pytest.mark.asyncio
+async def test_hedge_rate_is_capped_by_budget(make_proxy_session):
+    sessions = [make_proxy_session("a:1", 0.02), make_proxy_session("b:1", 0.02)]
+    hedging = HedgingConfig(delay=0.001, max_hedge_rate=0.0, hedge_reserve=1)
+    pool = SessionPool(sessions, hedging=hedging, coalesce=False)
+
+    await asyncio.gather(*(pool.request("https://x/items/1", hedge=True) for _ in range(5)))
+
+    assert pool.hedges == 1
+
+
+@pytest.mark.asyncio
+async def test_single_session_is_never_hedged(make_proxy_session):
+    session = make_proxy_session("a:1", 0.02)
+    pool = SessionPool([session], hedging=HedgingConfig(delay=0.001))
+
+    await pool.request("https://x/items/1", hedge=True)
+
+    assert pool.hedges == 0
+    assert session.request.await_count == 1
+
+
+def test_hedge_delay_follows_observed_percentile(make_proxy_session):
+    hedging = HedgingConfig(percentile=0.9, min_samples=10, fallback_delay=2.0)
+    pool = SessionPool([make_proxy_session("a:1")], hedging=hedging)
+
+    assert pool.hedge_delay() == 2.0
+
+    pool._hedge_latencies.extend(i / 10 for i in range(1, 11))
+    assert pool.hedge_delay() == pytest.approx(1.0)
+
+
+def test_pool_select_skips_open_circuits(make_proxy_session):
+    tripped, healthy = make_proxy_session("a:1"), make_proxy_session("b:2")
+    tripped.circuit_open.side_effect = lambda netloc: netloc == "www.vinted.fr"
+    pool = SessionPool([tripped, healthy])
+
+    assert all(pool.select(netloc="www.vinted.fr") is healthy for _ in range(10))
+    assert {pool.select(netloc="www.vinted.de") for _ in range(50)} == {tripped, healthy}
+
+
+@pytest.mark.asyncio
+async def test_pool_fails_over_when_circuit_opens(make_proxy_session):
+    tripped, healthy = make_proxy_session("a:1"), make_proxy_session("b:2")
+    tripped.request.side_effect = VintedCircuitOpenError("open", "www.vinted.fr", retry_after=30.0)
+    pool = SessionPool([tripped, healthy], coalesce=False)
+    pool.select = MagicMock(side_effect=[tripped, healthy])
+
+    response = await pool.request("https://www.vinted.fr/api/v2/items/1/details")
+
+    assert response.status_code == 200
+    healthy.request.assert_awaited_once()
+    assert pool.stats()[0].requests == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_latency_skips_cache_hits(make_proxy_session):
+    sessions = [make_proxy_session("a:1"), make_proxy_session("b:2")]
+    for session in sessions:
+        session.response = CachedResponse()
+    pool = SessionPool(sessions, hedging=HedgingConfig(delay=0.5))
+
+    await pool.request("https://x/items/1", hedge=True)
+
+    assert not pool._hedge_latencies
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_fails_over_when_circuit_opens(make_proxy_session):
+    tripped, healthy = make_proxy_session("a:1"), make_proxy_session("b:2")
+    tripped.request.side_effect = VintedCircuitOpenError("open", "www.vinted.fr", retry_after=30.0)
+    pool = SessionPool([tripped, healthy], hedging=HedgingConfig(delay=0.5))
+    pool.select = MagicMock(side_effect=[tripped, healthy])
+
+    response = await pool.request("https://www.vinted.fr/api/v2/items/1/details", hedge=True)
+
+    assert response is healthy.response
+    assert pool.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_ignores_offline_cache_misses(make_proxy_session):
+    sessions = [make_proxy_session("a:1"), make_proxy_session("b:2")]
+    for session in sessions:
+        session.offline = True
+        session.request.side_effect = VintedNetworkError("Offline mode", LookupError("key"))
+    config = ProxyPoolConfig(ewma_alpha=1.0, min_requests=1)
+    pool = SessionPool(sessions, config)
+
+    for _ in range(10):
+        with pytest.raises(VintedNetworkError):
+            await pool.request("https://www.vinted.fr/api/v2/items/1/details")
+
+    assert all(s.requests == 0 and s.quarantines == 0 for s in pool.stats())
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from vinted.models.config import RateLimitConfig
+from vinted.ratelimit import RateLimiter, TokenBucket
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=10.0, burst=3)
+    now = time.monotonic()
+
+    assert [bucket.reserve(now) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve(now) == pytest.approx(0.1)
+    assert bucket.reserve(now) == pytest.approx(0.2)
+
+
+def test_token_bucket_refills_over_time():
+    bucket = TokenBucket(rate=10.0, burst=1)
+    now = time.monotonic()
+
+    bucket.reserve(now)
+    assert bucket.reserve(now + 0.5) == 0.0
+
+
+def test_token_bucket_pause_delays_and_prevents_burst():
+    bucket = TokenBucket(rate=10.0, burst=5)
+    now = time.monotonic()
+
+    bucket.pause(2.0, now)
+
+    assert bucket.reserve(now) == pytest.approx(2.0)
+    assert bucket.reserve(now + 2.0) == pytest.approx(0.1)
+
+
+def test_token_bucket_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_acquire_waits_for_pause():
+    bucket = TokenBucket(rate=1000.0, burst=1)
+    bucket.pause(0.05)
+
+    started = time.monotonic()
+    await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.04
+    assert bucket.paused_for == 0.0
+
+
+def test_rate_limiter_buckets_are_per_key():
+    limiter = RateLimiter(RateLimitConfig(rate=1.0, burst=1))
+
+    limiter.pause("www.vinted.fr", 30)
+
+    assert limiter.bucket("www.vinted.fr").paused_for > 0
+    assert limiter.bucket("www.vinted.de").paused_for == 0
+    assert limiter.bucket("www.vinted.fr") is limiter.bucket("www.vinted.fr")
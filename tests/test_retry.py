@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from vinted.exceptions import VintedAPIError, VintedNetworkError, VintedRateLimitError
+from vinted.retry import RetryBudget, RetryPolicy
+
+URL = "https://www.vinted.com/api/v2/test"
+
+
+def test_policy_is_retryable():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable(VintedNetworkError("timeout", Exception("t")))
+    assert policy.is_retryable(VintedAPIError("bad gateway", status_code=502))
+    assert not policy.is_retryable(VintedAPIError("missing", status_code=404))
+    assert not policy.is_retryable(VintedRateLimitError("slow", status_code=429))
+
+
+def test_policy_backoff_is_capped_full_jitter():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+
+    for attempt, cap in [(2, 1.0), (3, 2.0), (4, 4.0), (10, 4.0)]:
+        delays = [policy.backoff(attempt) for _ in range(50)]
+        assert all(0 <= d <= cap for d in delays)
+
+
+def test_budget_spend_and_deposit():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_spend() is True
+    for _ in range(10):
+        budget.deposit()
+    assert budget.balance == 1.0
+
+
+@pytest.mark.asyncio
+async def test_request_retries_transient_status_and_reports_attempts(
+    make_response, make_http_session
+):
+    attempts = []
+    policy = RetryPolicy(base_delay=0.001, max_delay=0.001, on_retry=attempts.append)
+    session = make_http_session(retry=policy)
+    context = session.get_context(URL)
+
+    get = AsyncMock(side_effect=[make_response(503), make_response(502), make_response(200)])
+    with patch.object(session.session, "get", new=get):
+        with patch.object(context.auth, "is_token_expired", return_value=False):
+            response = await session.request(URL)
+
+    assert response.status_code == 200
+    assert [a.attempt for a in attempts] == [2, 3]
+    assert all(a.delay <= 0.001 for a in attempts)
+    assert attempts[0].error.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_request_gives_up_after_max_attempts(make_http_session):
+    session = make_http_session(retry=RetryPolicy(max_attempts=2, base_delay=0.001))
+    context = session.get_context(URL)
+
+    get = AsyncMock(side_effect=Exception("reset"))
+    with patch.object(session.session, "get", new=get):
+        with patch.object(context.auth, "is_token_expired", return_value=False):
+            with pytest.raises(VintedNetworkError):
+                await session.request(URL)
+
+    assert get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_respects_exhausted_budget(make_response, make_http_session):
+    policy = RetryPolicy(base_delay=0.001)
+    session = make_http_session(retry=policy, retry_budget=RetryBudget(ratio=0.0, reserve=0))
+    context = session.get_context(URL)
+
+    get = AsyncMock(return_value=make_response(503))
+    with patch.object(session.session, "get", new=get):
+        with patch.object(context.auth, "is_token_expired", return_value=False):
+            with pytest.raises(VintedAPIError):
+                await session.request(URL)
+
+    assert get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_request_without_policy_does_not_retry(make_response, make_http_session):
+    session = make_http_session()
+    context = session.get_context(URL)
+
+    get = AsyncMock(return_value=make_response(503))
+    with patch.object(session.session, "get", new=get):
+        with patch.object(context.auth, "is_token_expired", return_value=False):
+            with pytest.raises(VintedAPIError):
+                await session.request(URL)
+
+    assert get.await_count == 1
@@ -0,0 +1,278 @@
+import asyncio
+import queue
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from vinted.exceptions import VintedNotFoundError
+from vinted.models.config import RateLimitConfig
+from vinted.pool import ProxyStats
+from vinted.runner import RunnerStats, ShardedRunner, WorkerStats, _work
+
+
+class FakeClient:
+    def __init__(self, **options):
+        self.options = options
+        self.requests = 0
+
+    async def search_items(self, url, per_page=20):
+        self.requests += 1
+        return [url]
+
+    async def item_details(self, url):
+        self.requests += 1
+        if url.endswith("gone"):
+            raise VintedNotFoundError("HTTP 404: Not Found", status_code=404)
+        if url.endswith("broken"):
+            raise ValueError("no item id")
+        return {"url": url}
+
+    def proxy_stats(self):
+        return [ProxyStats(proxy=None, requests=self.requests)]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class ThreadProcess:
+    """Stand-in for `multiprocessing.Process` running the target in a thread."""
+
+    def __init__(self, target, args, daemon=True, crash=False):
+        self.crash = crash
+        self.thread = threading.Thread(target=self._run, args=(target, args), daemon=daemon)
+        self.pid = None
+        self.exitcode = None
+
+    def _run(self, target, args):
+        if self.crash:
+            self.exitcode = 1
+            return
+        target(*args)
+        self.exitcode = 0
+
+    def start(self):
+        self.thread.start()
+
+    def is_alive(self):
+        return self.thread.is_alive()
+
+    def join(self, timeout=None):
+        self.thread.join(timeout)
+
+    def terminate(self):
+        pass
+
+
+class ThreadContext:
+    def __init__(self, crash_workers=()):
+        self.crash_workers = set(crash_workers)
+
+    def Queue(self, maxsize=0):
+        return queue.Queue(maxsize=maxsize)
+
+    def Process(self, target, args, daemon=True):
+        return ThreadProcess(target, args, daemon, crash=args[0] in self.crash_workers)
+
+
+class LateResultsContext(ThreadContext):
+    """Lets every worker finish, then times out the parent's first poll."""
+
+    def __init__(self):
+        super().__init__()
+        self.processes = []
+        context = self
+
+        class LateQueue(queue.Queue):
+            timed_out = False
+
+            def get(self, block=True, timeout=None):
+                if block and not self.timed_out:
+                    self.timed_out = True
+                    for process in context.processes:
+                        process.join()
+                    raise queue.Empty
+                return super().get(block, timeout)
+
+        self.queue_class = LateQueue
+
+    def Queue(self, maxsize=0):
+        return self.queue_class(maxsize=maxsize)
+
+    def Process(self, target, args, daemon=True):
+        process = super().Process(target, args, daemon)
+        self.processes.append(process)
+        return process
+
+
+def make_runner(crash_workers=(), **kwargs):
+    runner = ShardedRunner(**kwargs)
+    runner._context = ThreadContext(crash_workers)
+    return runner
+
+
+def test_worker_options_split_rate_limit():
+    runner = ShardedRunner(workers=4, client_options={"rate_limit": RateLimitConfig(rate=8.0)})
+
+    options = runner.worker_options()
+
+    assert options["persist_cookies"] is True
+    assert options["share_cookies"] is True
+    assert options["rate_limit"].rate == 2.0
+    assert options["rate_limit"].burst == 2
+    assert runner.client_options["rate_limit"].rate == 8.0
+
+
+def test_worker_options_keep_explicit_persistence():
+    runner = ShardedRunner(workers=2, client_options={"persist_cookies": False})
+
+    assert runner.worker_options()["persist_cookies"] is False
+
+
+@pytest.mark.asyncio
+async def test_work_forwards_results_and_reports_stats():
+    results = queue.Queue(maxsize=1)
+    tasks = [("search", "https://www.vinted.fr/catalog?search_text=a")]
+    tasks += [
+        ("item", "https://www.vinted.fr/items/1-ok"),
+        ("item", "https://www.vinted.fr/items/2-gone"),
+    ]
+    received = []
+
+    def drain():
+        while len(received) < len(tasks):
+            received.append(results.get())
+
+    consumer = threading.Thread(target=drain)
+    consumer.start()
+    with patch("vinted.runner.VintedClient", FakeClient):
+        stats = await _work(3, {}, tasks, results, concurrency=2, per_page=20)
+    consumer.join(1.0)
+
+    assert sorted(r.target for r in received) == sorted(target for _, target in tasks)
+    failed = [r for r in received if not r.ok]
+    assert [r.target for r in failed] == ["https://www.vinted.fr/items/2-gone"]
+    assert failed[0].error.startswith("VintedNotFoundError: ")
+    assert (stats.worker, stats.completed, stats.failed, stats.requests) == (3, 2, 1, 3)
+
+
+@pytest.mark.asyncio
+async def test_work_reports_unexpected_errors_per_task():
+    results = queue.Queue()
+    tasks = [
+        ("item", "https://www.vinted.fr/items/broken"),
+        ("item", "https://www.vinted.fr/items/1-ok"),
+    ]
+
+    with patch("vinted.runner.VintedClient", FakeClient):
+        stats = await _work(0, {}, tasks, results, concurrency=1, per_page=20)
+
+    received = [results.get_nowait() for _ in range(len(tasks))]
+    assert [r.error for r in received] == ["ValueError: no item id", None]
+    assert (stats.completed, stats.failed) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_runner_streams_results_from_all_shards():
+    runner = make_runner(workers=3, queue_size=2, concurrency=2)
+    search_urls = [f"https://www.vinted.de/catalog?page={i}" for i in range(4)]
+    item_urls = [f"https://www.vinted.de/items/{i}-ok" for i in range(5)]
+
+    with patch("vinted.runner.VintedClient", FakeClient):
+        results = [r async for r in runner.run(search_urls=search_urls, item_urls=item_urls)]
+
+    assert sorted(r.target for r in results) == sorted(search_urls + item_urls)
+    assert {r.worker for r in results} == {0, 1, 2}
+
+    stats = runner.stats()
+    assert [w.worker for w in stats.workers] == [0, 1, 2]
+    assert stats.completed == 9 and stats.failed == 0 and stats.requests == 9
+    assert stats.tasks_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_runner_reports_crashed_worker():
+    runner = make_runner(crash_workers={1}, workers=2)
+    urls = [f"https://www.vinted.de/items/{i}-ok" for i in range(4)]
+
+    with (
+        patch("vinted.runner.VintedClient", FakeClient),
+        patch("vinted.runner.RESULT_POLL_INTERVAL", 0.01),
+    ):
+        results = [r async for r in runner.run(item_urls=urls)]
+
+    assert len(results) == 2
+    crashed = runner.stats().workers[1]
+    assert crashed.crashed and crashed.failed == 2
+
+
+@pytest.mark.asyncio
+async def test_runner_drains_results_of_workers_that_exited_during_a_poll():
+    runner = ShardedRunner(workers=2)
+    runner._context = LateResultsContext()
+    urls = [f"https://www.vinted.de/items/{i}-ok" for i in range(4)]
+
+    with patch("vinted.runner.VintedClient", FakeClient):
+        results = [r async for r in runner.run(item_urls=urls)]
+
+    assert sorted(r.target for r in results) == sorted(urls)
+    stats = runner.stats()
+    assert not any(w.crashed for w in stats.workers)
+    assert stats.completed == 4 and stats.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_runner_joins_workers_off_the_event_loop():
+    runner = make_runner(workers=2)
+    urls = [f"https://www.vinted.de/items/{i}-ok" for i in range(2)]
+    ticks = 0
+    ticks_during_join = []
+
+    def slow_join(self, timeout=None):
+        before = ticks
+        time.sleep(0.05)
+        ticks_during_join.append(ticks - before)
+        self.thread.join(timeout)
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    with (
+        patch("vinted.runner.VintedClient", FakeClient),
+        patch.object(ThreadProcess, "join", slow_join),
+    ):
+        results = [r async for r in runner.run(item_urls=urls)]
+    ticker.cancel()
+
+    assert len(results) == 2
+    assert len(ticks_during_join) == 2
+    assert all(n > 0 for n in ticks_during_join)
+
+
+@pytest.mark.asyncio
+async def test_runner_without_tasks():
+    runner = make_runner(workers=2)
+
+    assert [r async for r in runner.run()] == []
+    assert runner.stats() == RunnerStats()
+
+
+def test_runner_stats_totals():
+    stats = RunnerStats(
+        workers=[
+            WorkerStats(worker=0, pid=1, completed=3, failed=1, requests=5, elapsed=1.0),
+            WorkerStats(worker=1, pid=2, completed=4, failed=0, requests=4, elapsed=1.0),
+        ],
+        elapsed=2.0,
+    )
+
+    assert (stats.completed, stats.failed, stats.requests) == (7, 1, 9)
+    assert stats.tasks_per_second == 4.0
@@ -1,10 +1,23 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from curl_cffi.requests import Cookies
 
+from vinted.breaker import CircuitBreakerConfig
+from vinted.cache import SqliteCache
 from vinted.constants import HTTP_STATUS_UNAUTHORIZED
-from vinted.exceptions import VintedAPIError, VintedNetworkError
-from vinted.session import HttpSession
+from vinted.exceptions import (
+    VintedAPIError,
+    VintedCircuitOpenError,
+    VintedNetworkError,
+    VintedNotFoundError,
+    VintedRateLimitError,
+)
+from vinted.models.config import ConcurrencyConfig, RateLimitConfig
+from vinted.session import CachedResponse, HttpSession
+from vinted.storage import FileLock, JsonStorage
 
 
 @pytest.fixture
@@ -21,7 +34,7 @@ async def test_session_init():
     session = HttpSession()
     assert session.proxy is None
     assert session.storage is None
-    assert session.base_url is None
+    assert session._contexts == {}
 
 
 @pytest.mark.asyncio
@@ -31,34 +44,55 @@ async def test_session_init_with_proxy():
     assert session.session.proxies == {"http": "http://proxy:8080", "https": "http://proxy:8080"}
 
 
-def test_configure_from_url():
+def test_get_context():
     session = HttpSession()
-    session.configure_from_url("https://www.vinted.fr/catalog")
+    context = session.get_context("https://www.vinted.fr/catalog")
 
-    assert session.base_url == "https://www.vinted.fr"
-    assert session.locale == "fr"
-    assert "Accept-Language" in session.session.headers
+    assert context.base_url == "https://www.vinted.fr"
+    assert context.locale == "fr"
+    assert context.headers["Accept-Language"].startswith("fr-FR")
+    assert context.headers["Referer"] == "https://www.vinted.fr"
+    assert "Accept-Language" not in session.session.headers
 
 
-@pytest.mark.asyncio
-async def test_refresh_cookies_no_base_url():
+def test_get_context_is_cached_per_host():
+    session = HttpSession()
+
+    fr = session.get_context("https://www.vinted.fr/catalog")
+    de = session.get_context("https://www.vinted.de/items/1")
+
+    assert session.get_context("https://www.vinted.fr/api/v2/catalog/items") is fr
+    assert de is not fr
+    assert de.headers["Accept-Language"].startswith("de-DE")
+    assert fr.headers["Accept-Language"].startswith("fr-FR")
+
+
+def test_get_context_co_uk_locale():
     session = HttpSession()
+    context = session.get_context("https://www.vinted.co.uk/catalog")
 
-    with pytest.raises(VintedAPIError, match="base_url not configured"):
-        await session.refresh_cookies()
+    assert context.locale == "co.uk"
+    assert context.headers["Accept-Language"].startswith("en-GB")
+
+
+def test_get_context_invalid_url():
+    session = HttpSession()
+
+    with pytest.raises(VintedAPIError, match="Cannot derive a Vinted host"):
+        session.get_context("not-a-url")
 
 
 @pytest.mark.asyncio
 async def test_refresh_cookies_success(mock_storage):
     session = HttpSession(storage=mock_storage)
-    session.base_url = "https://www.vinted.com"
+    context = session.get_context("https://www.vinted.com")
 
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.raise_for_status = MagicMock()
 
     with patch.object(session.session, "head", new=AsyncMock(return_value=mock_response)):
-        await session.refresh_cookies()
+        await session.refresh_cookies(context)
 
     mock_storage.save.assert_called_once()
 
@@ -66,20 +100,18 @@ async def test_refresh_cookies_success(mock_storage):
 @pytest.mark.asyncio
 async def test_refresh_cookies_network_error(mock_storage):
     session = HttpSession(storage=mock_storage)
-    session.base_url = "https://www.vinted.com"
+    context = session.get_context("https://www.vinted.com")
 
     with patch.object(
         session.session, "head", new=AsyncMock(side_effect=Exception("Network error"))
     ):
         with pytest.raises(VintedNetworkError):
-            await session.refresh_cookies()
+            await session.refresh_cookies(context)
 
 
 @pytest.mark.asyncio
 async def test_request_with_401_retry(mock_storage):
     session = HttpSession(storage=mock_storage)
-    session.base_url = "https://www.vinted.com"
-    session.locale = "com"
 
     mock_response_401 = MagicMock()
     mock_response_401.status_code = HTTP_STATUS_UNAUTHORIZED
@@ -96,7 +128,7 @@ async def test_request_with_401_retry(mock_storage):
         session.session, "get", new=AsyncMock(side_effect=[mock_response_401, mock_response_200])
     ):
         with patch.object(session.session, "head", new=AsyncMock(return_value=mock_head_response)):
-            response = await session.request("https://api.vinted.com/test")
+            response = await session.request("https://www.vinted.com/api/v2/test")
 
             assert response.status_code == 200
 
@@ -104,35 +136,641 @@ async def test_request_with_401_retry(mock_storage):
 @pytest.mark.asyncio
 async def test_request_network_error():
     session = HttpSession()
-    session.base_url = "https://www.vinted.com"
-    session.locale = "com"
 
     with patch.object(
         session.session, "get", new=AsyncMock(side_effect=Exception("Network error"))
     ):
         with pytest.raises(VintedNetworkError):
-            await session.request("https://api.vinted.com/test")
+            await session.request("https://www.vinted.com/api/v2/test")
 
 
 @pytest.mark.asyncio
 async def test_load_cookies_no_storage():
     session = HttpSession()
-    result = session._load_cookies()
+    result = await session._load_cookies()
     assert result is False
 
 
 @pytest.mark.asyncio
 async def test_load_cookies_with_storage(mock_storage):
     session = HttpSession(storage=mock_storage)
-    result = session._load_cookies()
+    result = await session._load_cookies()
 
     assert result is True
     mock_storage.load.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_clear_cookies(mock_storage):
-    session = HttpSession(storage=mock_storage)
-    session._clear_cookies()
+async def test_clear_cookies(mock_storage, make_http_session):
+    session = make_http_session(storage=mock_storage)
+    session.session.cookies.set("access_token_web", "abc", domain=".vinted.fr")
+
+    await session.clear_cookies()
 
     mock_storage.clear.assert_called_once()
+    assert list(session.session.cookies.jar) == []
+    assert session._cookies_ready is False
+
+
+@pytest.mark.asyncio
+async def test_clear_cookies_uses_async_storage(temp_cookies_dir):
+    storage = JsonStorage(temp_cookies_dir / "cookies.json")
+    session = HttpSession(storage=storage, save_delay=60)
+    session.session.cookies.set("access_token_web", "abc", domain=".vinted.fr")
+    await session._commit_cookies(session.get_context("https://www.vinted.fr"))
+    await session.flush_cookies()
+
+    with patch.object(storage, "aclear", wraps=storage.aclear) as aclear:
+        await session.clear_cookies()
+
+    aclear.assert_awaited_once()
+    assert not storage.exists()
+    assert session.storage_stats().blocking_calls == 0
+    await session.close()
+    assert not storage.exists()
+
+
+@pytest.mark.asyncio
+async def test_load_cookies_cached_until_revision_changes(mock_storage):
+    mock_storage.revision = MagicMock(return_value=(1, 10))
+    session = HttpSession(storage=mock_storage)
+
+    assert await session._load_cookies() is True
+    assert await session._load_cookies() is True
+    mock_storage.load.assert_called_once()
+
+    mock_storage.revision.return_value = (2, 12)
+    session._revision_checked_at = float("-inf")
+    assert await session._load_cookies() is True
+    assert mock_storage.load.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_cookies_throttles_revision_checks(mock_storage):
+    mock_storage.revision = MagicMock(return_value=(1, 10))
+    session = HttpSession(storage=mock_storage)
+
+    for _ in range(5):
+        assert await session._load_cookies() is True
+    assert mock_storage.revision.call_count == 1
+
+    assert await session._load_cookies(force=True) is True
+    assert mock_storage.revision.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_cookies_marks_jar_ready_without_storage():
+    session = HttpSession()
+    context = session.get_context("https://www.vinted.com")
+
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock()
+
+    with patch.object(session.session, "head", new=AsyncMock(return_value=mock_response)):
+        await session.refresh_cookies(context)
+
+    assert await session._load_cookies() is True
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_single_refresh():
+    session = HttpSession()
+
+    mock_head_response = MagicMock()
+    mock_head_response.raise_for_status = MagicMock()
+
+    async def slow_head(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return mock_head_response
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+
+    head = AsyncMock(side_effect=slow_head)
+    with patch.object(session.session, "head", new=head):
+        with patch.object(session.session, "get", new=AsyncMock(return_value=mock_response)):
+            context = session.get_context("https://www.vinted.com/test")
+            with patch.object(context.auth, "is_token_expired", return_value=True):
+                await asyncio.gather(
+                    *(session.request("https://www.vinted.com/test") for _ in range(20))
+                )
+
+    assert head.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_failure_reaches_all_waiters():
+    session = HttpSession()
+
+    async def failing_head(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        raise Exception("boom")
+
+    head = AsyncMock(side_effect=failing_head)
+    with patch.object(session.session, "head", new=head):
+        results = await asyncio.gather(
+            *(session.request("https://www.vinted.com/api/v2/test") for _ in range(5)),
+            return_exceptions=True,
+        )
+
+    assert head.await_count == 1
+    assert all(isinstance(r, VintedNetworkError) for r in results)
+
+
+def test_clear_cookies_for_context_keeps_other_hosts(mock_storage):
+    session = HttpSession(storage=mock_storage)
+    fr = session.get_context("https://www.vinted.fr")
+    session.session.cookies.set("access_token_web", "fr-token", domain=".vinted.fr")
+    session.session.cookies.set("access_token_web", "de-token", domain=".vinted.de")
+
+    session._clear_cookies(fr)
+
+    remaining = {cookie.domain for cookie in session.session.cookies.jar}
+    assert remaining == {".vinted.de"}
+    mock_storage.clear.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_uses_context_headers():
+    session = HttpSession()
+    fr = session.get_context("https://www.vinted.fr")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    get = AsyncMock(return_value=mock_response)
+
+    with patch.object(session.session, "get", new=get):
+        with patch.object(fr.auth, "is_token_expired", return_value=False):
+            session._cookies_ready = True
+            await session.request("https://www.vinted.fr/api/v2/catalog/items")
+
+    assert get.call_args.kwargs["headers"] is fr.headers
+
+
+@pytest.mark.asyncio
+async def test_request_429_without_rate_limit_raises(make_response, make_http_session):
+    session = make_http_session()
+    context = session.get_context("https://www.vinted.com")
+
+    with patch.object(session.session, "get", new=AsyncMock(return_value=make_response(429))):
+        with patch.object(context.auth, "is_token_expired", return_value=False):
+            with pytest.raises(VintedRateLimitError) as exc_info:
+                await session.request("https://www.vinted.com/api/v2/test")
+
+    assert exc_info.value.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_request_429_honours_retry_after_then_succeeds(make_response, make_http_session):
+    session = make_http_session(rate_limit=RateLimitConfig(rate=100.0, burst=10, max_wait=1.0))
+    context = session.get_context("https://www.vinted.com")
+
+    get = AsyncMock(side_effect=[make_response(429, {"Retry-After": "0.01"}), make_response(200)])
+    with patch.object(session.session, "get", new=get):
+        with patch.object(context.auth, "is_token_expired", return_value=False):
+            response = await session.request("https://www.vinted.com/api/v2/test")
+
+    assert response.status_code == 200
+    assert get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_429_exceeding_wait_budget_raises(make_response, make_http_session):
+    session = make_http_session(rate_limit=RateLimitConfig(rate=100.0, burst=10, max_wait=5.0))
+    context = session.get_context("https://www.vinted.com")
+
+    get = AsyncMock(return_value=make_response(429, {"Retry-After": "120"}))
+    with patch.object(session.session, "get", new=get):
+        with patch.object(context.auth, "is_token_expired", return_value=False):
+            with pytest.raises(VintedRateLimitError, match="wait budget"):
+                await session.request("https://www.vinted.com/api/v2/test")
+
+    assert get.await_count == 1
+    assert session._limiter.bucket(context.netloc).paused_for > 100
+
+
+@pytest.fixture
+def make_token_cookie(make_token):
+    def factory(exp, domain=".vinted.com"):
+        cookies = Cookies()
+        cookies.set("access_token_web", make_token(exp), domain=domain)
+        return next(iter(cookies.jar))
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_renew_cookies_keeps_old_token_until_swap(make_token_cookie):
+    session = HttpSession()
+    context = session.get_context("https://www.vinted.com")
+    old_exp, new_exp = time.time() + 10, time.time() + 3600
+    session.session.cookies.jar.set_cookie(make_token_cookie(old_exp))
+    seen_during_fetch = []
+
+    async def fetch(ctx):
+        seen_during_fetch.append(ctx.auth.token_expiry())
+        return [make_token_cookie(new_exp)]
+
+    with patch.object(session, "_fetch_cookies", new=fetch):
+        await session.renew_cookies(context)
+
+    assert seen_during_fetch == [pytest.approx(old_exp)]
+    assert context.auth.token_expiry() == pytest.approx(new_exp)
+    assert context.generation == 1
+    assert len(list(session.session.cookies.jar)) == 1
+
+
+@pytest.mark.asyncio
+async def test_background_renewal_runs_before_expiry(make_token_cookie, make_http_session):
+    session = make_http_session(renew_margin=3599.9)
+    context = session.get_context("https://www.vinted.com")
+    session.session.cookies.jar.set_cookie(make_token_cookie(time.time() + 3600))
+
+    fetch = AsyncMock(return_value=[make_token_cookie(time.time() + 7200)])
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+
+    with patch.object(session, "_fetch_cookies", new=fetch):
+        with patch.object(session.session, "get", new=AsyncMock(return_value=mock_response)):
+            await session.request("https://www.vinted.com/api/v2/test")
+            assert context.renew_task is not None
+            await asyncio.sleep(0.3)
+
+    fetch.assert_awaited_once()
+    assert context.auth.token_expiry() > time.time() + 7000
+
+    await session.close()
+    assert context.renew_task is None
+
+
+@pytest.mark.asyncio
+async def test_background_renewal_is_spaced_when_margin_exceeds_lifetime(
+    make_token_cookie, make_http_session
+):
+    session = make_http_session(renew_margin=7200)
+    session.session.cookies.jar.set_cookie(make_token_cookie(time.time() + 3600))
+    renewals = []
+
+    async def fetch(*args, **kwargs):
+        renewals.append(time.monotonic())
+        return [make_token_cookie(time.time() + 3600 + len(renewals))]
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+
+    with (
+        patch("vinted.session.MIN_RENEW_INTERVAL", 0.1),
+        patch.object(session, "_fetch_cookies", new=fetch),
+        patch.object(session.session, "get", new=AsyncMock(return_value=mock_response)),
+    ):
+        await session.request("https://www.vinted.com/api/v2/test")
+        await asyncio.sleep(0.35)
+
+    await session.close()
+    assert 2 <= len(renewals) <= 5
+    assert all(b - a >= 0.09 for a, b in zip(renewals, renewals[1:]))
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_are_coalesced(make_response, make_http_session):
+    session = make_http_session()
+
+    async def slow_get(**kwargs):
+        await asyncio.sleep(0.01)
+        return make_response(200)
+
+    url = "https://www.vinted.fr/api/v2/catalog/items"
+    with patch.object(session.session, "get", new=AsyncMock(side_effect=slow_get)) as get:
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            responses = await asyncio.gather(
+                session.request(url, params={"page": 1, "time": 1}),
+                session.request(url, params={"page": 1, "time": 2}),
+                session.request(url, params={"page": 2, "time": 3}),
+            )
+
+    assert get.await_count == 2
+    assert responses[0] is responses[1]
+    assert responses[2] is not responses[0]
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_after_failures(make_response, make_http_session):
+    config = CircuitBreakerConfig(window=2, min_calls=2, open_seconds=60.0)
+    session = make_http_session(circuit_breaker=config, coalesce=False)
+
+    url = "https://www.vinted.fr/api/v2/catalog/items"
+    get = AsyncMock(return_value=make_response(503))
+    with patch.object(session.session, "get", new=get):
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            for _ in range(2):
+                with pytest.raises(VintedAPIError):
+                    await session.request(url)
+
+            with pytest.raises(VintedCircuitOpenError) as exc_info:
+                await session.request(url)
+
+    assert get.await_count == 2
+    assert exc_info.value.netloc == "www.vinted.fr"
+    assert session.get_breaker("www.vinted.fr").state == "open"
+    assert session.get_breaker("www.vinted.de").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_ignores_non_failure_statuses(make_response, make_http_session):
+    session = make_http_session(circuit_breaker=CircuitBreakerConfig(window=2, min_calls=2))
+
+    with patch.object(session.session, "get", new=AsyncMock(return_value=make_response(404))):
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            for _ in range(3):
+                with pytest.raises(VintedAPIError):
+                    await session.request("https://www.vinted.fr/api/v2/items/1/details")
+
+    assert session.get_breaker("www.vinted.fr").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_shrinks_on_rate_limit(make_response, make_http_session):
+    config = ConcurrencyConfig(initial_limit=8)
+    session = make_http_session(concurrency=config, rate_limit=RateLimitConfig(max_wait=0))
+
+    url = "https://www.vinted.fr/api/v2/catalog/items"
+    with patch.object(session.session, "get", new=AsyncMock(return_value=make_response(429))):
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            with pytest.raises(VintedRateLimitError):
+                await session.request(url)
+
+    [stats] = session.concurrency_stats()
+    assert stats.netloc == "www.vinted.fr"
+    assert stats.limit == 4
+    assert stats.in_flight == 0
+    assert stats.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_response_cache_serves_repeat_requests(tmp_path, make_response, make_http_session):
+    cache = SqliteCache(tmp_path / "responses.sqlite3")
+    session = make_http_session(response_cache=cache)
+
+    response = make_response(200)
+    response.content = b'{"items": []}'
+    url = "https://www.vinted.fr/api/v2/catalog/items"
+
+    with patch.object(session.session, "get", new=AsyncMock(return_value=response)) as get:
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            await session.request(url, params={"page": 1, "time": 1})
+            cached = await session.request(url, params={"page": 1, "time": 2})
+
+    assert get.await_count == 1
+    assert isinstance(cached, CachedResponse)
+    assert cached.status_code == 200
+    assert cached.json() == {"items": []}
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_bypassed_without_use_cache(
+    tmp_path, make_response, make_http_session
+):
+    cache = SqliteCache(tmp_path / "responses.sqlite3")
+    session = make_http_session(response_cache=cache, coalesce=False)
+
+    response = make_response(200)
+    response.content = b'{"items": []}'
+    url = "https://www.vinted.fr/api/v2/catalog/items"
+
+    with patch.object(session.session, "get", new=AsyncMock(return_value=response)) as get:
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            await session.request(url, params={"page": 1})
+            fresh = await session.request(url, params={"page": 1}, use_cache=False)
+
+    assert get.await_count == 2
+    assert fresh is response
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_ttl_by_path_prefix(tmp_path, make_response, make_http_session):
+    cache = SqliteCache(tmp_path / "responses.sqlite3")
+    session = make_http_session(
+        response_cache=cache,
+        response_cache_ttl=3600,
+        response_cache_ttls={"/api/v2/catalog/items": 0},
+        coalesce=False,
+    )
+
+    response = make_response(200)
+    response.content = b"{}"
+    catalog = "https://www.vinted.fr/api/v2/catalog/items"
+    details = "https://www.vinted.fr/api/v2/items/1/details"
+
+    with patch.object(session.session, "get", new=AsyncMock(return_value=response)) as get:
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            for _ in range(2):
+                await session.request(catalog)
+                await session.request(details)
+
+    assert get.await_count == 3
+    assert session.response_ttl(details) == 3600
+    assert cache.stats().entries == 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_offline_mode_never_touches_network(tmp_path):
+    cache = SqliteCache(tmp_path / "responses.sqlite3", ignore_expiry=True)
+    await cache.set("https://www.vinted.fr/api/v2/items/1/details", b'{"item": {}}', ttl=1)
+    session = HttpSession(response_cache=cache, offline=True)
+
+    with patch.object(session.session, "get", new=AsyncMock()) as get:
+        response = await session.request("https://www.vinted.fr/api/v2/items/1/details")
+        with pytest.raises(VintedNetworkError):
+            await session.request("https://www.vinted.fr/api/v2/items/2/details")
+
+    assert response.json() == {"item": {}}
+    get.assert_not_awaited()
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_request_404_raises_not_found(make_response, make_http_session):
+    session = make_http_session()
+
+    with patch.object(session.session, "get", new=AsyncMock(return_value=make_response(404))):
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            with pytest.raises(VintedNotFoundError) as exc_info:
+                await session.request("https://www.vinted.fr/api/v2/items/1/details")
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_warm_up_refreshes_missing_cookies():
+    session = HttpSession()
+
+    with patch.object(session, "refresh_cookies", new=AsyncMock()) as refresh:
+        await session.warm_up("https://www.vinted.de")
+
+    refresh.assert_awaited_once_with(session.get_context("https://www.vinted.de"))
+
+
+@pytest.mark.asyncio
+async def test_warm_up_with_valid_cookies_only_opens_connection(make_response, make_http_session):
+    session = make_http_session()
+    head = AsyncMock(return_value=make_response(200))
+
+    with patch.object(session.session, "head", new=head):
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            with patch.object(session, "refresh_cookies", new=AsyncMock()) as refresh:
+                await session.warm_up("https://www.vinted.de")
+
+    refresh.assert_not_awaited()
+    assert head.await_args.args == ("https://www.vinted.de",)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_network_error(make_http_session):
+    session = make_http_session()
+
+    with patch.object(session.session, "head", new=AsyncMock(side_effect=Exception("reset"))):
+        with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+            with pytest.raises(VintedNetworkError):
+                await session.warm_up("https://www.vinted.de")
+
+
+@pytest.mark.asyncio
+async def test_warm_up_offline_is_noop():
+    session = HttpSession(offline=True)
+
+    with patch.object(session, "refresh_cookies", new=AsyncMock()) as refresh:
+        await session.warm_up("https://www.vinted.de")
+
+    refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_shared_refresh_adopts_cookies_saved_by_another_process(
+    mock_storage, temp_cookies_dir, make_http_session
+):
+    mock_storage.revision = MagicMock(return_value=("saved", 2))
+    session = make_http_session(
+        storage=mock_storage, refresh_lock=FileLock(temp_cookies_dir / "cookies.lock")
+    )
+    session._cookies_revision = ("saved", 1)
+    context = session.get_context("https://www.vinted.fr")
+
+    with patch("vinted.auth.AuthManager.is_token_expired", return_value=False):
+        with patch.object(session, "refresh_cookies", new=AsyncMock()) as refresh:
+            await session._refresh_once(context, context.generation)
+
+    refresh.assert_not_awaited()
+    mock_storage.load.assert_called_once()
+    assert not session.refresh_lock.locked
+
+
+@pytest.mark.asyncio
+async def test_shared_refresh_refreshes_when_storage_unchanged(
+    mock_storage, temp_cookies_dir, make_http_session
+):
+    mock_storage.revision = MagicMock(return_value=("saved", 1))
+    session = make_http_session(
+        storage=mock_storage, refresh_lock=FileLock(temp_cookies_dir / "cookies.lock")
+    )
+    session._cookies_revision = ("saved", 1)
+    context = session.get_context("https://www.vinted.fr")
+
+    with patch.object(session, "refresh_cookies", new=AsyncMock()) as refresh:
+        await session._refresh_once(context, context.generation)
+
+    refresh.assert_awaited_once_with(context)
+    mock_storage.load.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_session_prefers_async_storage(temp_cookies_dir):
+    storage = JsonStorage(temp_cookies_dir / "cookies.json")
+    session = HttpSession(storage=storage)
+    context = session.get_context("https://www.vinted.fr")
+    session.session.cookies.set("access_token_web", "abc", domain=".vinted.fr")
+
+    with patch.object(storage, "save", wraps=storage.save) as save:
+        await session._commit_cookies(context)
+        fresh = HttpSession(storage=storage)
+        assert await fresh._load_cookies() is True
+
+    save.assert_called_once()
+    assert fresh.session.cookies.get("access_token_web", domain=".vinted.fr") == "abc"
+    stats = session.storage_stats()
+    # save and revision read both offloaded
+    assert (stats.calls, stats.blocking_calls) == (2, 0)
+    assert stats.offloaded_time > 0
+
+
+@pytest.mark.asyncio
+async def test_session_times_blocking_storage(mock_storage):
+    session = HttpSession(storage=mock_storage)
+
+    await session._load_cookies()
+
+    stats = session.storage_stats()
+    assert stats.calls == stats.blocking_calls == 2
+    assert HttpSession().storage_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_write_behind_coalesces_saves(mock_storage):
+    session = HttpSession(storage=mock_storage, save_delay=0.02)
+    contexts = [session.get_context(f"https://www.vinted.{tld}") for tld in ("fr", "de", "it")]
+
+    for context in contexts:
+        await session._commit_cookies(context)
+
+    mock_storage.save.assert_not_called()
+    assert all(context.generation == 1 for context in contexts)
+
+    await asyncio.sleep(0.05)
+    mock_storage.save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_cookies(mock_storage):
+    session = HttpSession(storage=mock_storage, save_delay=60)
+    await session._commit_cookies(session.get_context("https://www.vinted.fr"))
+
+    await session.close()
+
+    mock_storage.save.assert_called_once()
+    assert session._flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_changes_pending(mock_storage):
+    mock_storage.save.side_effect = [OSError("disk full"), None]
+    session = HttpSession(storage=mock_storage, save_delay=60)
+    await session._commit_cookies(session.get_context("https://www.vinted.fr"))
+
+    await session.flush_cookies()
+    await session.flush_cookies()
+    await session.flush_cookies()
+
+    assert mock_storage.save.call_count == 2
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_refresh_flushes_before_releasing_lock(mock_storage, temp_cookies_dir):
+    mock_storage.revision = MagicMock(return_value=None)
+    lock = FileLock(temp_cookies_dir / "cookies.lock")
+    session = HttpSession(storage=mock_storage, refresh_lock=lock, save_delay=60)
+    context = session.get_context("https://www.vinted.fr")
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock()
+
+    def save(jar):
+        assert lock.locked
+
+    mock_storage.save.side_effect = save
+    with patch.object(session.session, "head", new=AsyncMock(return_value=mock_response)):
+        await session._refresh_once(context, context.generation)
+
+    mock_storage.save.assert_called_once()
+    await session.close()
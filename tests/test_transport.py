@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+import pytest
+from curl_cffi import CurlMOpt, CurlOpt, ffi
+
+from vinted.models.config import TransportConfig
+from vinted.session import HttpSession
+from vinted.transport import TransportSession, multi_options, session_options
+
+
+def test_session_options_defaults():
+    options = session_options(TransportConfig())
+
+    assert options["max_clients"] == 10
+    assert options["timeout"] == (10.0, 20.0)
+    assert options["http_version"] is None
+    assert options["curl_options"][CurlOpt.DNS_CACHE_TIMEOUT] == 60
+    assert options["curl_options"][CurlOpt.TCP_KEEPALIVE] == 1
+
+
+def test_session_options_keep_alive_timings():
+    options = session_options(TransportConfig(keep_alive_idle=30, keep_alive_interval=10))
+
+    assert options["curl_options"][CurlOpt.TCP_KEEPIDLE] == 30
+    assert options["curl_options"][CurlOpt.TCP_KEEPINTVL] == 10
+
+
+def test_session_options_without_keep_alive():
+    options = session_options(TransportConfig(keep_alive=False, http_version="v2"))
+
+    assert options["http_version"] == "v2"
+    assert CurlOpt.TCP_KEEPALIVE not in options["curl_options"]
+
+
+def test_multi_options_only_set_when_configured():
+    assert multi_options(TransportConfig()) == {}
+    assert multi_options(TransportConfig(pool_size=32, max_host_connections=4)) == {
+        CurlMOpt.MAXCONNECTS: 32,
+        CurlMOpt.MAX_HOST_CONNECTIONS: 4,
+    }
+
+
+@pytest.mark.asyncio
+async def test_transport_session_applies_multi_options_lazily():
+    session = TransportSession(TransportConfig(pool_size=8, max_host_connections=2))
+    assert session._acurl is None
+
+    with patch("vinted.transport.AsyncCurl.setopt") as setopt:
+        acurl = session.acurl
+
+    assert session.acurl is acurl
+    limits = (CurlMOpt.MAXCONNECTS, CurlMOpt.MAX_HOST_CONNECTIONS)
+    applied = {
+        option: int(ffi.cast("long", value))
+        for (option, value), _ in setopt.call_args_list
+        if option in limits
+    }
+    assert applied == {CurlMOpt.MAXCONNECTS: 8, CurlMOpt.MAX_HOST_CONNECTIONS: 2}
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_http_session_uses_transport():
+    transport = TransportConfig(max_clients=4, http_version="v1")
+    session = HttpSession(transport=transport)
+
+    assert isinstance(session.session, TransportSession)
+    assert session.session.max_clients == 4
+    assert session.session.http_version == "v1"
+    assert session._create_async_session().transport is transport
+    await session.close()
@@ -1,7 +1,15 @@
 import pytest
 
 from vinted.constants import VALID_LOCALES
-from vinted.utils import format_proxy_for_log, get_accept_language, validate_locale
+from vinted.utils import (
+    cookie_domain_matches,
+    extract_locale,
+    format_proxy_for_log,
+    get_accept_language,
+    get_base_url,
+    parse_retry_after,
+    validate_locale,
+)
 
 
 def test_format_proxy_with_auth():
@@ -42,3 +50,43 @@ def test_validate_locale_valid():
 def test_validate_locale_invalid():
     with pytest.raises(ValueError, match="Invalid locale"):
         validate_locale("invalid")
+
+
+@pytest.mark.parametrize(
+    "netloc,expected",
+    [
+        ("www.vinted.fr", "fr"),
+        ("www.vinted.co.uk", "co.uk"),
+        ("vinted.com", "com"),
+        ("localhost:8080", None),
+    ],
+)
+def test_extract_locale(netloc, expected):
+    assert extract_locale(netloc) == expected
+
+
+def test_get_base_url():
+    assert get_base_url("https://www.vinted.de/catalog?x=1") == "https://www.vinted.de"
+
+
+@pytest.mark.parametrize(
+    "host,cookie_domain,expected",
+    [
+        ("www.vinted.fr", ".vinted.fr", True),
+        ("www.vinted.fr", "www.vinted.fr", True),
+        ("www.vinted.fr", ".vinted.de", False),
+        ("www.notvinted.fr", "vinted.fr", False),
+    ],
+)
+def test_cookie_domain_matches(host, cookie_domain, expected):
+    assert cookie_domain_matches(host, cookie_domain) is expected
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
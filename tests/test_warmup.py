@@ -0,0 +1,42 @@
+import pytest
+
+from vinted.exceptions import VintedNetworkError
+from vinted.warmup import warm_up_sessions
+
+
+@pytest.mark.asyncio
+async def test_warm_up_sessions_reports_every_target(make_proxy_session):
+    a, b = make_proxy_session("a:1"), make_proxy_session("b:2")
+    urls = ["https://www.vinted.fr", "https://www.vinted.co.uk"]
+
+    results = await warm_up_sessions([a, b], urls)
+
+    assert [(r.proxy, r.locale) for r in results] == [
+        ("a:1", "fr"),
+        ("a:1", "co.uk"),
+        ("b:2", "fr"),
+        ("b:2", "co.uk"),
+    ]
+    assert all(r.ok and r.error is None and r.elapsed >= 0.0 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_sessions_reports_failures(make_proxy_session):
+    error = VintedNetworkError("Network error during warm-up", Exception("reset"))
+    ok, broken = make_proxy_session("a:1"), make_proxy_session("b:2", error=error)
+
+    results = await warm_up_sessions([ok, broken], ["https://www.vinted.fr"])
+
+    assert [r.ok for r in results] == [True, False]
+    assert results[1].error is error
+
+
+@pytest.mark.asyncio
+async def test_warm_up_sessions_bounds_parallelism(make_proxy_session):
+    session = make_proxy_session(None, delay=0.01)
+    urls = [f"https://www.vinted.{locale}" for locale in ("fr", "de", "it", "es", "pl")]
+
+    await warm_up_sessions([session], urls, concurrency=2)
+
+    assert session.warm_up.call_count == 5
+    assert session.peak == 2
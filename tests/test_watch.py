@@ -0,0 +1,62 @@
+import pytest
+
+from vinted.models.config import WatchConfig
+from vinted.watch import PollInterval, SeenWindow
+
+
+def test_seen_window_reports_new_ids_once():
+    window = SeenWindow(capacity=3)
+
+    assert [window.add(i) for i in (1, 2, 1, 3)] == [True, True, False, True]
+    assert len(window) == 3
+    assert 1 in window
+
+
+def test_seen_window_evicts_least_recently_seen():
+    window = SeenWindow(capacity=2)
+    window.add(1)
+    window.add(2)
+    window.add(1)
+
+    window.add(3)
+
+    assert 1 in window
+    assert 2 not in window
+    assert len(window) == 2
+
+
+def test_seen_window_invalid_capacity():
+    with pytest.raises(ValueError):
+        SeenWindow(capacity=0)
+
+
+def test_poll_interval_follows_arrival_rate():
+    config = WatchConfig(min_interval=1.0, max_interval=60.0, smoothing=1.0, backoff=100.0)
+    interval = PollInterval(config)
+
+    # Five new items in ten seconds: about one item every two seconds.
+    assert interval.update(5, 10.0) == pytest.approx(2.0)
+    assert interval.update(100, 10.0) == 1.0
+
+
+def test_poll_interval_grows_gradually_when_quiet():
+    config = WatchConfig(min_interval=2.0, max_interval=10.0, backoff=2.0)
+    interval = PollInterval(config)
+
+    delays = [interval.update(0, 2.0) for _ in range(4)]
+
+    assert delays == [4.0, 8.0, 10.0, 10.0]
+
+
+def test_poll_interval_saturated_poll_polls_again_soon():
+    config = WatchConfig(min_interval=2.0, max_interval=60.0, backoff=2.0)
+    interval = PollInterval(config)
+    interval.update(0, 2.0)
+
+    assert interval.update(96, 4.0, saturated=True) == 2.0
+
+
+def test_poll_interval_back_off_is_capped():
+    interval = PollInterval(WatchConfig(min_interval=2.0, max_interval=5.0, backoff=2.0))
+
+    assert [interval.back_off() for _ in range(3)] == [4.0, 5.0, 5.0]
@@ -1,15 +1,37 @@
+from vinted.batch import SearchBatch, SearchOutcome
+from vinted.breaker import BreakerStateChange, CircuitBreakerConfig
+from vinted.cache import CacheBackend, CacheStats, MemoryCache, SqliteCache
 from vinted.client import VintedClient
-from vinted.constants import SortOrder, StorageFormat
+from vinted.concurrency import ConcurrencyStats
+from vinted.constants import HttpVersion, SortOrder, StorageFormat
 from vinted.exceptions import (
     VintedAPIError,
     VintedAuthError,
+    VintedCircuitOpenError,
     VintedConfigError,
     VintedError,
     VintedNetworkError,
+    VintedNotFoundError,
     VintedRateLimitError,
     VintedValidationError,
 )
+from vinted.models.config import (
+    CacheConfig,
+    ConcurrencyConfig,
+    DiskCacheConfig,
+    HedgingConfig,
+    NegativeCacheConfig,
+    ProxyPoolConfig,
+    RateLimitConfig,
+    TransportConfig,
+    WatchConfig,
+)
 from vinted.models.item import CatalogItem, DetailedItem
+from vinted.pool import ProxyStats
+from vinted.retry import RetryAttempt, RetryPolicy
+from vinted.runner import RunnerResult, RunnerStats, ShardedRunner, WorkerStats
+from vinted.storage import AsyncCookieStorage, StorageStats
+from vinted.warmup import WarmUpResult
 
 __version__ = "1.0.0"
 
@@ -17,13 +39,44 @@ __all__ = [
     "VintedClient",
     "CatalogItem",
     "DetailedItem",
+    "BreakerStateChange",
+    "CacheBackend",
+    "CacheConfig",
+    "CacheStats",
+    "CircuitBreakerConfig",
+    "ConcurrencyConfig",
+    "DiskCacheConfig",
+    "ConcurrencyStats",
+    "HedgingConfig",
+    "NegativeCacheConfig",
+    "MemoryCache",
+    "SqliteCache",
+    "AsyncCookieStorage",
+    "StorageStats",
+    "ProxyPoolConfig",
+    "ProxyStats",
+    "RateLimitConfig",
+    "RetryAttempt",
+    "RetryPolicy",
+    "RunnerResult",
+    "SearchBatch",
+    "SearchOutcome",
+    "RunnerStats",
+    "ShardedRunner",
+    "WorkerStats",
+    "TransportConfig",
+    "WarmUpResult",
+    "WatchConfig",
     "VintedError",
     "VintedAPIError",
     "VintedAuthError",
     "VintedRateLimitError",
+    "VintedNotFoundError",
+    "VintedCircuitOpenError",
     "VintedNetworkError",
     "VintedConfigError",
     "VintedValidationError",
     "SortOrder",
     "StorageFormat",
+    "HttpVersion",
 ]
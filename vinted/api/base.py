@@ -1,32 +1,86 @@
 """Low-level API base utilities.
 
 This module provides a small base class that stores a shared
-`HttpSession` instance used by higher-level API wrappers.
+`HttpSession` (or `SessionPool`) used by higher-level API wrappers,
+and an optional response cache consulted before each request.
 """
 
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from curl_cffi.requests import Response
+
+from ..cache import CacheBackend, cache_key
+from ..pool import SessionPool
 from ..session import HttpSession
+from ..utils import get_base_url
+
+logger = logging.getLogger(__name__)
 
 
 class BaseAPI:
     """Base class for API wrappers.
 
     Args:
-        session: An initialized `HttpSession` used to perform HTTP requests.
+        session: An initialized `HttpSession` or `SessionPool` used to
+            perform HTTP requests.
+        cache: Optional `CacheBackend` holding raw response bodies.
+        cache_ttl: Seconds a cached response stays fresh; 0 disables caching.
     """
 
-    def __init__(self, session: HttpSession):
+    def __init__(
+        self,
+        session: HttpSession | SessionPool,
+        cache: CacheBackend | None = None,
+        cache_ttl: float = 0.0,
+    ):
         self.session = session
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+
+    async def _fetch_json(
+        self,
+        api_url: str,
+        params: dict | None,
+        fetch: Callable[[], Awaitable[Response]],
+        use_cache: bool = True,
+    ) -> Any:
+        """Return the decoded JSON body for `api_url`, using the cache if enabled.
+
+        The raw body is cached rather than parsed objects, so every hit
+        decodes a fresh copy and callers can't mutate cached data. With
+        `use_cache=False` the cache is neither read nor written. A failing
+        cache backend is logged and bypassed.
+        """
+        if not use_cache or self.cache is None or self.cache_ttl <= 0:
+            response = await fetch()
+            return response.json()
+
+        key = cache_key(api_url, params)
+        try:
+            body = await self.cache.get(key)
+        except Exception as e:
+            logger.warning("Response cache read failed: %s", e)
+            body = None
+        if body is not None:
+            logger.debug("Cache hit: %s", key)
+            return json.loads(body)
 
-    @property
-    def base_url(self) -> str:
-        """Return configured base URL for API requests.
+        response = await fetch()
+        data = response.json()
+        try:
+            await self.cache.set(key, response.content, self.cache_ttl)
+        except Exception as e:
+            logger.warning("Response cache write failed: %s", e)
+        return data
 
-        Raises:
-            ValueError: If the session `base_url` is not configured.
+    @staticmethod
+    def base_url_for(url: str) -> str:
+        """Return the base URL (scheme + host) for a public Vinted URL.
 
-        Returns:
-            The base URL (scheme + host) derived from the session.
+        The session resolves per-host headers and cookies from the API URL
+        itself, so wrappers only need the host to build endpoint URLs.
         """
-        if not self.session.base_url:
-            raise ValueError("Session base_url not configured")
-        return self.session.base_url
+        return get_base_url(url)
@@ -5,17 +5,25 @@ endpoint. It constructs request parameters from a user-provided URL
 and returns either raw JSON items or parsed `CatalogItem` instances.
 """
 
+import asyncio
 import logging
 import time
-from typing import Any, Union
+from collections.abc import AsyncIterator, Iterable
+from functools import lru_cache
+from typing import Any, Union, cast
 from urllib.parse import parse_qsl, urlparse
 
-from ..constants import SortOrder
-from ..models import CatalogItem
+from ..batch import SearchBatch, run_search_batch
+from ..constants import CATALOG_API_PATH, SortOrder
+from ..exceptions import VintedConfigError, VintedError, VintedValidationError
+from ..models import CatalogItem, WatchConfig
+from ..watch import PollInterval, SeenWindow
 from .base import BaseAPI
 
 logger = logging.getLogger(__name__)
 
+FILTER_CACHE_SIZE = 1024
+
 
 class CatalogAPI(BaseAPI):
     """Interaction with catalog listing endpoints.
@@ -46,8 +54,20 @@ class CatalogAPI(BaseAPI):
         Returns:
             List of `CatalogItem` instances or raw item dicts.
         """
-        self.session.configure_from_url(url)
-        api_url = f"{self.base_url}/api/v2/catalog/items"
+        return await self._search(url, per_page, page, timestamp, order, raw_data)
+
+    async def _search(
+        self,
+        url: str,
+        per_page: int,
+        page: int,
+        timestamp: int | None,
+        order: SortOrder | None,
+        raw_data: bool,
+        use_cache: bool = True,
+    ) -> Union[list[CatalogItem], list[dict]]:
+        """Run `search()`, bypassing every response cache when `use_cache` is False."""
+        api_url = f"{self.base_url_for(url)}{CATALOG_API_PATH}"
 
         params = self._build_params(url, per_page, page)
         params["time"] = timestamp or int(time.time())
@@ -57,8 +77,12 @@ class CatalogAPI(BaseAPI):
 
         logger.debug("Searching catalog: url=%s, params=%s", api_url, params)
 
-        response = await self.session.request(api_url, params=params)
-        data = response.json()
+        data = await self._fetch_json(
+            api_url,
+            params,
+            lambda: self.session.request(api_url, params=params, use_cache=use_cache),
+            use_cache=use_cache,
+        )
         items: list[dict[Any, Any]] = data.get("items", [])
 
         logger.debug("Found %d items", len(items))
@@ -68,38 +92,302 @@ class CatalogAPI(BaseAPI):
 
         return [CatalogItem(raw_data=item) for item in items]
 
+    async def iter_search(
+        self,
+        url: str,
+        per_page: int = 20,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+        order: SortOrder | None = None,
+        raw_data: bool = False,
+    ) -> AsyncIterator[Union[CatalogItem, dict]]:
+        """Yield catalog items page by page, prefetching the next page.
+
+        While the caller consumes page N, page N+1 is already being
+        fetched. Every page uses the same `time` snapshot so pages stay
+        consistent while new listings arrive. Iteration stops on an empty
+        or short page, or at `max_items` / `max_pages`. At most two pages
+        are held in memory at any time.
+
+        Args:
+            url: Public Vinted URL with search filters.
+            per_page: Number of items per page.
+            max_items: Optional cap on the number of items yielded.
+            max_pages: Optional cap on the number of pages fetched.
+            order: Optional order specifier from `SortOrder`.
+            raw_data: If True, yield raw dictionaries instead of `CatalogItem`.
+
+        Yields:
+            `CatalogItem` instances or raw item dicts.
+        """
+        if max_items == 0 or max_pages == 0:
+            return
+
+        timestamp = int(time.time())
+
+        def fetch(page: int) -> "asyncio.Future[Union[list[CatalogItem], list[dict]]]":
+            return asyncio.ensure_future(
+                self.search(url, per_page, page, timestamp, order, raw_data)
+            )
+
+        page = 1
+        yielded = 0
+        pending: asyncio.Future | None = fetch(page)
+        try:
+            while pending is not None:
+                items = await pending
+                pending = None
+                if not items:
+                    return
+
+                last_page = (
+                    len(items) < per_page
+                    or (max_pages is not None and page >= max_pages)
+                    or (max_items is not None and yielded + len(items) >= max_items)
+                )
+                if not last_page:
+                    page += 1
+                    pending = fetch(page)
+
+                for item in items:
+                    yield item
+                    yielded += 1
+                    if max_items is not None and yielded >= max_items:
+                        return
+        finally:
+            if pending is not None:
+                _discard(pending)
+
+    async def search_pages(
+        self,
+        url: str,
+        pages: Iterable[int],
+        per_page: int = 20,
+        concurrency: int = 4,
+        order: SortOrder | None = None,
+        raw_data: bool = False,
+    ) -> Union[list[CatalogItem], list[dict]]:
+        """Fetch several catalog pages concurrently and merge them in page order.
+
+        All pages are requested with the same `time` snapshot so page
+        boundaries stay consistent. Items that show up on more than one
+        page (listings shifting between requests) are kept only at their
+        first position.
+
+        Args:
+            url: Public Vinted URL with search filters.
+            pages: Page numbers to fetch, e.g. `range(1, 21)`.
+            per_page: Number of items per page.
+            concurrency: Maximum number of pages fetched at once.
+            order: Optional order specifier from `SortOrder`.
+            raw_data: If True, return raw dictionaries instead of `CatalogItem`.
+
+        Returns:
+            Items of every page in page order, without duplicates by id.
+
+        Raises:
+            VintedError: The first page that failed; the remaining page
+                fetches are cancelled.
+        """
+        timestamp = int(time.time())
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        page_numbers = sorted(set(pages))
+
+        async def fetch(page: int) -> Union[list[CatalogItem], list[dict]]:
+            async with semaphore:
+                return await self.search(url, per_page, page, timestamp, order, raw_data)
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in page_numbers]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave the other pages running (and holding slots) after a failure.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        seen: set[Any] = set()
+        merged: list[Any] = []
+        for items in results:
+            for item in items:
+                item_id = item.get("id") if isinstance(item, dict) else item.id
+                if item_id is not None:
+                    if item_id in seen:
+                        continue
+                    seen.add(item_id)
+                merged.append(item)
+
+        logger.debug("Fetched %d pages, %d unique items", len(page_numbers), len(merged))
+        return merged
+
+    async def search_many(
+        self,
+        urls: Iterable[str],
+        per_page: int = 20,
+        concurrency: int = 16,
+        per_domain_limit: int | None = None,
+        order: SortOrder | None = None,
+        raw_data: bool = False,
+    ) -> SearchBatch:
+        """Run the first page of many searches concurrently.
+
+        Searches are scheduled round-robin across Vinted domains, and a
+        search that raises is reported in its outcome instead of failing
+        the batch.
+
+        Args:
+            urls: Public Vinted URLs with search filters.
+            per_page: Number of items per page.
+            concurrency: Maximum number of searches in flight overall.
+            per_domain_limit: Optional maximum in flight per domain.
+            order: Optional order specifier from `SortOrder`.
+            raw_data: If True, return raw dictionaries instead of `CatalogItem`.
+
+        Returns:
+            A `SearchBatch` with one outcome per URL, in input order.
+        """
+        timestamp = int(time.time())
+
+        async def search(url: str) -> list[Any]:
+            return await self.search(url, per_page, 1, timestamp, order, raw_data)
+
+        return await run_search_batch(list(urls), search, concurrency, per_domain_limit)
+
+    async def watch(
+        self, url: str, config: WatchConfig | None = None
+    ) -> AsyncIterator[CatalogItem]:
+        """Poll a search by newest first and yield listings not seen before.
+
+        The first poll only records the current listings unless
+        `config.include_existing` is set. Seen ids are kept in a
+        `SeenWindow` of `config.capacity` ids, and the pause between
+        polls adapts to how often new listings show up. Polls bypass the
+        response caches so a cached page never hides new listings (in
+        offline mode the disk cache still answers). Failed polls are
+        logged and retried after a longer pause; configuration and
+        validation errors are raised.
+
+        Args:
+            url: Public Vinted URL with search filters; its order is
+                replaced with `newest_first`.
+            config: Watcher settings; defaults to `WatchConfig()`.
+
+        Yields:
+            New `CatalogItem`s, oldest first within each poll.
+        """
+        config = config or WatchConfig()
+        seen = SeenWindow(config.capacity)
+        interval = PollInterval(config)
+        last_poll: float | None = None
+
+        while True:
+            started = time.monotonic()
+            try:
+                fresh, saturated = await self._poll_new(url, config, seen)
+            except (VintedConfigError, VintedValidationError):
+                raise
+            except VintedError as e:
+                delay = interval.back_off()
+                logger.warning("Watch poll failed for %s: %s; retrying in %.1fs", url, e, delay)
+                await asyncio.sleep(delay)
+                continue
+
+            if last_poll is None:
+                delay = config.min_interval
+                if not config.include_existing:
+                    fresh = []
+            else:
+                delay = interval.update(len(fresh), started - last_poll, saturated)
+            last_poll = started
+
+            logger.debug("Watch found %d new items, next poll in %.1fs", len(fresh), delay)
+            for item in reversed(fresh):
+                yield item
+            await asyncio.sleep(delay)
+
+    async def _poll_new(
+        self, url: str, config: WatchConfig, seen: SeenWindow
+    ) -> tuple[list[CatalogItem], bool]:
+        """Return unseen items, newest first, and whether the page limit cut them off.
+
+        Further pages are fetched only while every item on the current
+        page is unseen. Ids are added to `seen` only once the whole poll
+        succeeded, so listings of a poll that fails half-way are yielded
+        by the next one.
+        """
+        timestamp = int(time.time())
+        unseen: dict[Any, dict] = {}
+        saturated = True
+
+        for page in range(1, max(1, config.max_pages) + 1):
+            items = cast(
+                list[dict],
+                await self._search(
+                    url, config.per_page, page, timestamp, "newest_first", True, use_cache=False
+                ),
+            )
+            new = 0
+            for item in items:
+                item_id = item.get("id")
+                if item_id not in seen and item_id not in unseen:
+                    unseen[item_id] = item
+                    new += 1
+            if len(items) < config.per_page or new < len(items):
+                saturated = False
+                break
+
+        for item_id in unseen:
+            seen.add(item_id)
+        # Only unseen listings are worth building models for.
+        return [CatalogItem(raw_data=item) for item in unseen.values()], saturated
+
     def _build_params(self, url: str, per_page: int, page: int) -> dict:
         """Build API query params from a public catalog URL.
 
-        The method extracts query parameters and path elements to create
-        a dictionary suitable for the internal API endpoint.
+        The filters parsed from `url` are cached, so saved searches polled
+        over and over only pay for the parsing once.
+        """
+        params: dict[str, Any] = dict(self._parse_filters(url))
+        order = params.pop("order", None)
+        params.update(page=page, per_page=per_page, order=order)
+        return {k: v for k, v in params.items() if v}
+
+    @staticmethod
+    @lru_cache(maxsize=FILTER_CACHE_SIZE)
+    def _parse_filters(url: str) -> tuple[tuple[str, str], ...]:
+        """Return the non-empty search filters of a public catalog URL.
+
+        The method extracts query parameters and path elements and maps
+        them to the internal API parameter names.
         """
         parsed = urlparse(url)
         query_params = parse_qsl(parsed.query)
 
-        catalog_id = self._extract_catalog_id(parsed.path)
-        catalog_ids_query = self._join_values(query_params, "catalog[]")
+        join = CatalogAPI._join_values
+        catalog_id = CatalogAPI._extract_catalog_id(parsed.path)
+        catalog_ids_query = join(query_params, "catalog[]")
 
-        params = {
-            "search_text": "+".join(self._extract_values(query_params, "search_text")),
+        filters = {
+            "search_text": "+".join(CatalogAPI._extract_values(query_params, "search_text")),
             "catalog_ids": str(catalog_id) if catalog_id else catalog_ids_query,
-            "color_ids": self._join_values(query_params, "color_ids[]"),
-            "brand_ids": self._join_values(query_params, "brand_ids[]"),
-            "size_ids": self._join_values(query_params, "size_ids[]"),
-            "material_ids": self._join_values(query_params, "material_ids[]"),
-            "status_ids": self._join_values(query_params, "status[]"),
-            "country_ids": self._join_values(query_params, "country_ids[]"),
-            "city_ids": self._join_values(query_params, "city_ids[]"),
-            "is_for_swap": ",".join("1" for _ in self._extract_values(query_params, "disposal[]")),
-            "currency": self._join_values(query_params, "currency"),
-            "price_to": self._join_values(query_params, "price_to"),
-            "price_from": self._join_values(query_params, "price_from"),
-            "page": page,
-            "per_page": per_page,
-            "order": self._join_values(query_params, "order"),
+            "color_ids": join(query_params, "color_ids[]"),
+            "brand_ids": join(query_params, "brand_ids[]"),
+            "size_ids": join(query_params, "size_ids[]"),
+            "material_ids": join(query_params, "material_ids[]"),
+            "status_ids": join(query_params, "status[]"),
+            "country_ids": join(query_params, "country_ids[]"),
+            "city_ids": join(query_params, "city_ids[]"),
+            "is_for_swap": ",".join(
+                "1" for _ in CatalogAPI._extract_values(query_params, "disposal[]")
+            ),
+            "currency": join(query_params, "currency"),
+            "price_to": join(query_params, "price_to"),
+            "price_from": join(query_params, "price_from"),
+            "order": join(query_params, "order"),
         }
 
-        return {k: v for k, v in params.items() if v}
+        return tuple((k, v) for k, v in filters.items() if v)
 
     @staticmethod
     def _extract_catalog_id(path: str) -> int | None:
@@ -123,7 +411,17 @@ class CatalogAPI(BaseAPI):
         """Return list of values for a given query key."""
         return [v for k, v in query_params if k == key]
 
-    def _join_values(self, query_params: list[tuple[str, str]], key: str) -> str:
+    @staticmethod
+    def _join_values(query_params: list[tuple[str, str]], key: str) -> str:
         """Join multiple values for a query key with commas."""
-        values = self._extract_values(query_params, key)
+        values = CatalogAPI._extract_values(query_params, key)
         return ",".join(values)
+
+
+def _discard(future: asyncio.Future) -> None:
+    """Cancel a prefetch nobody will consume, marking any error as retrieved."""
+    if future.done():
+        if not future.cancelled():
+            future.exception()
+    else:
+        future.cancel()
@@ -9,7 +9,15 @@ import logging
 from typing import Any, Union
 from urllib.parse import urlparse
 
+from curl_cffi.requests import Response
+
+from ..cache import CacheBackend, CacheStats, MemoryCache
+from ..constants import HTTP_STATUS_NOT_FOUND
+from ..exceptions import VintedNotFoundError
 from ..models import DetailedItem
+from ..models.config import NegativeCacheConfig
+from ..pool import SessionPool
+from ..session import HttpSession
 from .base import BaseAPI
 
 logger = logging.getLogger(__name__)
@@ -20,8 +28,31 @@ class ItemsAPI(BaseAPI):
 
     Methods accept a public item URL and perform the internal API call
     to retrieve detailed item data.
+
+    With a `negative_cache`, items that came back missing (HTTP 404 or an
+    empty `item`) are remembered for its TTL and further lookups raise
+    `VintedNotFoundError` straight away, without any network I/O.
+
+    Args:
+        session: An initialized `HttpSession` or `SessionPool`.
+        cache: Optional `CacheBackend` holding raw response bodies.
+        cache_ttl: Seconds a cached response stays fresh.
+        negative_cache: Optional `NegativeCacheConfig` for missing items.
     """
 
+    def __init__(
+        self,
+        session: HttpSession | SessionPool,
+        cache: CacheBackend | None = None,
+        cache_ttl: float = 0.0,
+        negative_cache: NegativeCacheConfig | None = None,
+    ):
+        super().__init__(session, cache=cache, cache_ttl=cache_ttl)
+        self.negative_cache = negative_cache
+        self._missing = (
+            MemoryCache(max_entries=negative_cache.max_entries) if negative_cache else None
+        )
+
     async def get_details(
         self,
         url: str,
@@ -36,17 +67,33 @@ class ItemsAPI(BaseAPI):
 
         Returns:
             `DetailedItem` or raw dict depending on `raw_data`.
-        """
-        self.session.configure_from_url(url)
 
+        Raises:
+            VintedNotFoundError: The item is missing, deleted or no longer listed.
+        """
         product_id = self._extract_product_id(url)
-        api_url = f"{self.base_url}/api/v2/items/{product_id}/details"
+        api_url = f"{self.base_url_for(url)}/api/v2/items/{product_id}/details"
+
+        if self._missing is not None and await self._missing.get(api_url) is not None:
+            logger.debug("Item %s known to be missing, skipping request", product_id)
+            raise VintedNotFoundError(
+                f"Item {product_id} not found (cached)", status_code=HTTP_STATUS_NOT_FOUND
+            )
 
         logger.debug("Fetching item details: %s", api_url)
 
-        response = await self.session.request(api_url)
-        data = response.json()
-        item_data: dict[Any, Any] = data.get("item", {})
+        try:
+            data = await self._fetch_json(api_url, None, lambda: self._request(api_url))
+        except VintedNotFoundError:
+            await self._remember_missing(api_url)
+            raise
+
+        item_data: dict[Any, Any] = data.get("item") or {}
+        if not item_data:
+            await self._remember_missing(api_url)
+            raise VintedNotFoundError(
+                f"Item {product_id} not found", status_code=HTTP_STATUS_NOT_FOUND
+            )
 
         logger.debug("Item details fetched successfully")
 
@@ -55,6 +102,20 @@ class ItemsAPI(BaseAPI):
 
         return DetailedItem(raw_data=item_data)
 
+    def negative_cache_stats(self) -> CacheStats | None:
+        """Return hit/miss counters of the missing-item cache, if enabled."""
+        return self._missing.stats() if self._missing else None
+
+    async def _remember_missing(self, api_url: str) -> None:
+        if self._missing is not None and self.negative_cache is not None:
+            await self._missing.set(api_url, b"", self.negative_cache.ttl)
+
+    async def _request(self, api_url: str) -> Response:
+        if isinstance(self.session, SessionPool):
+            # Single-item lookups are latency sensitive; the pool hedges them if enabled.
+            return await self.session.request(api_url, hedge=True)
+        return await self.session.request(api_url)
+
     @staticmethod
     def _extract_product_id(url: str) -> str:
         """Extract product id from a public item URL path.
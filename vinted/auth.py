@@ -7,10 +7,14 @@ whether an access token stored in the session cookies is expired.
 import base64
 import json
 import logging
+import time
 from datetime import datetime
+from typing import Any, cast
 
 from curl_cffi import AsyncSession
 
+from .utils import cookie_domain_matches
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,10 +23,21 @@ class AuthManager:
 
     Args:
         session: An active `curl_cffi.AsyncSession` used to access cookies.
+        domain: Optional host the token belongs to. When set, only cookies
+            scoped to that host are considered, so several Vinted domains
+            can share one cookie jar.
+        skew: Seconds before the `exp` claim at which the token is already
+            treated as expired.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, domain: str | None = None, skew: float = 0.0):
         self.session = session
+        self.domain = domain
+        self.skew = skew
+
+        self._cached_token: str | None = None
+        self._cached_expiry: float | None = None
+        self._cached_deadline = float("-inf")
 
     def is_token_expired(self) -> bool:
         """Return True if there is no access token or it is expired.
@@ -30,12 +45,76 @@ class AuthManager:
         Reads the `access_token_web` cookie from the session and checks the
         JWT `exp` claim. If the token is missing or cannot be decoded the
         method returns True (treated as expired).
+
+        The claim is decoded once per token and converted to a deadline on
+        the monotonic clock, so repeated checks of the same token cost one
+        string and one float comparison and are immune to wall-clock jumps.
         """
-        access_token = self.session.cookies.get("access_token_web")
+        access_token = self._get_access_token()
         if not access_token:
             return True
 
-        return self._validate_jwt_expiration(access_token)
+        if access_token != self._cached_token:
+            self._remember(access_token)
+
+        return time.monotonic() + self.skew >= self._cached_deadline
+
+    def _remember(self, token: str) -> None:
+        """Decode `token` once and cache its expiry and monotonic deadline."""
+        expiry = self._decode_expiry(token)
+
+        self._cached_token = token
+        self._cached_expiry = expiry
+        if expiry is None:
+            self._cached_deadline = float("-inf")
+        else:
+            self._cached_deadline = time.monotonic() + (expiry - time.time())
+
+    def _get_access_token(self) -> str | None:
+        """Return the `access_token_web` cookie value for `domain`, if any."""
+        if self.domain is None:
+            token: str | None = self.session.cookies.get("access_token_web")
+            return token
+
+        # Walk the jar's domain -> path -> name mapping directly; iterating the
+        # jar itself is several times slower and this runs on every request.
+        jar: Any = self.session.cookies.jar
+        for cookie_domain, paths in jar._cookies.items():
+            if not cookie_domain_matches(self.domain, cookie_domain):
+                continue
+            for names in paths.values():
+                cookie = names.get("access_token_web")
+                if cookie is not None:
+                    return cast(str | None, cookie.value)
+        return None
+
+    def token_expiry(self) -> float | None:
+        """Return the `exp` claim (Unix seconds) of the current access token.
+
+        Returns None when there is no token or it cannot be decoded.
+        """
+        access_token = self._get_access_token()
+        if not access_token:
+            return None
+
+        if access_token != self._cached_token:
+            self._remember(access_token)
+        return self._cached_expiry
+
+    @staticmethod
+    def _decode_expiry(token: str) -> float | None:
+        """Decode the JWT payload of `token` and return its `exp` claim."""
+        try:
+            payload_b64 = token.split(".")[1]
+
+            padding_needed = (4 - len(payload_b64) % 4) % 4
+            payload_b64 += "=" * padding_needed
+
+            payload = json.loads(base64.urlsafe_b64decode(payload_b64))
+            return float(payload["exp"])
+        except Exception as e:
+            logger.debug("Failed to decode JWT token: %s", e)
+            return None
 
     @staticmethod
     def _validate_jwt_expiration(token: str) -> bool:
@@ -52,19 +131,9 @@ class AuthManager:
             True if current time is greater or equal to the `exp` claim or
             if the token cannot be decoded; otherwise False.
         """
-        try:
-            payload_b64 = token.split(".")[1]
-
-            padding_needed = (4 - len(payload_b64) % 4) % 4
-            payload_b64 += "=" * padding_needed
-
-            payload = json.loads(base64.urlsafe_b64decode(payload_b64))
-
-            exp_timestamp = payload.get("exp", 0)
-            current_timestamp = datetime.now().timestamp()
-            result: bool = current_timestamp >= exp_timestamp
-
-            return result
-        except Exception as e:
-            logger.debug("Failed to validate JWT token: %s", e)
+        exp_timestamp = AuthManager._decode_expiry(token)
+        if exp_timestamp is None:
             return True
+
+        current_timestamp = datetime.now().timestamp()
+        return current_timestamp >= exp_timestamp
@@ -0,0 +1,147 @@
+"""Batch execution of many catalog searches.
+
+`run_search_batch` runs one search per URL under a global concurrency
+limit and a per-domain limit. Domains take turns when a slot frees up,
+so a domain with hundreds of saved searches cannot starve the others,
+and a failing search is reported in its own `SearchOutcome` without
+affecting the rest of the batch.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchOutcome:
+    """Result of one search in a batch.
+
+    Attributes:
+        url: The search URL.
+        items: Items found; None when the search failed.
+        error: The exception the search raised, if any.
+        elapsed: Seconds the search took, excluding time queued.
+    """
+
+    url: str
+    items: list[Any] | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the search succeeded."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class SearchBatch:
+    """Outcomes of a batch of searches.
+
+    Attributes:
+        outcomes: One `SearchOutcome` per input URL, in input order.
+        elapsed: Wall-clock seconds for the whole batch.
+    """
+
+    outcomes: list[SearchOutcome] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> list[SearchOutcome]:
+        """Return the outcomes of searches that succeeded."""
+        return [o for o in self.outcomes if o.ok]
+
+    @property
+    def failed(self) -> list[SearchOutcome]:
+        """Return the outcomes of searches that raised."""
+        return [o for o in self.outcomes if not o.ok]
+
+
+async def run_search_batch(
+    urls: list[str],
+    search: Callable[[str], Awaitable[list[Any]]],
+    concurrency: int = 16,
+    per_domain_limit: int | None = None,
+) -> SearchBatch:
+    """Run `search(url)` for every URL with fair scheduling across domains.
+
+    Whenever a slot is free, the next domain in round-robin order that is
+    below `per_domain_limit` starts its oldest queued search.
+
+    Args:
+        urls: Search URLs; duplicates are searched once per occurrence.
+        search: Coroutine function running one search.
+        concurrency: Maximum number of searches in flight overall.
+        per_domain_limit: Optional maximum in flight per domain.
+
+    Returns:
+        A `SearchBatch` with one outcome per URL.
+    """
+    started = time.monotonic()
+    concurrency = max(1, concurrency)
+    domain_limit = max(1, per_domain_limit) if per_domain_limit else concurrency
+
+    queues: dict[str, deque[int]] = {}
+    for index, url in enumerate(urls):
+        queues.setdefault(urlparse(url).netloc, deque()).append(index)
+    turns = deque(queues)
+    in_flight = dict.fromkeys(queues, 0)
+
+    outcomes: list[SearchOutcome | None] = [None] * len(urls)
+    running: dict[asyncio.Task[SearchOutcome], tuple[int, str]] = {}
+
+    def start_next() -> bool:
+        for _ in range(len(turns)):
+            domain = turns[0]
+            turns.rotate(-1)
+            if queues[domain] and in_flight[domain] < domain_limit:
+                index = queues[domain].popleft()
+                in_flight[domain] += 1
+                task = asyncio.ensure_future(_run_one(urls[index], search))
+                running[task] = (index, domain)
+                return True
+        return False
+
+    try:
+        while True:
+            while len(running) < concurrency and start_next():
+                pass
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, domain = running.pop(task)
+                in_flight[domain] -= 1
+                outcomes[index] = task.result()
+    finally:
+        for task in running:
+            task.cancel()
+
+    batch = SearchBatch(
+        outcomes=[o for o in outcomes if o is not None], elapsed=time.monotonic() - started
+    )
+    logger.info(
+        "Search batch finished: %d ok, %d failed in %.2fs",
+        len(batch.succeeded),
+        len(batch.failed),
+        batch.elapsed,
+    )
+    return batch
+
+
+async def _run_one(url: str, search: Callable[[str], Awaitable[list[Any]]]) -> SearchOutcome:
+    started = time.monotonic()
+    try:
+        items = await search(url)
+    except Exception as e:
+        logger.warning("Search failed for %s: %s", url, e)
+        return SearchOutcome(url=url, error=e, elapsed=time.monotonic() - started)
+    return SearchOutcome(url=url, items=items, elapsed=time.monotonic() - started)
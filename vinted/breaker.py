@@ -0,0 +1,197 @@
+"""Circuit breaker for failing hosts and proxies.
+
+A `CircuitBreaker` watches the outcome of recent calls. Once the share
+of failures in its window crosses the threshold it *opens* and calls
+fail fast with `VintedCircuitOpenError` instead of waiting on timeouts.
+After a cool-down it turns *half-open* and lets a few probe requests
+through: if they succeed it *closes* again, otherwise it reopens.
+Breakers live on the `HttpSession` of each proxy, one for every host
+it calls.
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal
+
+from .exceptions import VintedCircuitOpenError
+from .utils import format_proxy_for_log
+
+logger = logging.getLogger(__name__)
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True)
+class BreakerStateChange:
+    """Information passed to `CircuitBreakerConfig.on_state_change`.
+
+    Attributes:
+        netloc: Host the breaker guards.
+        proxy: Proxy the breaker belongs to (None for a direct connection).
+        old: State before the change.
+        new: State after the change.
+        failure_rate: Failure rate of the window when the change happened.
+    """
+
+    netloc: str
+    proxy: str | None
+    old: BreakerState
+    new: BreakerState
+    failure_rate: float
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Circuit breaker settings applied per proxy and Vinted domain.
+
+    Attributes:
+        failure_rate: Share of failed calls (0..1) in the window that opens
+            the breaker.
+        window: Number of most recent calls the failure rate is computed over.
+        min_calls: Calls the window must hold before the breaker may open.
+        open_seconds: How long an open breaker fails fast before probing.
+        half_open_probes: Concurrent probe requests allowed while half-open;
+            that many successes close the breaker, any failure reopens it.
+        failure_statuses: HTTP status codes counted as failures; network
+            errors always are.
+        on_state_change: Optional hook called with a `BreakerStateChange`.
+    """
+
+    failure_rate: float = 0.5
+    window: int = 20
+    min_calls: int = 10
+    open_seconds: float = 30.0
+    half_open_probes: int = 1
+    failure_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    on_state_change: Callable[[BreakerStateChange], None] | None = field(default=None, repr=False)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over a sliding window of call outcomes.
+
+    Callers `acquire()` before a call and report its outcome with
+    `record()`, or `release()` when the call ended without one (e.g. it
+    was cancelled). `acquire()` returns whether the call is a half-open
+    probe; that flag must be passed back so late results of calls
+    admitted before the breaker opened are not mistaken for probes.
+
+    Args:
+        config: `CircuitBreakerConfig` with thresholds and the hook.
+        netloc: Host guarded by the breaker.
+        proxy: Proxy the breaker belongs to.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig, netloc: str, proxy: str | None = None):
+        self.config = config
+        self.netloc = netloc
+        self.proxy = proxy
+        self.state: BreakerState = "closed"
+        self._outcomes: deque[bool] = deque(maxlen=max(1, config.window))
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+
+    @property
+    def failure_rate(self) -> float:
+        """Return the share of failures among the calls in the window."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def retry_after(self, now: float | None = None) -> float:
+        """Return seconds until an open breaker admits a probe (0 otherwise)."""
+        if self.state != "open":
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, self._opened_at + self.config.open_seconds - now)
+
+    def acquire(self, now: float | None = None) -> bool:
+        """Admit a call and return True when it is a half-open probe.
+
+        Raises `VintedCircuitOpenError` while the breaker is open, or while
+        it is half-open and every probe slot is taken.
+        """
+        now = time.monotonic() if now is None else now
+
+        if self.state == "open":
+            if now < self._opened_at + self.config.open_seconds:
+                raise self._open_error(self.retry_after(now))
+            self._transition("half_open")
+            self._probes = 0
+            self._probe_successes = 0
+
+        if self.state == "half_open":
+            if self._probes >= self.config.half_open_probes:
+                raise self._open_error(0.0)
+            self._probes += 1
+            return True
+
+        return False
+
+    def record(self, success: bool, probe: bool = False, now: float | None = None) -> None:
+        """Report the outcome of a call admitted by `acquire()`."""
+        if probe:
+            if self.state != "half_open":
+                return
+            self._probes = max(0, self._probes - 1)
+            if not success:
+                self._open(now)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.config.half_open_probes:
+                self._outcomes.clear()
+                self._transition("closed")
+            return
+
+        if self.state != "closed":
+            return
+
+        self._outcomes.append(success)
+        if (
+            not success
+            and len(self._outcomes) >= self.config.min_calls
+            and self.failure_rate >= self.config.failure_rate
+        ):
+            self._open(now)
+
+    def release(self, probe: bool = False) -> None:
+        """Give back a probe slot for a call that ended without an outcome."""
+        if probe and self.state == "half_open":
+            self._probes = max(0, self._probes - 1)
+
+    def _open(self, now: float | None = None) -> None:
+        self._opened_at = time.monotonic() if now is None else now
+        self._transition("open")
+
+    def _transition(self, new: BreakerState) -> None:
+        old, self.state = self.state, new
+        change = BreakerStateChange(
+            netloc=self.netloc,
+            proxy=self.proxy,
+            old=old,
+            new=new,
+            failure_rate=self.failure_rate,
+        )
+
+        log = logger.warning if new == "open" else logger.info
+        log(
+            "Circuit breaker for %s via %s: %s -> %s (failure rate %.0f%%)",
+            self.netloc,
+            format_proxy_for_log(self.proxy),
+            old,
+            new,
+            change.failure_rate * 100,
+        )
+        if self.config.on_state_change:
+            self.config.on_state_change(change)
+
+    def _open_error(self, retry_after: float) -> VintedCircuitOpenError:
+        return VintedCircuitOpenError(
+            f"Circuit open for {self.netloc}, retry in {retry_after:.1f}s",
+            netloc=self.netloc,
+            proxy=self.proxy,
+            retry_after=retry_after,
+        )
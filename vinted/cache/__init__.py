@@ -0,0 +1,5 @@
+from .base import CacheBackend, CacheStats, cache_key
+from .memory import MemoryCache
+from .sqlite import SqliteCache
+
+__all__ = ["CacheBackend", "CacheStats", "MemoryCache", "SqliteCache", "cache_key"]
@@ -0,0 +1,76 @@
+"""Abstract response cache interface.
+
+Caches map a request key (see `cache_key`) to a raw response body with
+a time-to-live. The interface is async so backends that do I/O (such
+as a disk tier) can run it off the event loop.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+from ..coalesce import VOLATILE_PARAMS
+
+
+@dataclass
+class CacheStats:
+    """Counters for a cache backend.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found nothing or an expired entry.
+        evictions: Entries dropped to stay within the size limits.
+        entries: Entries currently stored.
+        size: Bytes currently stored.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+class CacheBackend(ABC):
+    """Base interface for response cache backends.
+
+    Subclasses store opaque `bytes` values under string keys and must
+    treat entries past their TTL as missing.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value for `key`, or None when missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove `key` if present."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the backend's counters."""
+
+    async def close(self) -> None:
+        """Release resources held by the backend; the default does nothing."""
+
+
+def cache_key(url: str, params: dict | None = None) -> str:
+    """Return a stable cache key for a GET of `url` with `params`.
+
+    Parameters are sorted and volatile ones (the catalog `time` stamp)
+    are dropped, so equivalent requests share an entry.
+    """
+    if not params:
+        return url
+    query = urlencode(
+        sorted((str(k), str(v)) for k, v in params.items() if k not in VOLATILE_PARAMS)
+    )
+    return f"{url}?{query}"
@@ -0,0 +1,72 @@
+"""In-process LRU response cache.
+
+`MemoryCache` keeps entries in insertion/access order and evicts the
+least recently used ones once either the entry count or the total byte
+size exceeds its limits. Expired entries are dropped lazily on access.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import replace
+
+from .base import CacheBackend, CacheStats
+
+
+class MemoryCache(CacheBackend):
+    """TTL cache bounded by entry count and byte size with LRU eviction.
+
+    Args:
+        max_entries: Maximum number of entries kept.
+        max_bytes: Maximum total size of stored values in bytes.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._stats = CacheStats()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0 or len(value) > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._stats.size += len(value)
+
+        while len(self._entries) > self.max_entries or self._stats.size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._stats.size = 0
+
+    def stats(self) -> CacheStats:
+        return replace(self._stats, entries=len(self._entries))
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._stats.size -= len(value)
@@ -0,0 +1,185 @@
+"""SQLite-backed persistent response cache.
+
+`SqliteCache` stores zlib-compressed values in a single SQLite file in
+WAL mode, so entries survive restarts and several processes can read
+the same file while one writes. Every database call runs in a worker
+thread (`asyncio.to_thread`) behind a lock, so the event loop never
+blocks on disk I/O.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import replace
+from pathlib import Path
+
+from .base import CacheBackend, CacheStats
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class SqliteCache(CacheBackend):
+    """Persistent TTL cache bounded by compressed size with LRU eviction.
+
+    Expiry uses wall-clock time since entries outlive the process. With
+    `ignore_expiry`, expired entries are still served, which turns a
+    cache captured earlier into a fixed dataset (offline mode).
+
+    Args:
+        filepath: Path to the SQLite database file.
+        max_bytes: Maximum total size of compressed values in bytes.
+        ignore_expiry: Serve entries regardless of their TTL.
+        compress_level: zlib compression level (0-9).
+    """
+
+    def __init__(
+        self,
+        filepath: Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        ignore_expiry: bool = False,
+        compress_level: int = 6,
+    ):
+        self.filepath = Path(filepath)
+        self.max_bytes = max_bytes
+        self.ignore_expiry = ignore_expiry
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._stats = CacheStats()
+
+    async def get(self, key: str) -> bytes | None:
+        value = await asyncio.to_thread(self._get, key, time.time())
+        if value is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        body = zlib.compress(value, self.compress_level)
+        await asyncio.to_thread(self._set, key, body, ttl, time.time())
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM responses WHERE key = ?", (key,))
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM responses", ())
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    def stats(self) -> CacheStats:
+        return replace(self._stats)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.filepath, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._refresh_totals(conn)
+            logger.debug("Response cache opened: %s", self.filepath)
+        return self._conn
+
+    def _get(self, key: str, now: float) -> bytes | None:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT body, size, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            body, size, expires_at = row
+            if expires_at <= now and not self.ignore_expiry:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._stats.entries -= 1
+                self._stats.size -= size
+                return None
+
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+
+        try:
+            return zlib.decompress(body)
+        except zlib.error as e:
+            logger.warning("Dropping corrupt cache entry %s: %s", key, e)
+            self._execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+
+    def _set(self, key: str, body: bytes, ttl: float, now: float) -> None:
+        if len(body) > self.max_bytes:
+            return
+
+        with self._lock:
+            conn = self._connect()
+            previous = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), now + ttl, now),
+            )
+            # Totals are kept incrementally; a full recount only happens on evictions.
+            if previous is None:
+                self._stats.entries += 1
+            self._stats.size += len(body) - (previous[0] if previous else 0)
+            if self._stats.size > self.max_bytes:
+                self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least recently used ones, until under the cap."""
+        if not self.ignore_expiry:
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            self._refresh_totals(conn)
+
+        excess = self._stats.size - self.max_bytes
+        if excess <= 0:
+            return
+
+        victims: list[tuple[str]] = []
+        freed = 0
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._stats.evictions += len(victims)
+        self._refresh_totals(conn)
+
+    def _refresh_totals(self, conn: sqlite3.Connection) -> None:
+        entries, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        self._stats.entries = entries
+        self._stats.size = size
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(sql, params)
+            self._refresh_totals(conn)
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
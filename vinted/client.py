@@ -6,30 +6,62 @@ cookie storage and API wrappers.
 """
 
 import logging
+import sqlite3
+from collections.abc import AsyncIterator, Iterable
 from pathlib import Path
 from typing import Type, Union
 
 from .api.catalog import CatalogAPI
 from .api.items import ItemsAPI
-from .constants import SortOrder, StorageFormat
-from .models.config import ClientConfig
+from .batch import SearchBatch
+from .breaker import CircuitBreakerConfig
+from .cache import CacheBackend, CacheStats, MemoryCache, SqliteCache
+from .concurrency import ConcurrencyStats
+from .constants import CATALOG_API_PATH, VINTED_BASE_URL_TEMPLATE, SortOrder, StorageFormat
+from .exceptions import VintedConfigError, VintedValidationError
+from .models.config import (
+    CacheConfig,
+    ClientConfig,
+    ConcurrencyConfig,
+    DiskCacheConfig,
+    HedgingConfig,
+    NegativeCacheConfig,
+    ProxyPoolConfig,
+    RateLimitConfig,
+    TransportConfig,
+    WatchConfig,
+)
 from .models.item import CatalogItem, DetailedItem
+from .pool import ProxyStats, SessionPool
+from .retry import RetryBudget, RetryPolicy
 from .session import HttpSession
-from .storage.base import CookieStorage
+from .storage.base import CookieStorage, StorageStats
 from .storage.json import JsonStorage
+from .storage.lock import FileLock
 from .storage.mozilla import MozillaStorage
 from .storage.pickle import PickleStorage
-from .utils import format_proxy_for_log
+from .storage.sqlite import CookieDatabase, SqliteStorage
+from .utils import format_proxy_for_log, validate_locale
+from .warmup import WarmUpResult, warm_up_sessions
 
 logger = logging.getLogger(__name__)
 
+STORAGE_EXTENSIONS = {
+    "pickle": ".pk",
+    "json": ".json",
+    "mozilla": ".txt",
+    "sqlite": ".sqlite3",
+}
+
 
 class VintedClient:
     """High-level client for Vinted operations.
 
     The client is an async context manager that exposes `search_items`
     and `item_details`. Cookie persistence is configurable via
-    `persist_cookies` and `storage_format`.
+    `persist_cookies` and `storage_format`. When several proxies are
+    given, each gets its own session and cookie file and requests are
+    spread across them by health score.
     """
 
     def __init__(
@@ -38,6 +70,22 @@ class VintedClient:
         cookies_dir: Path | None = None,
         persist_cookies: bool = False,
         storage_format: StorageFormat = "json",
+        proxies: list[str] | None = None,
+        proxy_pool: ProxyPoolConfig | None = None,
+        rate_limit: RateLimitConfig | None = None,
+        retry: RetryPolicy | None = None,
+        renew_margin: float | None = None,
+        token_skew: float = 0.0,
+        transport: TransportConfig | None = None,
+        coalesce_requests: bool = True,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        hedging: HedgingConfig | None = None,
+        concurrency: ConcurrencyConfig | None = None,
+        cache: CacheConfig | None = None,
+        disk_cache: DiskCacheConfig | None = None,
+        negative_cache: NegativeCacheConfig | None = None,
+        cookie_save_delay: float | None = 1.0,
+        share_cookies: bool = False,
     ):
         """Create a `VintedClient`.
 
@@ -45,36 +93,159 @@ class VintedClient:
             proxy: Optional proxy URL used by the underlying session.
             cookies_dir: Directory where cookie files will be stored.
             persist_cookies: When True, cookies are saved/loaded from disk.
-            storage_format: One of `"json"`, `"pickle"` or `"mozilla"`.
+            storage_format: One of `"json"`, `"pickle"`, `"mozilla"` or
+                `"sqlite"` (all proxies in one database).
+            proxies: Optional list of proxies forming a pool together with
+                `proxy`.
+            proxy_pool: Optional health scoring and quarantine settings.
+            rate_limit: Optional token bucket pacing per proxy and domain.
+            retry: Optional retry policy for transient failures. The retry
+                budget is shared by every proxy session of the client.
+            renew_margin: Optional seconds before access token expiry at
+                which cookies are renewed in the background.
+            token_skew: Seconds before access token expiry at which requests
+                already refresh cookies, to absorb clock skew.
+            transport: Optional connection pool, keep-alive, timeout and
+                HTTP version settings for every session.
+            coalesce_requests: When True, concurrent identical GETs (same
+                URL and params, ignoring the catalog `time` stamp) share one
+                HTTP request and its response.
+            circuit_breaker: Optional breaker per proxy and domain that makes
+                requests fail fast with `VintedCircuitOpenError` while a
+                host keeps failing.
+            hedging: Optional hedged requests for `item_details`: a slow
+                lookup is repeated through a different proxy and the first
+                response wins. Needs at least two proxies.
+            concurrency: Optional adaptive (AIMD) limit on in-flight requests
+                per proxy and domain, replacing a hand-tuned semaphore.
+            cache: Optional response cache for `item_details` and
+                `search_items` with per-endpoint TTLs.
+            disk_cache: Optional persistent SQLite cache of HTTP responses
+                shared by every proxy session; also enables offline replay.
+            negative_cache: Optional memory of missing or deleted items so
+                repeated `item_details` calls for them raise
+                `VintedNotFoundError` without a request.
+            cookie_save_delay: Seconds persisted cookie changes are held
+                before a single write-behind save; None saves on every
+                change. Pending changes are written on `close()`.
+            share_cookies: When True, persisted cookies are refreshed under
+                a per-proxy lock file so several processes sharing
+                `cookies_dir` refresh an expired token only once.
         """
         config = ClientConfig(
             proxy=proxy,
+            proxies=list(proxies or []),
             cookies_dir=cookies_dir or Path("."),
             persist_cookies=persist_cookies,
             storage_format=storage_format,
+            proxy_pool=proxy_pool or ProxyPoolConfig(),
+            rate_limit=rate_limit,
+            retry=retry,
+            renew_margin=renew_margin,
+            token_skew=token_skew,
+            transport=transport or TransportConfig(),
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            concurrency=concurrency,
+            cache=cache,
+            disk_cache=disk_cache,
+            negative_cache=negative_cache,
+            cookie_save_delay=cookie_save_delay,
+            share_cookies=share_cookies,
         )
 
-        logger.info("Initializing VintedClient: proxy=%s", format_proxy_for_log(config.proxy))
-
-        storage = self._create_storage(config)
+        logger.info(
+            "Initializing VintedClient: proxies=%s",
+            ", ".join(format_proxy_for_log(p) for p in config.proxy_list),
+        )
 
-        self._session = HttpSession(
-            proxy=config.proxy,
-            storage=storage,
+        retry_budget = RetryBudget.from_policy(config.retry) if config.retry else None
+        self._disk_cache = self._create_disk_cache(config)
+        self._cookie_database = self._create_cookie_database(config)
+        disk_cache_config = config.disk_cache or DiskCacheConfig()
+
+        sessions = [
+            HttpSession(
+                proxy=p,
+                storage=self._create_storage(config, p),
+                refresh_lock=self._create_refresh_lock(config, p),
+                save_delay=config.cookie_save_delay,
+                rate_limit=config.rate_limit,
+                retry=config.retry,
+                retry_budget=retry_budget,
+                renew_margin=config.renew_margin,
+                token_skew=config.token_skew,
+                transport=config.transport,
+                # The pool coalesces before picking a proxy.
+                coalesce=False,
+                circuit_breaker=config.circuit_breaker,
+                concurrency=config.concurrency,
+                response_cache=self._disk_cache,
+                response_cache_ttl=disk_cache_config.ttl,
+                response_cache_ttls={CATALOG_API_PATH: disk_cache_config.catalog_ttl},
+                offline=disk_cache_config.offline,
+            )
+            for p in config.proxy_list
+        ]
+
+        self._pool = SessionPool(
+            sessions,
+            config.proxy_pool,
+            coalesce=config.coalesce_requests,
+            hedging=config.hedging,
+        )
+        self._session = sessions[0]
+
+        self._cache = self._create_cache(config)
+        catalog_ttl = config.cache.catalog_ttl if config.cache else 0.0
+        item_ttl = config.cache.item_ttl if config.cache else 0.0
+
+        self._catalog = CatalogAPI(self._pool, cache=self._cache, cache_ttl=catalog_ttl)
+        self._items = ItemsAPI(
+            self._pool,
+            cache=self._cache,
+            cache_ttl=item_ttl,
+            negative_cache=config.negative_cache,
         )
 
-        self._catalog = CatalogAPI(self._session)
-        self._items = ItemsAPI(self._session)
+    def _create_cache(self, config: ClientConfig) -> CacheBackend | None:
+        """Return the configured response cache backend or None."""
+        if config.cache is None:
+            return None
+        if config.cache.backend is not None:
+            return config.cache.backend
+        return MemoryCache(max_entries=config.cache.max_entries, max_bytes=config.cache.max_bytes)
+
+    def _create_disk_cache(self, config: ClientConfig) -> SqliteCache | None:
+        """Return the shared persistent response cache or None."""
+        if config.disk_cache is None:
+            return None
+
+        path = config.disk_cache.path or config.cookies_dir / "responses.sqlite3"
+        return SqliteCache(
+            path,
+            max_bytes=config.disk_cache.max_bytes,
+            ignore_expiry=config.disk_cache.offline,
+        )
 
-    def _create_storage(self, config: ClientConfig) -> CookieStorage | None:
+    def _create_storage(
+        self, config: ClientConfig, proxy: str | None = None
+    ) -> CookieStorage | None:
         """Return a configured `CookieStorage` instance or None.
 
-        When `persist_cookies` is False this returns None.
+        When `persist_cookies` is False this returns None. With the
+        `sqlite` format every proxy gets its own identity in one shared
+        database.
         """
         if not config.persist_cookies:
             return None
 
-        filepath = self._generate_storage_path(config)
+        filepath = self._generate_storage_path(config, proxy)
+
+        if self._cookie_database is not None:
+            identity = proxy.split("@")[-1] if proxy else "direct"
+            return SqliteStorage(filepath, identity=identity, database=self._cookie_database)
 
         storage_map: dict[str, Type[CookieStorage]] = {
             "pickle": PickleStorage,
@@ -85,35 +256,67 @@ class VintedClient:
         storage_class = storage_map[config.storage_format]
         return storage_class(filepath)
 
-    def _generate_storage_path(self, config: ClientConfig) -> Path:
+    def _create_cookie_database(self, config: ClientConfig) -> CookieDatabase | None:
+        """Return the shared, preloaded cookie database for the `sqlite` format."""
+        if not config.persist_cookies or config.storage_format != "sqlite":
+            return None
+
+        database = CookieDatabase(self._generate_storage_path(config))
+        try:
+            database.preload()
+        except sqlite3.Error as e:
+            logger.error("Failed to preload cookies: %s", e)
+        return database
+
+    def _create_refresh_lock(
+        self, config: ClientConfig, proxy: str | None = None
+    ) -> FileLock | None:
+        """Return the lock guarding cookie refreshes of a persisted cookie file.
+
+        Processes sharing the cookie file share the lock, so only one of
+        them refreshes an expired token. Locks are per proxy even when the
+        `sqlite` format keeps every proxy in one file. Returns None unless
+        both `persist_cookies` and `share_cookies` are set.
+        """
+        if not (config.persist_cookies and config.share_cookies):
+            return None
+        filename = (
+            "cookies" + self._proxy_suffix(proxy) + STORAGE_EXTENSIONS[config.storage_format]
+        )
+        return FileLock(config.cookies_dir / (filename + ".lock"))
+
+    def _generate_storage_path(self, config: ClientConfig, proxy: str | None = None) -> Path:
         """Generate a filename for persisted cookies.
 
         Filenames include proxy host/port when a proxy is configured to avoid
-        collisions between different proxy sessions.
+        collisions between different proxy sessions. The `sqlite` format
+        keeps all proxies in a single file.
         """
         filename = "cookies"
+        if config.storage_format != "sqlite":
+            filename += self._proxy_suffix(proxy)
 
-        if config.proxy:
-            if "@" in config.proxy:
-                ip_port = config.proxy.split("@")[-1]
-            else:
-                ip_port = config.proxy
-            parts = ip_port.split(":")
-            if len(parts) >= 2:
-                ip = parts[0]
-                port = parts[1]
-                filename = f"cookies_{ip}_{port}"
-
-        extensions = {
-            "pickle": ".pk",
-            "json": ".json",
-            "mozilla": ".txt",
-        }
-
-        filename += extensions[config.storage_format]
+        filename += STORAGE_EXTENSIONS[config.storage_format]
 
         return config.cookies_dir / filename
 
+    @staticmethod
+    def _proxy_suffix(proxy: str | None) -> str:
+        """Return `_<ip>_<port>` for a proxy, or an empty string."""
+        if not proxy:
+            return ""
+
+        if "@" in proxy:
+            ip_port = proxy.split("@")[-1]
+        else:
+            ip_port = proxy
+        parts = ip_port.split(":")
+        if len(parts) >= 2:
+            ip = parts[0]
+            port = parts[1]
+            return f"_{ip}_{port}"
+        return ""
+
     async def search_items(
         self,
         url: str,
@@ -145,6 +348,115 @@ class VintedClient:
             raw_data=raw_data,
         )
 
+    def iter_search(
+        self,
+        url: str,
+        per_page: int = 20,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+        order: SortOrder | None = None,
+        raw_data: bool = False,
+    ) -> AsyncIterator[Union[CatalogItem, dict]]:
+        """Iterate over catalog results across pages, prefetching the next page.
+
+        Args:
+            url: Catalog URL or search endpoint.
+            per_page: Number of items per page.
+            max_items: Optional cap on the number of items yielded.
+            max_pages: Optional cap on the number of pages fetched.
+            order: Sort order string.
+            raw_data: When True yields raw dicts instead of model objects.
+
+        Returns:
+            An async iterator of `CatalogItem` instances or raw dicts; it
+            stops at the first empty or short page.
+        """
+        return self._catalog.iter_search(
+            url=url,
+            per_page=per_page,
+            max_items=max_items,
+            max_pages=max_pages,
+            order=order,
+            raw_data=raw_data,
+        )
+
+    def watch(self, url: str, config: WatchConfig | None = None) -> AsyncIterator[CatalogItem]:
+        """Watch a search for new listings.
+
+        Args:
+            url: Catalog URL or search endpoint.
+            config: Watcher settings (dedup capacity, poll interval bounds).
+
+        Returns:
+            An endless async iterator of `CatalogItem`s not seen before;
+            leave the loop to stop watching.
+        """
+        return self._catalog.watch(url=url, config=config)
+
+    async def search_pages(
+        self,
+        url: str,
+        pages: Iterable[int],
+        per_page: int = 20,
+        concurrency: int = 4,
+        order: SortOrder | None = None,
+        raw_data: bool = False,
+    ) -> Union[list[CatalogItem], list[dict]]:
+        """Fetch several catalog pages concurrently and return their items in page order.
+
+        Args:
+            url: Catalog URL or search endpoint.
+            pages: Page numbers to fetch, e.g. `range(1, 21)`.
+            per_page: Number of items per page.
+            concurrency: Maximum number of pages fetched at once.
+            order: Sort order string.
+            raw_data: When True returns raw dicts instead of model objects.
+
+        Returns:
+            Items of all pages in page order, duplicates across page
+            boundaries removed by item id.
+        """
+        return await self._catalog.search_pages(
+            url=url,
+            pages=pages,
+            per_page=per_page,
+            concurrency=concurrency,
+            order=order,
+            raw_data=raw_data,
+        )
+
+    async def search_many(
+        self,
+        urls: Iterable[str],
+        per_page: int = 20,
+        concurrency: int = 16,
+        per_domain_limit: int | None = None,
+        order: SortOrder | None = None,
+        raw_data: bool = False,
+    ) -> SearchBatch:
+        """Run many saved searches concurrently, isolating their failures.
+
+        Args:
+            urls: Catalog URLs or search endpoints.
+            per_page: Number of items per page.
+            concurrency: Maximum number of searches in flight overall.
+            per_domain_limit: Optional maximum in flight per Vinted domain.
+            order: Sort order string.
+            raw_data: When True returns raw dicts instead of model objects.
+
+        Returns:
+            A `SearchBatch` with a `SearchOutcome` (items or error, and
+            timing) per URL in input order, plus the batch wall time.
+        """
+        return await self._catalog.search_many(
+            urls=urls,
+            per_page=per_page,
+            concurrency=concurrency,
+            per_domain_limit=per_domain_limit,
+            order=order,
+            raw_data=raw_data,
+        )
+
     async def item_details(
         self,
         url: str,
@@ -158,9 +470,84 @@ class VintedClient:
 
         Returns:
             `DetailedItem` or raw dict when `raw_data` is True.
+
+        Raises:
+            VintedNotFoundError: The item is missing, deleted or no longer listed.
         """
         return await self._items.get_details(url=url, raw_data=raw_data)
 
+    async def warm_up(
+        self,
+        locales: list[str],
+        proxies: list[str] | None = None,
+        concurrency: int = 8,
+    ) -> list[WarmUpResult]:
+        """Open connections and fetch fresh cookies ahead of the first request.
+
+        Every (proxy, locale) pair is warmed up concurrently, at most
+        `concurrency` at a time. Failures are reported, not raised, so
+        callers can decide whether the client is ready to go live.
+
+        Args:
+            locales: Vinted locales to warm up, e.g. `["fr", "de", "co.uk"]`.
+            proxies: Proxies (as passed to the client) to warm up; all of
+                them when None.
+            concurrency: Maximum number of warm-ups running at once.
+
+        Returns:
+            A `WarmUpResult` per proxy and locale with timing and outcome.
+
+        Raises:
+            VintedValidationError: A locale is not supported.
+            VintedConfigError: A proxy is not configured on this client.
+        """
+        for locale in locales:
+            try:
+                validate_locale(locale)
+            except ValueError as e:
+                raise VintedValidationError(str(e)) from e
+
+        sessions = self._pool.sessions
+        if proxies is not None:
+            known = {session.proxy for session in sessions}
+            unknown = [p for p in proxies if p not in known]
+            if unknown:
+                raise VintedConfigError(
+                    "Unknown proxies: %s" % ", ".join(format_proxy_for_log(p) for p in unknown)
+                )
+            sessions = [session for session in sessions if session.proxy in proxies]
+
+        urls = [VINTED_BASE_URL_TEMPLATE.format(locale=locale) for locale in locales]
+        return await warm_up_sessions(sessions, urls, concurrency)
+
+    def proxy_stats(self) -> list[ProxyStats]:
+        """Return a snapshot of per-proxy health stats (one entry per session)."""
+        return self._pool.stats()
+
+    def cache_stats(self) -> CacheStats | None:
+        """Return hit/miss/eviction counters of the response cache, if enabled."""
+        return self._cache.stats() if self._cache else None
+
+    def negative_cache_stats(self) -> CacheStats | None:
+        """Return counters of the missing-item cache, if enabled."""
+        return self._items.negative_cache_stats()
+
+    def disk_cache_stats(self) -> CacheStats | None:
+        """Return counters of the persistent response cache, if enabled."""
+        return self._disk_cache.stats() if self._disk_cache else None
+
+    def storage_stats(self) -> list[StorageStats]:
+        """Return cookie storage timings per proxy session (empty without persistence)."""
+        return [
+            stats
+            for session in self._pool.sessions
+            if (stats := session.storage_stats()) is not None
+        ]
+
+    def concurrency_stats(self) -> list[ConcurrencyStats]:
+        """Return the adaptive in-flight limit and queue depth per proxy and domain."""
+        return [stats for session in self._pool.sessions for stats in session.concurrency_stats()]
+
     async def __aenter__(self):
         return self
 
@@ -172,9 +559,13 @@ class VintedClient:
                 exc_val,
                 exc_info=(exc_type, exc_val, exc_tb),
             )
-        await self._session.close()
+        await self.close()
         return False
 
     async def close(self):
-        """Close the underlying session and release resources."""
-        await self._session.close()
+        """Close the underlying sessions and release resources."""
+        await self._pool.close()
+        if self._disk_cache:
+            await self._disk_cache.close()
+        if self._cookie_database:
+            self._cookie_database.close()
@@ -0,0 +1,75 @@
+"""Deduplication of identical in-flight GET requests.
+
+`RequestCoalescer` lets concurrent callers asking for the same URL and
+parameters share one request: the first caller starts it and everyone
+who arrives before it finishes awaits the same result (or error).
+Volatile parameters such as the catalog `time` stamp are ignored when
+comparing requests.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+VOLATILE_PARAMS = frozenset({"time"})
+
+
+def request_key(
+    url: str, params: dict | None = None, ignored: frozenset[str] = VOLATILE_PARAMS
+) -> Hashable:
+    """Return a key identifying a GET by URL and normalized params.
+
+    Parameter order and value types do not matter (`1` and `"1"` are the
+    same value) and parameters named in `ignored` are left out.
+    """
+    if not params:
+        return url
+    normalized = tuple(sorted((str(k), str(v)) for k, v in params.items() if k not in ignored))
+    return url, normalized
+
+
+class RequestCoalescer:
+    """Share the result of identical requests that overlap in time.
+
+    Args:
+        ignored: Parameter names excluded from the request key.
+
+    Attributes:
+        coalesced: Number of calls served by another caller's request.
+    """
+
+    def __init__(self, ignored: frozenset[str] = VOLATILE_PARAMS):
+        self.ignored = ignored
+        self.coalesced = 0
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, url: str, params: dict | None, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return `fetch()`'s result, reusing an identical in-flight call if any.
+
+        The shared request keeps running when an individual waiter is
+        cancelled, so the remaining waiters still get the response.
+        """
+        key = request_key(url, params, self.ignored)
+        future = self._inflight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._on_done(key, done))
+        else:
+            self.coalesced += 1
+            logger.debug("Joining in-flight request: %s", url)
+
+        return await asyncio.shield(future)
+
+    def _on_done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the error as retrieved when every waiter has gone away.
+            future.exception()
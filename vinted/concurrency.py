@@ -0,0 +1,167 @@
+"""Adaptive concurrency limiting.
+
+An `AdaptiveLimiter` caps the number of in-flight requests and tunes
+the cap with AIMD (additive increase, multiplicative decrease): healthy
+responses raise it slowly, while 403/429 responses, network errors or
+latency well above the recent baseline cut it sharply. Requests over
+the limit wait in FIFO order. Every host an `HttpSession` talks to
+learns its own limit.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from .models.config import ConcurrencyConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConcurrencyStats:
+    """Snapshot of one adaptive limiter.
+
+    Attributes:
+        netloc: Host the limiter applies to.
+        proxy: Proxy the limiter belongs to (None for a direct connection).
+        limit: Current in-flight limit.
+        in_flight: Requests currently holding a slot.
+        queued: Requests waiting for a slot.
+    """
+
+    netloc: str
+    proxy: str | None
+    limit: int
+    in_flight: int
+    queued: int
+
+
+class AdaptiveLimiter:
+    """AIMD-controlled semaphore.
+
+    Args:
+        config: `ConcurrencyConfig` with bounds and tuning.
+    """
+
+    def __init__(self, config: ConcurrencyConfig):
+        self.config = config
+        self._limit = float(max(config.min_limit, min(config.max_limit, config.initial_limit)))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latencies: deque[float] = deque(maxlen=max(1, config.latency_window))
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Return the current in-flight limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(
+        self, latency: float | None = None, overloaded: bool = False, now: float | None = None
+    ) -> None:
+        """Free a slot and adapt the limit to the request's outcome.
+
+        Args:
+            latency: Seconds the request took; None when it ended without a
+                usable sample (e.g. it was cancelled).
+            overloaded: True for responses signalling overload (403/429,
+                network errors).
+            now: Monotonic time, for tests.
+        """
+        self._in_flight -= 1
+
+        if overloaded:
+            self._decrease(now)
+        elif latency is not None:
+            baseline = min(self._latencies) if self._latencies else latency
+            self._latencies.append(latency)
+            if latency > baseline * self.config.latency_tolerance:
+                self._decrease(now)
+            else:
+                self._increase()
+
+        self._wake()
+
+    def _increase(self) -> None:
+        # `increase` per `limit` healthy responses, i.e. roughly once per round trip.
+        self._limit = min(
+            float(self.config.max_limit), self._limit + self.config.increase / self._limit
+        )
+
+    def _decrease(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        # Responses already in flight reflect the same congestion; cut only once per round trip.
+        baseline = min(self._latencies) if self._latencies else 0.0
+        if now - self._last_decrease < baseline:
+            return
+
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(float(self.config.min_limit), self._limit * self.config.decrease_factor)
+        if self.limit != previous:
+            logger.debug("Concurrency limit lowered: %d -> %d", previous, self.limit)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+class ConcurrencyLimiter:
+    """Maps each key to its own `AdaptiveLimiter`.
+
+    A limit cut on one domain never throttles requests to another.
+
+    Args:
+        config: `ConcurrencyConfig` applied to each new limiter.
+    """
+
+    def __init__(self, config: ConcurrencyConfig):
+        self.config = config
+        self._limiters: dict[Hashable, AdaptiveLimiter] = {}
+
+    def limiter(self, key: Hashable) -> AdaptiveLimiter:
+        """Return the limiter for `key`, creating it on first use."""
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveLimiter(self.config)
+            self._limiters[key] = limiter
+        return limiter
+
+    def items(self) -> list[tuple[Hashable, AdaptiveLimiter]]:
+        """Return `(key, limiter)` pairs in creation order."""
+        return list(self._limiters.items())
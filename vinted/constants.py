@@ -58,15 +58,20 @@ LOCALE_TO_ACCEPT_LANGUAGE = {
 }
 
 VINTED_BASE_URL_TEMPLATE = "https://www.vinted.{locale}"
+CATALOG_API_PATH = "/api/v2/catalog/items"
 
 SortOrder = Literal["newest_first", "relevance", "price_high_to_low", "price_low_to_high"]
 
-StorageFormat = Literal["json", "pickle", "mozilla"]
+StorageFormat = Literal["json", "pickle", "mozilla", "sqlite"]
+
+HttpVersion = Literal["v1", "v2", "v2tls", "v3"]
 
 HTTP_STATUS_OK = 200
 HTTP_STATUS_UNAUTHORIZED = 401
 HTTP_STATUS_FORBIDDEN = 403
+HTTP_STATUS_NOT_FOUND = 404
 HTTP_STATUS_RATE_LIMIT = 429
+HTTP_STATUS_SERVER_ERROR = 500
 
 
 DEFAULT_HEADERS = {
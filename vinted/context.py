@@ -0,0 +1,69 @@
+"""Per-domain session state.
+
+`HttpSession` keeps one `SessionContext` per Vinted host so requests to
+different domains (vinted.fr, vinted.de, ...) never rewrite each other's
+headers or token state. Contexts are created lazily and their headers
+are computed once.
+"""
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from curl_cffi import AsyncSession
+
+from .auth import AuthManager
+from .utils import cookie_domain_matches, extract_locale, get_accept_language
+
+
+@dataclass(eq=False)
+class SessionContext:
+    """Headers, token inspection and refresh state for a single host.
+
+    Attributes:
+        netloc: Host (and optional port) this context serves.
+        base_url: `https://<netloc>` used for cookie refreshes.
+        locale: Vinted locale derived from the host, e.g. `fr` or `co.uk`.
+        headers: Read-only per-request headers (Accept-Language, Referer).
+        refresh_headers: Read-only headers used for the cookie refresh HEAD.
+        auth: `AuthManager` scoped to this host's cookies.
+        generation: Incremented every time this host's cookies are refreshed.
+        refresh_task: In-flight request-path refresh shared by waiters.
+        renew_task: Background task renewing cookies ahead of token expiry.
+    """
+
+    netloc: str
+    base_url: str
+    locale: str | None
+    headers: Mapping[str, str]
+    refresh_headers: Mapping[str, str]
+    auth: AuthManager
+    generation: int = 0
+    refresh_task: "asyncio.Task[None] | None" = field(default=None, repr=False)
+    renew_task: "asyncio.Task[None] | None" = field(default=None, repr=False)
+
+    @classmethod
+    def create(
+        cls, netloc: str, session: AsyncSession, token_skew: float = 0.0
+    ) -> "SessionContext":
+        """Build a context for `netloc` backed by the shared `session` jar."""
+        base_url = f"https://{netloc}"
+        locale = extract_locale(netloc)
+
+        headers = {"Referer": base_url}
+        if locale:
+            headers["Accept-Language"] = get_accept_language(locale)
+
+        return cls(
+            netloc=netloc,
+            base_url=base_url,
+            locale=locale,
+            headers=MappingProxyType(headers),
+            refresh_headers=MappingProxyType({**headers, "Referer": ""}),
+            auth=AuthManager(session, domain=netloc.split(":")[0], skew=token_skew),
+        )
+
+    def owns_cookie(self, cookie_domain: str) -> bool:
+        """Return True when a cookie scoped to `cookie_domain` belongs here."""
+        return cookie_domain_matches(self.netloc.split(":")[0], cookie_domain)
@@ -36,6 +36,14 @@ class VintedAuthError(VintedAPIError):
     """Authentication related API errors (e.g. invalid or expired token)."""
 
 
+class VintedNotFoundError(VintedAPIError):
+    """Raised when an item does not exist, was deleted or is no longer listed.
+
+    Covers HTTP 404 responses and item lookups answered with an empty
+    `item`; `status_code` is 404 in both cases.
+    """
+
+
 class VintedRateLimitError(VintedAPIError):
     """Raised when the remote API returns a rate-limit (HTTP 429)."""
 
@@ -53,6 +61,25 @@ class VintedNetworkError(VintedError):
         self.original_error = original_error
 
 
+class VintedCircuitOpenError(VintedError):
+    """Raised without sending a request while a host's circuit breaker is open.
+
+    Args:
+        message: Human readable error message.
+        netloc: Host whose breaker is open.
+        proxy: Proxy the breaker belongs to (None for a direct connection).
+        retry_after: Seconds until the breaker lets a probe request through.
+    """
+
+    def __init__(
+        self, message: str, netloc: str, proxy: str | None = None, retry_after: float = 0.0
+    ):
+        super().__init__(message)
+        self.netloc = netloc
+        self.proxy = proxy
+        self.retry_after = retry_after
+
+
 class VintedConfigError(VintedError):
     """Raised for invalid client configuration."""
 
@@ -1,4 +1,28 @@
-from .config import ClientConfig
+from .config import (
+    CacheConfig,
+    ClientConfig,
+    ConcurrencyConfig,
+    DiskCacheConfig,
+    HedgingConfig,
+    NegativeCacheConfig,
+    ProxyPoolConfig,
+    RateLimitConfig,
+    TransportConfig,
+    WatchConfig,
+)
 from .item import CatalogItem, DetailedItem
 
-__all__ = ["CatalogItem", "DetailedItem", "ClientConfig"]
+__all__ = [
+    "CacheConfig",
+    "CatalogItem",
+    "DetailedItem",
+    "ClientConfig",
+    "ConcurrencyConfig",
+    "DiskCacheConfig",
+    "HedgingConfig",
+    "NegativeCacheConfig",
+    "ProxyPoolConfig",
+    "RateLimitConfig",
+    "TransportConfig",
+    "WatchConfig",
+]
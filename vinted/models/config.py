@@ -1,13 +1,236 @@
-"""Configuration dataclass for `VintedClient`.
+"""Configuration dataclasses for `VintedClient`.
 
-This module provides a small container for client configuration
-options such as proxy, cookie storage directory and format.
+This module provides small containers for client configuration
+options such as proxies, cookie storage directory and format, proxy
+pool health tuning and transport settings.
 """
 
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from ..constants import StorageFormat
+from ..breaker import CircuitBreakerConfig
+from ..cache.base import CacheBackend
+from ..constants import HttpVersion, StorageFormat
+from ..retry import RetryPolicy
+
+
+@dataclass
+class ProxyPoolConfig:
+    """Health scoring and quarantine settings for a proxy pool.
+
+    Attributes:
+        ewma_alpha: Weight of the newest sample in latency/error averages.
+        quarantine_error_rate: Error rate (0..1) at which a proxy is benched.
+        min_requests: Requests a proxy must serve before it can be benched.
+        quarantine_seconds: Cool-down before a benched proxy is tried again.
+    """
+
+    ewma_alpha: float = 0.2
+    quarantine_error_rate: float = 0.5
+    min_requests: int = 5
+    quarantine_seconds: float = 60.0
+
+
+@dataclass
+class CacheConfig:
+    """Response cache settings for item details and catalog pages.
+
+    Attributes:
+        item_ttl: Seconds an item details response stays fresh; 0 disables it.
+        catalog_ttl: Seconds a catalog page stays fresh; 0 disables it.
+        max_entries: Entry limit of the default in-memory backend.
+        max_bytes: Byte limit of the default in-memory backend.
+        backend: Optional `CacheBackend` to use instead of the default
+            `MemoryCache`.
+    """
+
+    item_ttl: float = 300.0
+    catalog_ttl: float = 30.0
+    max_entries: int = 1024
+    max_bytes: int = 32 * 1024 * 1024
+    backend: CacheBackend | None = field(default=None, repr=False)
+
+
+@dataclass
+class NegativeCacheConfig:
+    """Memory of item lookups that found nothing.
+
+    Attributes:
+        ttl: Seconds a missing item is answered without a request.
+        max_entries: Missing items remembered; least recently used are dropped.
+    """
+
+    ttl: float = 600.0
+    max_entries: int = 10_000
+
+
+@dataclass
+class DiskCacheConfig:
+    """Persistent SQLite cache for successful HTTP responses.
+
+    Catalog searches go stale much faster than item details, so they get
+    their own, short TTL; their cache key ignores the `time` snapshot.
+
+    Attributes:
+        path: SQLite file; defaults to `responses.sqlite3` in `cookies_dir`.
+        ttl: Seconds a stored item details (or other) response stays fresh.
+        catalog_ttl: Seconds a stored catalog page stays fresh; 0 keeps
+            catalog pages out of the cache. Raise it to record searches
+            for offline replay.
+        max_bytes: Size cap for compressed bodies; least recently used
+            entries are evicted beyond it.
+        offline: Serve only from the cache (ignoring TTLs) and never touch
+            the network; misses raise `VintedNetworkError`.
+    """
+
+    path: Path | None = None
+    ttl: float = 3600.0
+    catalog_ttl: float = 30.0
+    max_bytes: int = 256 * 1024 * 1024
+    offline: bool = False
+
+
+@dataclass
+class ConcurrencyConfig:
+    """Adaptive (AIMD) in-flight request limit per proxy and Vinted domain.
+
+    The limit grows by `increase` per window of healthy responses and is
+    multiplied by `decrease_factor` on 403/429 responses, network errors
+    or latency above `latency_tolerance` times the best recent latency.
+
+    Attributes:
+        initial_limit: In-flight requests allowed before any feedback.
+        min_limit: Lower bound for the limit.
+        max_limit: Upper bound for the limit.
+        increase: Additive increase per limit's worth of healthy responses.
+        decrease_factor: Multiplier applied to the limit on overload (0..1).
+        latency_tolerance: Latency, as a multiple of the baseline, treated
+            as overload.
+        latency_window: Recent latencies the baseline (minimum) is taken from.
+    """
+
+    initial_limit: int = 8
+    min_limit: int = 1
+    max_limit: int = 64
+    increase: float = 1.0
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+    latency_window: int = 100
+
+
+@dataclass
+class HedgingConfig:
+    """Hedged request settings for item detail lookups.
+
+    When the first attempt has not answered within the hedge delay, an
+    identical request is sent through a different proxy session; the
+    first response wins and the other attempt is cancelled.
+
+    Attributes:
+        delay: Fixed hedge delay in seconds; when None the delay follows
+            the observed latency `percentile`.
+        percentile: Latency percentile (0..1) used as the delay once
+            `min_samples` latencies have been observed.
+        min_samples: Observed latencies required before `percentile` is used.
+        fallback_delay: Delay used until enough latencies are observed.
+        max_hedge_rate: Hedges allowed per request, averaged over time
+            (0.1 = at most ~10% extra load).
+        hedge_reserve: Hedges available up front and the most that can be banked.
+    """
+
+    delay: float | None = None
+    percentile: float = 0.95
+    min_samples: int = 20
+    fallback_delay: float = 1.0
+    max_hedge_rate: float = 0.1
+    hedge_reserve: int = 5
+
+
+@dataclass
+class RateLimitConfig:
+    """Token bucket pacing applied per proxy and Vinted domain.
+
+    Attributes:
+        rate: Sustained requests per second.
+        burst: Requests that may be sent back-to-back before pacing kicks in.
+        max_wait: Total seconds a request may spend waiting out 429
+            `Retry-After` pauses before `VintedRateLimitError` is raised.
+        default_retry_after: Pause used when a 429 carries no `Retry-After`.
+    """
+
+    rate: float = 5.0
+    burst: int = 10
+    max_wait: float = 60.0
+    default_retry_after: float = 5.0
+
+
+@dataclass
+class WatchConfig:
+    """New-listing watcher settings for `VintedClient.watch()`.
+
+    The poll interval follows the observed rate of new listings: it is
+    chosen so that roughly `items_per_poll` new items arrive between two
+    polls, shrinks at once when listings speed up and grows by at most
+    `backoff` per poll while the search is quiet.
+
+    Attributes:
+        capacity: Item ids remembered for deduplication; the oldest are
+            forgotten first.
+        per_page: Items fetched per page.
+        max_pages: Pages fetched in one poll while every item is unseen,
+            so a burst of listings between polls is not cut off.
+        min_interval: Shortest pause between polls, in seconds.
+        max_interval: Longest pause between polls, in seconds.
+        items_per_poll: New items the interval aims to collect per poll.
+        smoothing: Weight (0..1) of the latest poll in the arrival rate estimate.
+        backoff: Factor the interval may grow by per quiet or failed poll.
+        include_existing: Yield the items of the first poll too instead
+            of only remembering them.
+    """
+
+    capacity: int = 10_000
+    per_page: int = 96
+    max_pages: int = 3
+    min_interval: float = 2.0
+    max_interval: float = 60.0
+    items_per_poll: float = 1.0
+    smoothing: float = 0.3
+    backoff: float = 1.5
+    include_existing: bool = False
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool, keep-alive and protocol settings for a session.
+
+    `None` leaves the corresponding libcurl default in place. The defaults
+    match the previous behaviour: ten concurrent transfers, a 30 second
+    overall timeout and whatever protocol the impersonated browser picks.
+
+    Attributes:
+        max_clients: Concurrent transfers per session; extra requests queue.
+        pool_size: Idle connections kept open for reuse (libcurl `MAXCONNECTS`).
+        max_host_connections: Open connections allowed per host; 0 = unlimited.
+        http_version: Preferred protocol, e.g. `"v2"` to multiplex requests
+            over one connection or `"v1"` to force HTTP/1.1.
+        connect_timeout: Seconds allowed for DNS, TCP and TLS setup.
+        read_timeout: Seconds allowed for the rest of the request once connected.
+        dns_cache_ttl: Seconds a resolved address is reused; -1 caches forever.
+        keep_alive: Send TCP keep-alive probes on idle connections.
+        keep_alive_idle: Idle seconds before the first keep-alive probe.
+        keep_alive_interval: Seconds between keep-alive probes once they started.
+    """
+
+    max_clients: int = 10
+    pool_size: int | None = None
+    max_host_connections: int | None = None
+    http_version: HttpVersion | None = None
+    connect_timeout: float = 10.0
+    read_timeout: float = 20.0
+    dns_cache_ttl: int = 60
+    keep_alive: bool = True
+    keep_alive_idle: int = 60
+    keep_alive_interval: int = 60
 
 
 @dataclass
@@ -16,15 +239,54 @@ class ClientConfig:
 
     Attributes:
         proxy: Optional proxy string in format `user:pass@host:port`.
+        proxies: Additional proxies; each gets its own session and cookies.
         cookies_dir: Directory where cookie files will be stored.
         persist_cookies: Whether to persist cookies to disk.
         storage_format: One of the supported `StorageFormat` literals.
+        proxy_pool: Health scoring settings used when several proxies exist.
+        rate_limit: Optional request pacing; disabled when None.
+        retry: Optional retry policy for transient failures; disabled when None.
+        renew_margin: Seconds before token expiry at which cookies are renewed
+            in the background; disabled when None.
+        token_skew: Seconds before token expiry at which the token is treated
+            as expired on the request path.
+        transport: Connection pool, timeout and HTTP version settings.
+        coalesce_requests: Share one in-flight request between identical GETs.
+        circuit_breaker: Optional fail-fast settings per proxy and domain;
+            disabled when None.
+        hedging: Optional hedged requests for item details; disabled when None.
+        concurrency: Optional adaptive in-flight limit per proxy and domain;
+            disabled when None.
+        cache: Optional response cache for item details and catalog pages;
+            disabled when None.
+        disk_cache: Optional persistent SQLite response cache; disabled when None.
+        negative_cache: Optional memory of missing items; disabled when None.
+        cookie_save_delay: Seconds persisted cookie changes are held and
+            coalesced before a write-behind save; None saves immediately.
+        share_cookies: Refresh persisted cookies under a per-proxy lock file
+            shared with other processes using the same `cookies_dir`.
     """
 
     proxy: str | None = None
+    proxies: list[str] = field(default_factory=list)
     cookies_dir: Path = field(default_factory=lambda: Path("."))
     persist_cookies: bool = False
     storage_format: StorageFormat = "json"
+    proxy_pool: ProxyPoolConfig = field(default_factory=ProxyPoolConfig)
+    rate_limit: RateLimitConfig | None = None
+    retry: RetryPolicy | None = None
+    renew_margin: float | None = None
+    token_skew: float = 0.0
+    transport: TransportConfig = field(default_factory=TransportConfig)
+    coalesce_requests: bool = True
+    circuit_breaker: CircuitBreakerConfig | None = None
+    hedging: HedgingConfig | None = None
+    concurrency: ConcurrencyConfig | None = None
+    cache: CacheConfig | None = None
+    disk_cache: DiskCacheConfig | None = None
+    negative_cache: NegativeCacheConfig | None = None
+    cookie_save_delay: float | None = 1.0
+    share_cookies: bool = False
 
     def __post_init__(self):
         """Normalize and prepare filesystem state.
@@ -36,3 +298,10 @@ class ClientConfig:
             self.cookies_dir = Path(self.cookies_dir)
 
         self.cookies_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def proxy_list(self) -> list[str | None]:
+        """Return every configured proxy once, or `[None]` for a direct connection."""
+        combined = ([self.proxy] if self.proxy else []) + list(self.proxies)
+        unique: list[str | None] = list(dict.fromkeys(combined))
+        return unique or [None]
@@ -0,0 +1,360 @@
+"""Proxy pool built from per-proxy `HttpSession` instances.
+
+`SessionPool` spreads requests over several sessions (one per proxy,
+each with its own `curl_cffi` session and cookie identity) using live
+health scores derived from latency, 403/429/5xx responses and network
+errors. Proxies whose error rate crosses the configured threshold are
+quarantined for a cool-down period.
+
+With a `HedgingConfig`, hedged requests send a second copy of a slow
+request through another proxy and keep whichever answers first.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from urllib.parse import urlparse
+
+from curl_cffi.requests import Response
+
+from .coalesce import RequestCoalescer
+from .constants import HTTP_STATUS_FORBIDDEN, HTTP_STATUS_RATE_LIMIT, HTTP_STATUS_SERVER_ERROR
+from .exceptions import VintedAPIError, VintedCircuitOpenError, VintedNetworkError
+from .models.config import HedgingConfig, ProxyPoolConfig
+from .retry import RetryBudget
+from .session import CachedResponse, HttpSession
+from .utils import format_proxy_for_log
+
+logger = logging.getLogger(__name__)
+
+HEDGE_LATENCY_SAMPLES = 200
+
+
+@dataclass
+class ProxyStats:
+    """Live health counters for a single proxy.
+
+    Attributes:
+        proxy: Proxy string (or None for a direct connection).
+        requests: Total requests routed through the proxy.
+        successes: Requests that reached Vinted (any reply but 403, 429 and 5xx).
+        blocked: HTTP 403 responses.
+        rate_limited: HTTP 429 responses.
+        server_errors: HTTP 5xx responses (502/503 from a bad proxy included).
+        network_errors: Transport failures (timeouts, resets, ...).
+        latency: Exponentially weighted average latency in seconds.
+        error_rate: Exponentially weighted share of failed requests (0..1).
+        quarantined_until: Monotonic timestamp until which the proxy is benched.
+        quarantines: Number of times the proxy has been quarantined.
+    """
+
+    proxy: str | None
+    requests: int = 0
+    successes: int = 0
+    blocked: int = 0
+    rate_limited: int = 0
+    server_errors: int = 0
+    network_errors: int = 0
+    latency: float = 0.0
+    error_rate: float = 0.0
+    quarantined_until: float = 0.0
+    quarantines: int = 0
+
+    @property
+    def score(self) -> float:
+        """Return a health score; higher is better, new proxies score 1.0."""
+        return (1.0 - self.error_rate) / (1.0 + self.latency)
+
+    def is_quarantined(self, now: float | None = None) -> bool:
+        """Return True while the proxy is inside its cool-down window."""
+        return (now if now is not None else time.monotonic()) < self.quarantined_until
+
+
+class SessionPool:
+    """Dispatch requests across per-proxy sessions by health score.
+
+    With a single session the pool is a thin pass-through that still
+    records stats. With several, each request picks the healthier of two
+    random non-quarantined sessions ("power of two choices").
+
+    Identical in-flight GETs are coalesced before a session is picked, so
+    duplicates are not spread over several proxies.
+
+    Requests made with `hedge=True` are hedged when `hedging` is set and
+    the pool has another usable session: if the first attempt is still
+    running after the hedge delay, a copy goes out through a different
+    session and the slower attempt is cancelled. A budget caps hedges at
+    `max_hedge_rate` of hedgeable requests.
+
+    Args:
+        sessions: One `HttpSession` per proxy; must not be empty.
+        config: Optional `ProxyPoolConfig` with scoring/quarantine tuning.
+        coalesce: Share one in-flight request between identical GETs.
+        hedging: Optional `HedgingConfig`; no hedging when None.
+    """
+
+    def __init__(
+        self,
+        sessions: list[HttpSession],
+        config: ProxyPoolConfig | None = None,
+        coalesce: bool = True,
+        hedging: HedgingConfig | None = None,
+    ):
+        if not sessions:
+            raise ValueError("SessionPool requires at least one session")
+
+        self.sessions = sessions
+        self.config = config or ProxyPoolConfig()
+        self.hedging = hedging
+        self._coalescer = RequestCoalescer() if coalesce else None
+        self._stats = {id(session): ProxyStats(proxy=session.proxy) for session in sessions}
+
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._hedge_latencies: deque[float] = deque(maxlen=HEDGE_LATENCY_SAMPLES)
+        self._hedge_budget = (
+            RetryBudget(ratio=hedging.max_hedge_rate, reserve=hedging.hedge_reserve)
+            if hedging
+            else None
+        )
+
+    def select(self, exclude: HttpSession | None = None, netloc: str | None = None) -> HttpSession:
+        """Return the session that should serve the next request.
+
+        With a `netloc`, sessions whose circuit breaker for that host is
+        open are skipped while other sessions are usable.
+        """
+        if len(self.sessions) == 1:
+            return self.sessions[0]
+
+        now = time.monotonic()
+        available = [
+            s
+            for s in self.sessions
+            if s is not exclude
+            and not self._stats[id(s)].is_quarantined(now)
+            and not (netloc and s.circuit_open(netloc))
+        ]
+
+        if not available:
+            return min(self.sessions, key=lambda s: self._stats[id(s)].quarantined_until)
+        if len(available) == 1:
+            return available[0]
+
+        first, second = random.sample(available, 2)
+        if self._stats[id(first)].score >= self._stats[id(second)].score:
+            return first
+        return second
+
+    async def request(
+        self,
+        url: str,
+        params: dict | None = None,
+        hedge: bool = False,
+        use_cache: bool = True,
+    ) -> Response:
+        """Perform a GET through the selected session and record its outcome.
+
+        With `hedge=True` the request may be hedged (see class docstring).
+        With `use_cache=False` the sessions' response cache is bypassed.
+        """
+        if self._coalescer:
+            return await self._coalescer.run(
+                url, params, lambda: self._request(url, params, hedge, use_cache)
+            )
+        return await self._request(url, params, hedge, use_cache)
+
+    async def _request(
+        self, url: str, params: dict | None, hedge: bool = False, use_cache: bool = True
+    ) -> Response:
+        if hedge and self._hedge_budget is not None:
+            return await self._hedged_request(url, params, self._hedge_budget, use_cache)
+
+        session = self.select(netloc=urlparse(url).netloc)
+        return await self._send_or_fail_over(session, url, params, use_cache)
+
+    async def _hedged_request(
+        self, url: str, params: dict | None, budget: RetryBudget, use_cache: bool = True
+    ) -> Response:
+        budget.deposit()
+
+        started = time.monotonic()
+        delay = self.hedge_delay()
+        primary_session = self.select(netloc=urlparse(url).netloc)
+        primary = asyncio.create_task(
+            self._send_or_fail_over(primary_session, url, params, use_cache)
+        )
+        attempts = [primary]
+
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                backup_session = self._hedge_target(primary_session, urlparse(url).netloc)
+                if backup_session is not None and budget.try_spend():
+                    self.hedges += 1
+                    logger.debug("Hedging slow request via another proxy: %s", url)
+                    attempts.append(
+                        asyncio.create_task(self._send(backup_session, url, params, use_cache))
+                    )
+
+            winner = await _first_success(attempts)
+            if winner is not primary:
+                self.hedge_wins += 1
+            response = winner.result()
+            self._record_hedge_latency(primary, response, time.monotonic() - started, delay)
+            return response
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    def _record_hedge_latency(
+        self, primary: "asyncio.Task[Response]", response: Response, elapsed: float, delay: float
+    ) -> None:
+        """Sample how long the primary attempt took, for the hedge delay percentile.
+
+        A primary that lost or is about to be cancelled would have taken
+        at least `elapsed` (and at least the hedge delay), so it is
+        sampled as such rather than replaced by the winner's shorter
+        time. Failed primaries and cache hits say nothing about network
+        latency and are skipped.
+        """
+        if isinstance(response, CachedResponse):
+            return
+        if primary.done() and (primary.cancelled() or primary.exception() is not None):
+            return
+        self._hedge_latencies.append(elapsed if primary.done() else max(elapsed, delay))
+
+    def hedge_delay(self) -> float:
+        """Return how long a hedged request waits before sending its copy."""
+        if self.hedging is None:
+            return 0.0
+        if self.hedging.delay is not None:
+            return self.hedging.delay
+        if len(self._hedge_latencies) < self.hedging.min_samples:
+            return self.hedging.fallback_delay
+
+        ordered = sorted(self._hedge_latencies)
+        index = min(len(ordered) - 1, int(self.hedging.percentile * len(ordered)))
+        return ordered[index]
+
+    def _hedge_target(self, primary: HttpSession, netloc: str) -> HttpSession | None:
+        """Return a different usable session for a hedge, or None."""
+        backup = self.select(exclude=primary, netloc=netloc)
+        if backup is primary or self._stats[id(backup)].is_quarantined():
+            return None
+        return backup
+
+    async def _send_or_fail_over(
+        self, session: HttpSession, url: str, params: dict | None, use_cache: bool = True
+    ) -> Response:
+        try:
+            return await self._send(session, url, params, use_cache)
+        except VintedCircuitOpenError:
+            # Another proxy may still reach the host; fail over once.
+            netloc = urlparse(url).netloc
+            backup = self.select(exclude=session, netloc=netloc)
+            if backup is session or backup.circuit_open(netloc):
+                raise
+            logger.debug("Circuit open via %s, failing over", format_proxy_for_log(session.proxy))
+            return await self._send(backup, url, params, use_cache)
+
+    async def _send(
+        self, session: HttpSession, url: str, params: dict | None, use_cache: bool = True
+    ) -> Response:
+        started = time.monotonic()
+
+        try:
+            response = await session.request(url, params=params, use_cache=use_cache)
+        except VintedAPIError as e:
+            if e.status_code in (HTTP_STATUS_FORBIDDEN, HTTP_STATUS_RATE_LIMIT) or (
+                e.status_code is not None and e.status_code >= HTTP_STATUS_SERVER_ERROR
+            ):
+                self._record_failure(session, e.status_code)
+            else:
+                self._record_success(session, time.monotonic() - started)
+            raise
+        except VintedNetworkError:
+            # An offline cache miss never reached the proxy.
+            if not session.offline:
+                self._record_failure(session, None)
+            raise
+
+        self._record_success(session, time.monotonic() - started)
+        return response
+
+    def stats(self) -> list[ProxyStats]:
+        """Return a snapshot of per-proxy stats, in session order."""
+        return [replace(self._stats[id(session)]) for session in self.sessions]
+
+    def _record_success(self, session: HttpSession, latency: float) -> None:
+        stats = self._stats[id(session)]
+        alpha = self.config.ewma_alpha
+
+        stats.requests += 1
+        stats.successes += 1
+        stats.latency = latency if stats.successes == 1 else _ewma(stats.latency, latency, alpha)
+        stats.error_rate = _ewma(stats.error_rate, 0.0, alpha)
+
+    def _record_failure(self, session: HttpSession, status_code: int | None) -> None:
+        stats = self._stats[id(session)]
+
+        stats.requests += 1
+        if status_code == HTTP_STATUS_FORBIDDEN:
+            stats.blocked += 1
+        elif status_code == HTTP_STATUS_RATE_LIMIT:
+            stats.rate_limited += 1
+        elif status_code is not None:
+            stats.server_errors += 1
+        else:
+            stats.network_errors += 1
+        stats.error_rate = _ewma(stats.error_rate, 1.0, self.config.ewma_alpha)
+
+        if (
+            len(self.sessions) > 1
+            and stats.requests >= self.config.min_requests
+            and stats.error_rate >= self.config.quarantine_error_rate
+        ):
+            self._quarantine(stats)
+
+    def _quarantine(self, stats: ProxyStats) -> None:
+        stats.quarantined_until = time.monotonic() + self.config.quarantine_seconds
+        stats.quarantines += 1
+        # Come back on probation: a couple more failures bench the proxy again.
+        stats.error_rate = self.config.quarantine_error_rate / 2
+        logger.warning(
+            "Proxy quarantined for %.0fs: %s",
+            self.config.quarantine_seconds,
+            format_proxy_for_log(stats.proxy),
+        )
+
+    async def close(self) -> None:
+        """Close every session in the pool."""
+        for session in self.sessions:
+            await session.close()
+
+
+async def _first_success(
+    attempts: "list[asyncio.Task[Response]]",
+) -> "asyncio.Task[Response]":
+    """Return the first attempt to succeed, or raise the first error if all fail."""
+    pending = set(attempts)
+    errors: list[BaseException] = []
+
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in attempts:
+            if task not in done:
+                continue
+            exception = task.exception()
+            if exception is None:
+                return task
+            errors.append(exception)
+
+    raise errors[0]
+
+
+def _ewma(previous: float, sample: float, alpha: float) -> float:
+    return alpha * sample + (1.0 - alpha) * previous
@@ -0,0 +1,97 @@
+"""Client-side request pacing.
+
+A `TokenBucket` allows `burst` requests at once and refills at `rate`
+requests per second. A 429 `Retry-After` pauses only the bucket of the
+host that sent it, leaving other Vinted domains unaffected.
+"""
+
+import asyncio
+import time
+from collections.abc import Hashable
+
+from .models.config import RateLimitConfig
+
+
+class TokenBucket:
+    """Token bucket with support for temporary pauses.
+
+    Tokens may go negative: every caller reserves its slot immediately and
+    sleeps for its share of the deficit, which keeps waiters in FIFO order
+    without an explicit queue.
+
+    Args:
+        rate: Sustained requests per second.
+        burst: Maximum number of tokens the bucket can hold.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def reserve(self, now: float | None = None) -> float:
+        """Take one token and return the delay (seconds) before it may be used."""
+        now = time.monotonic() if now is None else now
+
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated = max(self._updated, now)
+        self._tokens -= 1
+
+        # Refill starts at `_updated`, which lies in the future while paused.
+        deficit = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(0.0, self._updated - now) + deficit
+
+    def pause(self, seconds: float, now: float | None = None) -> None:
+        """Hold back every request on this bucket for `seconds`."""
+        now = time.monotonic() if now is None else now
+
+        self._paused_until = max(self._paused_until, now + seconds)
+        # Resume with a single request instead of a burst of saved-up tokens.
+        self._tokens = min(self._tokens, 1.0)
+        self._updated = max(self._updated, self._paused_until)
+
+    @property
+    def paused_for(self) -> float:
+        """Return the remaining pause in seconds (0 when not paused)."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, honouring pauses set meanwhile."""
+        delay = self.reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._paused_until - time.monotonic()
+
+
+class RateLimiter:
+    """One `TokenBucket` per host, built on the first request to it.
+
+    Args:
+        config: `RateLimitConfig` every bucket is created from.
+    """
+
+    def __init__(self, config: RateLimitConfig):
+        self.config = config
+        self._buckets: dict[Hashable, TokenBucket] = {}
+
+    def bucket(self, key: Hashable) -> TokenBucket:
+        """Return the bucket for `key`, creating it on first use."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.config.rate, self.config.burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, key: Hashable) -> None:
+        """Wait for a token on the bucket for `key`."""
+        await self.bucket(key).acquire()
+
+    def pause(self, key: Hashable, seconds: float) -> None:
+        """Pause only the bucket for `key`, e.g. after a 429 response."""
+        self.bucket(key).pause(seconds)
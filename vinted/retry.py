@@ -0,0 +1,105 @@
+"""Retry policy for idempotent GET requests.
+
+`RetryPolicy` decides which failures are transient and how long to back
+off (capped exponential backoff with full jitter). `RetryBudget` caps
+retries to a fraction of overall traffic so that retries cannot amplify
+an outage; a single budget is shared by every session of a client.
+"""
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .exceptions import VintedAPIError, VintedNetworkError
+
+
+@dataclass(frozen=True)
+class RetryAttempt:
+    """Information passed to `RetryPolicy.on_retry` before each retry.
+
+    Attributes:
+        attempt: Number of the attempt about to be made (2 for the first retry).
+        delay: Backoff in seconds before that attempt.
+        url: Requested URL.
+        error: The failure that triggered the retry.
+    """
+
+    attempt: int
+    delay: float
+    url: str
+    error: Exception
+
+
+@dataclass
+class RetryPolicy:
+    """Which failures to retry and how to back off between attempts.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first one.
+        retry_statuses: HTTP status codes treated as transient.
+        retry_exceptions: Exception types treated as transient.
+        base_delay: Backoff cap (seconds) for the first retry; doubles each time.
+        max_delay: Upper bound for any single backoff.
+        budget_ratio: Retries allowed per request, averaged over time (0.1 = 10%).
+        budget_reserve: Retries available up front and the most that can be banked.
+        on_retry: Optional hook called with a `RetryAttempt` before each retry.
+    """
+
+    max_attempts: int = 3
+    retry_statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+    retry_exceptions: tuple[type[Exception], ...] = (VintedNetworkError,)
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    budget_ratio: float = 0.1
+    budget_reserve: int = 10
+    on_retry: Callable[[RetryAttempt], None] | None = field(default=None, repr=False)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Return True when `error` is a transient failure worth retrying."""
+        if isinstance(error, VintedAPIError):
+            return error.status_code in self.retry_statuses
+        return isinstance(error, self.retry_exceptions)
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter delay before `attempt` (2 = first retry)."""
+        cap = min(self.max_delay, self.base_delay * 2 ** max(0, attempt - 2))
+        return random.uniform(0, cap)
+
+
+class RetryBudget:
+    """Limit retries to a fraction of requests.
+
+    Every request deposits `ratio` tokens and every retry spends one. The
+    balance starts at, and never exceeds, `reserve`, so short bursts of
+    failures can still be retried while sustained failures are not.
+
+    Args:
+        ratio: Tokens deposited per request.
+        reserve: Initial and maximum balance.
+    """
+
+    def __init__(self, ratio: float = 0.1, reserve: int = 10):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = float(reserve)
+
+    @classmethod
+    def from_policy(cls, policy: RetryPolicy) -> "RetryBudget":
+        """Build a budget from a policy's `budget_ratio` and `budget_reserve`."""
+        return cls(ratio=policy.budget_ratio, reserve=policy.budget_reserve)
+
+    @property
+    def balance(self) -> float:
+        """Return the number of retries currently affordable."""
+        return self._balance
+
+    def deposit(self) -> None:
+        """Record a new request."""
+        self._balance = min(float(self.reserve), self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry; return False when the budget is exhausted."""
+        if self._balance < 1.0:
+            return False
+        self._balance -= 1.0
+        return True
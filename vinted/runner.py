@@ -0,0 +1,377 @@
+"""Multi-process crawling.
+
+A single process is bound by JSON parsing and model construction long
+before the network is saturated. `ShardedRunner` shards catalog URLs
+and item URLs across worker processes, each running its own
+`VintedClient`, and streams the results back to the parent over a
+bounded queue so slow consumers throttle the workers.
+
+Workers persist cookies to the same files and refresh them under a
+shared `FileLock`, so an expired token is refreshed by one worker and
+picked up by the rest. A `RateLimitConfig` is split evenly between the
+workers to keep the combined request rate where it was configured.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field, replace
+from typing import Any, Literal
+
+from .client import VintedClient
+from .exceptions import VintedError
+from .models.config import RateLimitConfig
+from .models.item import CatalogItem, DetailedItem
+
+logger = logging.getLogger(__name__)
+
+TaskKind = Literal["search", "item"]
+
+RESULT_POLL_INTERVAL = 0.5
+WORKER_JOIN_TIMEOUT = 5.0
+
+
+@dataclass(frozen=True)
+class RunnerResult:
+    """One finished task streamed back from a worker.
+
+    Errors cross the process boundary as text since library exceptions
+    carry responses and transport errors that do not pickle.
+
+    Attributes:
+        kind: `"search"` for a catalog URL, `"item"` for an item URL.
+        target: The URL the task was given.
+        worker: Index of the worker that ran the task.
+        data: Catalog items or item details; None when the task failed.
+        error: `"<ExceptionType>: <message>"` when the task failed.
+    """
+
+    kind: TaskKind
+    target: str
+    worker: int
+    data: list[CatalogItem] | DetailedItem | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the task succeeded."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class WorkerStats:
+    """Metrics reported by a worker when its shard is done.
+
+    Attributes:
+        worker: Worker index.
+        pid: Process id of the worker.
+        completed: Tasks that succeeded.
+        failed: Tasks that raised an error.
+        requests: HTTP requests sent through the worker's proxy pool.
+        elapsed: Seconds the worker spent on its shard.
+        crashed: True when the process died before reporting; `failed`
+            then counts the tasks it never returned.
+    """
+
+    worker: int
+    pid: int | None
+    completed: int
+    failed: int
+    requests: int
+    elapsed: float
+    crashed: bool = False
+
+
+@dataclass(frozen=True)
+class RunnerStats:
+    """Aggregated metrics of a `ShardedRunner.run()` call.
+
+    Attributes:
+        workers: Per-worker metrics, ordered by worker index.
+        elapsed: Wall-clock seconds of the whole run.
+    """
+
+    workers: list[WorkerStats] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def completed(self) -> int:
+        """Return the number of successful tasks across workers."""
+        return sum(w.completed for w in self.workers)
+
+    @property
+    def failed(self) -> int:
+        """Return the number of failed or lost tasks across workers."""
+        return sum(w.failed for w in self.workers)
+
+    @property
+    def requests(self) -> int:
+        """Return the number of HTTP requests sent by all workers."""
+        return sum(w.requests for w in self.workers)
+
+    @property
+    def tasks_per_second(self) -> float:
+        """Return finished tasks (successful or not) per second of wall time."""
+        if self.elapsed <= 0:
+            return 0.0
+        return (self.completed + self.failed) / self.elapsed
+
+
+class ShardedRunner:
+    """Run catalog searches and item lookups across worker processes.
+
+    Tasks are dealt round-robin into one shard per worker. Each worker
+    runs up to `concurrency` tasks at a time and blocks once `queue_size`
+    results are waiting for the parent, so memory stays bounded no
+    matter how slowly results are consumed.
+
+    Workers are started with the `spawn` method, so `client_options`
+    must be picklable (e.g. no lambdas in hooks) and the calling script
+    needs the usual `if __name__ == "__main__":` guard.
+
+    Args:
+        workers: Number of worker processes; defaults to the CPU count.
+        client_options: Keyword arguments for every worker's
+            `VintedClient`. Cookie persistence and the shared refresh
+            lock are switched on unless `persist_cookies` or
+            `share_cookies` is given, so workers share cookies.
+        concurrency: Tasks in flight per worker.
+        queue_size: Results buffered between workers and the parent.
+        per_page: Page size for catalog searches.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        client_options: dict[str, Any] | None = None,
+        concurrency: int = 16,
+        queue_size: int = 1000,
+        per_page: int = 20,
+    ):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.client_options = dict(client_options or {})
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(1, queue_size)
+        self.per_page = per_page
+        self._context = multiprocessing.get_context("spawn")
+        self._stats = RunnerStats()
+
+    def stats(self) -> RunnerStats:
+        """Return metrics of the last (or current) run."""
+        return self._stats
+
+    def worker_options(self) -> dict[str, Any]:
+        """Return the `VintedClient` keyword arguments used by each worker."""
+        options = dict(self.client_options)
+        options.setdefault("persist_cookies", True)
+        options.setdefault("share_cookies", True)
+
+        rate_limit: RateLimitConfig | None = options.get("rate_limit")
+        if rate_limit is not None:
+            options["rate_limit"] = replace(
+                rate_limit,
+                rate=rate_limit.rate / self.workers,
+                burst=max(1, rate_limit.burst // self.workers),
+            )
+        return options
+
+    async def run(
+        self, search_urls: Iterable[str] = (), item_urls: Iterable[str] = ()
+    ) -> AsyncIterator[RunnerResult]:
+        """Yield results for every search and item URL as workers finish them.
+
+        Results arrive in completion order, not input order. Leaving the
+        loop early terminates the workers.
+        """
+        tasks: list[tuple[TaskKind, str]] = [("search", url) for url in search_urls]
+        tasks += [("item", url) for url in item_urls]
+        shards = [s for s in (tasks[i :: self.workers] for i in range(self.workers)) if s]
+
+        started = time.monotonic()
+        self._stats = RunnerStats()
+        if not shards:
+            return
+
+        results = self._context.Queue(maxsize=self.queue_size)
+        options = self.worker_options()
+        processes = [
+            self._context.Process(
+                target=_worker_main,
+                args=(index, options, shard, results, self.concurrency, self.per_page),
+                daemon=True,
+            )
+            for index, shard in enumerate(shards)
+        ]
+        for process in processes:
+            process.start()
+        logger.info("Started %d workers for %d tasks", len(processes), len(tasks))
+
+        reported: dict[int, WorkerStats] = {}
+        returned = [0] * len(processes)
+        try:
+            while len(reported) < len(processes):
+                exited: list[int] = []
+                try:
+                    messages = [await asyncio.to_thread(results.get, True, RESULT_POLL_INTERVAL)]
+                except queue.Empty:
+                    exited = [
+                        index
+                        for index, process in enumerate(processes)
+                        if index not in reported and not process.is_alive()
+                    ]
+                    # A worker may flush its last results and stats and exit right
+                    # after the poll timed out; take them before calling it crashed.
+                    messages = _drain(results) if exited else []
+
+                for message in messages:
+                    if isinstance(message, WorkerStats):
+                        reported[message.worker] = message
+                        self._stats = RunnerStats(
+                            workers=sorted(reported.values(), key=lambda w: w.worker),
+                            elapsed=time.monotonic() - started,
+                        )
+                        continue
+
+                    returned[message.worker] += 1
+                    yield message
+
+                if exited:
+                    self._collect_crashed(exited, processes, shards, returned, reported, started)
+        finally:
+            for index, process in enumerate(processes):
+                if index not in reported:
+                    process.terminate()
+            await asyncio.gather(
+                *(asyncio.to_thread(p.join, WORKER_JOIN_TIMEOUT) for p in processes)
+            )
+            self._stats = replace(self._stats, elapsed=time.monotonic() - started)
+
+    def _collect_crashed(
+        self,
+        exited: list[int],
+        processes: list,
+        shards: list[list[tuple[TaskKind, str]]],
+        returned: list[int],
+        reported: dict[int, WorkerStats],
+        started: float,
+    ) -> None:
+        """Record exited workers whose stats never arrived as crashed.
+
+        Call only after the result queue was drained, so results and
+        stats sent just before a worker exited are not lost.
+        """
+        for index in exited:
+            if index in reported:
+                continue
+            process = processes[index]
+            logger.error("Worker %d exited with code %s", index, process.exitcode)
+            reported[index] = WorkerStats(
+                worker=index,
+                pid=process.pid,
+                completed=returned[index],
+                failed=len(shards[index]) - returned[index],
+                requests=0,
+                elapsed=time.monotonic() - started,
+                crashed=True,
+            )
+        self._stats = RunnerStats(
+            workers=sorted(reported.values(), key=lambda w: w.worker),
+            elapsed=time.monotonic() - started,
+        )
+
+
+def _drain(results: Any) -> list:
+    """Return every message currently waiting in `results` without blocking."""
+    messages = []
+    while True:
+        try:
+            messages.append(results.get_nowait())
+        except queue.Empty:
+            return messages
+
+
+def _worker_main(
+    worker: int,
+    options: dict[str, Any],
+    tasks: list[tuple[TaskKind, str]],
+    results: Any,
+    concurrency: int,
+    per_page: int,
+) -> None:
+    """Process entry point: run the shard and report the worker's stats."""
+    stats = asyncio.run(_work(worker, options, tasks, results, concurrency, per_page))
+    results.put(stats)
+
+
+async def _work(
+    worker: int,
+    options: dict[str, Any],
+    tasks: list[tuple[TaskKind, str]],
+    results: Any,
+    concurrency: int,
+    per_page: int,
+) -> WorkerStats:
+    """Run `tasks` on one client and forward each result to `results`.
+
+    Results pass through a small local queue to a single forwarder that
+    does the blocking `put`, so a full `results` queue pauses the
+    fetchers instead of piling up threads.
+    """
+    started = time.monotonic()
+    pending = iter(tasks)
+    outbox: asyncio.Queue[RunnerResult | None] = asyncio.Queue(maxsize=concurrency)
+    completed = failed = 0
+
+    async with VintedClient(**options) as client:
+
+        async def fetch_all() -> None:
+            nonlocal completed, failed
+            for kind, target in pending:
+                result = await _run_task(client, worker, kind, target, per_page)
+                if result.ok:
+                    completed += 1
+                else:
+                    failed += 1
+                await outbox.put(result)
+
+        async def forward() -> None:
+            while (result := await outbox.get()) is not None:
+                await asyncio.to_thread(results.put, result)
+
+        forwarder = asyncio.create_task(forward())
+        await asyncio.gather(*(fetch_all() for _ in range(concurrency)))
+        await outbox.put(None)
+        await forwarder
+
+        requests = sum(stats.requests for stats in client.proxy_stats())
+
+    return WorkerStats(
+        worker=worker,
+        pid=os.getpid(),
+        completed=completed,
+        failed=failed,
+        requests=requests,
+        elapsed=time.monotonic() - started,
+    )
+
+
+async def _run_task(
+    client: VintedClient, worker: int, kind: TaskKind, target: str, per_page: int
+) -> RunnerResult:
+    try:
+        data: Any
+        if kind == "search":
+            data = await client.search_items(target, per_page=per_page)
+        else:
+            data = await client.item_details(target)
+    except Exception as e:
+        # Any failure, not only library errors (e.g. an item URL without an
+        # id), is reported per task instead of taking down the whole shard.
+        if not isinstance(e, VintedError):
+            logger.warning("Worker %d failed on %s", worker, target, exc_info=True)
+        return RunnerResult(kind, target, worker, error=f"{type(e).__name__}: {e}")
+    return RunnerResult(kind, target, worker, data=data)
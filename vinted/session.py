@@ -5,26 +5,60 @@ This module exposes `HttpSession`, a thin wrapper around
 configuration and simple retry-on-auth semantics used by the library.
 """
 
+import asyncio
+import inspect
 import logging
+import time
+from collections.abc import Hashable
+from dataclasses import replace
+from http.cookiejar import Cookie
+from typing import Any
 from urllib.parse import urlparse
 
 from curl_cffi import AsyncSession
 from curl_cffi.requests import Response
 from curl_cffi.requests.exceptions import HTTPError as CurlHTTPError
 
-from vinted.exceptions import VintedAPIError, VintedAuthError, VintedNetworkError
+from vinted.exceptions import (
+    VintedAPIError,
+    VintedAuthError,
+    VintedError,
+    VintedNetworkError,
+    VintedNotFoundError,
+    VintedRateLimitError,
+)
 
-from .auth import AuthManager
+from .breaker import CircuitBreaker, CircuitBreakerConfig
+from .cache import CacheBackend, cache_key
+from .coalesce import RequestCoalescer
+from .concurrency import ConcurrencyLimiter, ConcurrencyStats
 from .constants import (
     DEFAULT_HEADERS,
     HTTP_STATUS_FORBIDDEN,
+    HTTP_STATUS_NOT_FOUND,
+    HTTP_STATUS_OK,
+    HTTP_STATUS_RATE_LIMIT,
     HTTP_STATUS_UNAUTHORIZED,
 )
-from .storage import CookieStorage
-from .utils import format_proxy_for_log, get_accept_language
+from .context import SessionContext
+from .models.config import ConcurrencyConfig, RateLimitConfig, TransportConfig
+from .ratelimit import RateLimiter
+from .retry import RetryAttempt, RetryBudget, RetryPolicy
+from .storage import CookieStorage, FileLock, StorageStats
+from .transport import TransportSession
+from .utils import format_proxy_for_log, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+RENEW_RETRY_DELAY = 30.0
+MIN_RENEW_INTERVAL = 60.0
+SLOW_STORAGE_CALL = 0.1
+REVISION_CHECK_INTERVAL = 1.0
+
+
+class CachedResponse(Response):
+    """`Response` rebuilt from the response cache instead of the network."""
+
 
 class HttpSession:
     """Session helper that manages cookies, headers and proxy settings.
@@ -34,26 +68,138 @@ class HttpSession:
     authentication token is expired, and perform GET requests with a
     minimal retry-on-auth flow.
 
+    Persisted cookies are read once and kept in memory; the storage is
+    only consulted again when its `revision()` changes on disk, which
+    requests check at most once per `REVISION_CHECK_INTERVAL`. Loads and
+    saves use the storage's async methods (`AsyncCookieStorage`) when it
+    has them, so file I/O runs off the event loop; `storage_stats()`
+    shows how long storage calls blocked the loop. Each
+    Vinted host gets its own lazily created `SessionContext` holding its
+    headers and token state, so one session can serve several domains
+    concurrently. Requests to a host that need fresh cookies share a
+    single in-flight refresh.
+
+    With a `rate_limit`, requests are paced by a token bucket per host and
+    a 429 pauses only that host's bucket for its `Retry-After`. Without
+    one, a 429 raises `VintedRateLimitError` immediately.
+
+    With a `retry` policy, transient failures (network errors and the
+    policy's status codes) are retried with jittered exponential backoff
+    as long as the `retry_budget` allows it.
+
+    Identical GETs (same URL and params, ignoring the volatile `time`
+    param) that overlap in time share a single request unless `coalesce`
+    is False.
+
+    With a `circuit_breaker`, each host gets a `CircuitBreaker`: once too
+    many recent attempts fail, requests to that host fail fast with
+    `VintedCircuitOpenError` until a probe request succeeds again.
+
+    With `concurrency`, in-flight requests per host are capped by an
+    AIMD limit that grows while responses are fast and healthy and shrinks
+    on 403/429 responses, network errors or rising latency.
+
+    With a `response_cache`, successful responses are stored under their
+    URL and params and served from the cache until their TTL runs out.
+    `response_cache_ttls` overrides the TTL per URL path prefix; a TTL of
+    0 keeps matching responses out of the cache. In
+    `offline` mode the network is never used and cache misses raise
+    `VintedNetworkError`.
+
+    With a `save_delay`, cookie saves are write-behind: changes are
+    collected and written by a background flusher at most once per delay,
+    keeping disk I/O off the request path. `close()` flushes what is left.
+
+    With a `refresh_lock`, request-path cookie refreshes are serialised
+    with other processes sharing the same cookie storage: whoever gets
+    the lock second adopts the freshly saved cookies instead of sending
+    its own refresh.
+
+    With a `renew_margin`, a background task per host renews cookies that
+    many seconds before the access token's `exp` claim. Fresh cookies are
+    fetched on a throwaway session and swapped into the jar in one step,
+    so in-flight requests keep using the old token until the swap.
+
     Args:
         proxy: Optional proxy host:port (without scheme).
         storage: Optional `CookieStorage` instance for persistence.
+        rate_limit: Optional `RateLimitConfig` enabling request pacing.
+        retry: Optional `RetryPolicy`; no retries when None.
+        retry_budget: Optional shared `RetryBudget`; built from `retry`
+            when omitted.
+        renew_margin: Optional seconds before token expiry at which cookies
+            are renewed in the background; disabled when None. Renewals
+            are at least `MIN_RENEW_INTERVAL` seconds apart, even when the
+            margin exceeds the token lifetime.
+        token_skew: Seconds before the `exp` claim at which a token is
+            already treated as expired.
+        transport: Optional `TransportConfig` with connection pool, timeout
+            and HTTP version settings; applied to renewal sessions too.
+        coalesce: Share one in-flight request between identical GETs.
+        circuit_breaker: Optional `CircuitBreakerConfig` enabling a breaker
+            per host; disabled when None.
+        concurrency: Optional `ConcurrencyConfig` enabling an adaptive
+            in-flight limit per host; disabled when None.
+        response_cache: Optional `CacheBackend` for successful responses.
+        response_cache_ttl: Seconds a cached response stays fresh.
+        response_cache_ttls: Optional TTLs by URL path prefix, e.g.
+            `{"/api/v2/catalog/items": 30}`; the longest match wins.
+        offline: Serve only from `response_cache`, never from the network.
+        refresh_lock: Optional `FileLock` shared with other processes using
+            the same `storage`.
+        save_delay: Optional seconds to hold cookie changes before writing
+            them; saves within that window are coalesced into one. None
+            writes on every change.
     """
 
     def __init__(
         self,
         proxy: str | None = None,
         storage: CookieStorage | None = None,
+        rate_limit: RateLimitConfig | None = None,
+        retry: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        renew_margin: float | None = None,
+        token_skew: float = 0.0,
+        transport: TransportConfig | None = None,
+        coalesce: bool = True,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        concurrency: ConcurrencyConfig | None = None,
+        response_cache: CacheBackend | None = None,
+        response_cache_ttl: float = 3600.0,
+        response_cache_ttls: dict[str, float] | None = None,
+        offline: bool = False,
+        refresh_lock: FileLock | None = None,
+        save_delay: float | None = None,
     ):
         self.proxy = proxy
-        self.base_url: str | None = None
-        self.locale: str | None = None
+        self.transport = transport or TransportConfig()
+        self.renew_margin = renew_margin
+        self.token_skew = token_skew
+        self.retry = retry
+        self._retry_budget = retry_budget or (RetryBudget.from_policy(retry) if retry else None)
 
-        self.session: AsyncSession = AsyncSession()
-        self.auth = AuthManager(self.session)
+        self.session: AsyncSession = self._create_async_session()
         self.storage = storage
-
-        self._init_headers()
-        self._configure_proxy()
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
+        self._coalescer = RequestCoalescer() if coalesce else None
+        self.circuit_breaker = circuit_breaker
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._concurrency = ConcurrencyLimiter(concurrency) if concurrency else None
+        self.response_cache = response_cache
+        self.response_cache_ttl = response_cache_ttl
+        self.response_cache_ttls = dict(response_cache_ttls or {})
+        self.offline = offline
+        self.refresh_lock = refresh_lock
+        self._storage_stats = StorageStats()
+        self.save_delay = save_delay
+        self._save_pending = False
+        self._flush_task: asyncio.Task[None] | None = None
+
+        self._contexts: dict[str, SessionContext] = {}
+        self._cookies_ready = False
+        self._cookies_revision: Hashable | None = None
+        self._revision_checked_at = float("-inf")
 
         logger.debug(
             "HttpSession initialized: proxy=%s, storage=%s",
@@ -61,90 +207,611 @@ class HttpSession:
             storage.__class__.__name__ if storage else None,
         )
 
-    def _init_headers(self) -> None:
-        self.session.headers.update(DEFAULT_HEADERS)
+    def _create_async_session(self) -> AsyncSession:
+        """Return a new `AsyncSession` with default headers, transport and proxy applied."""
+        session: AsyncSession = TransportSession(self.transport)
+        session.headers.update(DEFAULT_HEADERS)
 
-    def _configure_proxy(self) -> None:
         if self.proxy:
             proxy_url = f"http://{self.proxy}"
-            self.session.proxies.update(
+            session.proxies.update(
                 {
                     "http": proxy_url,
                     "https": proxy_url,
                 }
             )
+        return session
+
+    def get_context(self, url: str) -> SessionContext:
+        """Return the `SessionContext` for the host of `url`, creating it once."""
+        netloc = urlparse(url).netloc
+        if not netloc:
+            raise VintedAPIError(f"Cannot derive a Vinted host from URL: {url!r}")
+
+        context = self._contexts.get(netloc)
+        if context is None:
+            context = SessionContext.create(netloc, self.session, self.token_skew)
+            self._contexts[netloc] = context
+            logger.debug(
+                "Context created: base_url=%s, locale=%s", context.base_url, context.locale
+            )
+        return context
+
+    async def refresh_cookies(self, context: SessionContext) -> None:
+        logger.debug("Refreshing session cookies for %s...", context.netloc)
+
+        self._clear_cookies(context)
+
+        try:
+            response = await self.session.head(
+                context.base_url,
+                headers=context.refresh_headers,
+                impersonate="chrome",
+                verify=True,
+            )
+            response.raise_for_status()
+        except CurlHTTPError as e:
+            raise VintedNetworkError("Failed to refresh cookies", e)
+        except Exception as e:
+            raise VintedNetworkError("Network error during cookie refresh", e)
+
+        logger.debug("Fresh cookies received: %d cookies", len(self.session.cookies))
+
+        await self._commit_cookies(context)
+        self._cancel_renewal(context)
+
+        logger.info("Session cookies refreshed successfully for %s", context.netloc)
+
+    async def warm_up(self, url: str) -> None:
+        """Prepare the host of `url` so the first real request goes out at once.
+
+        Cookies are refreshed when missing or expired (joining any refresh
+        already in flight); otherwise a HEAD to the host's base URL opens the
+        connection, paying for DNS and the TLS handshake up front. Does
+        nothing in offline mode.
+        """
+        if self.offline:
+            return
+
+        context = self.get_context(url)
+        generation = context.generation
 
-    def configure_from_url(self, url: str) -> None:
-        parsed = urlparse(url)
-        self.base_url = f"https://{parsed.netloc}"
+        if not await self._load_cookies() or context.auth.is_token_expired():
+            await self._refresh_once(context, generation)
+        else:
+            try:
+                response = await self.session.head(
+                    context.base_url,
+                    headers=context.refresh_headers,
+                    impersonate="chrome",
+                    verify=True,
+                )
+                response.raise_for_status()
+            except Exception as e:
+                raise VintedNetworkError("Network error during warm-up", e)
 
-        domain_parts = parsed.netloc.split(".")
-        if len(domain_parts) > 1:
-            self.locale = domain_parts[-1]
-            accept_language = get_accept_language(self.locale)
-            self.session.headers.update({"Accept-Language": accept_language})
+        self._ensure_renewal(context)
 
-        self.session.headers.update({"Referer": self.base_url})
-        logger.debug("Configured: base_url=%s, locale=%s", self.base_url, self.locale)
+    async def renew_cookies(self, context: SessionContext) -> None:
+        """Fetch fresh cookies for `context` without disturbing in-flight requests.
 
-    async def refresh_cookies(self) -> None:
-        if not self.base_url:
-            raise VintedAPIError("base_url not configured")
+        Unlike `refresh_cookies`, the current cookies stay in the jar while
+        the HEAD request is running on a throwaway session; the new cookies
+        replace them in a single synchronous step afterwards.
+        """
+        logger.debug("Renewing session cookies for %s...", context.netloc)
 
-        logger.debug("Refreshing session cookies...")
+        fresh = await self._fetch_cookies(context)
 
-        self._clear_cookies()
+        self._clear_cookies(context)
+        for cookie in fresh:
+            self.session.cookies.jar.set_cookie(cookie)
+        await self._commit_cookies(context)
 
-        self.session.headers.update({"Referer": ""})
+        logger.info("Session cookies renewed for %s", context.netloc)
 
+    async def _fetch_cookies(self, context: SessionContext) -> list[Cookie]:
+        """Return the cookies `context.base_url` sets on a brand new session."""
+        scratch = self._create_async_session()
         try:
-            response = await self.session.head(self.base_url, impersonate="chrome", verify=True)
+            response = await scratch.head(
+                context.base_url,
+                headers=context.refresh_headers,
+                impersonate="chrome",
+                verify=True,
+            )
             response.raise_for_status()
+            return [c for c in scratch.cookies.jar if context.owns_cookie(c.domain)]
         except CurlHTTPError as e:
-            raise VintedNetworkError("Failed to refresh cookies", e)
+            raise VintedNetworkError("Failed to renew cookies", e)
         except Exception as e:
-            raise VintedNetworkError("Network error during cookie refresh", e)
+            raise VintedNetworkError("Network error during cookie renewal", e)
+        finally:
+            await scratch.close()
 
-        logger.debug("Fresh cookies received: %d cookies", len(self.session.cookies))
+    async def _commit_cookies(self, context: SessionContext) -> None:
+        """Persist the jar and publish new cookies for `context` to waiters.
 
+        With a `save_delay` the write is left to the background flusher.
+        """
         if self.storage:
-            self.storage.save(self.session.cookies.jar)
+            if self.save_delay is None:
+                await self._save_cookies()
+            else:
+                self._schedule_save()
+        self._cookies_ready = True
+        context.generation += 1
+
+    async def _save_cookies(self) -> None:
+        await self._storage_call("save", self.session.cookies.jar)
+        self._cookies_revision = await self._storage_call("revision")
+
+    def _schedule_save(self) -> None:
+        """Mark the jar dirty and start the flusher unless one is already waiting."""
+        self._save_pending = True
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.save_delay or 0.0)
+        self._flush_task = None
+        await self.flush_cookies()
+
+    async def flush_cookies(self) -> None:
+        """Write cookie changes still waiting for the write-behind flusher.
+
+        Errors are logged and the changes stay pending for the next flush.
+        """
+        if not self._save_pending or self.storage is None:
+            return
+
+        self._save_pending = False
+        try:
+            await self._save_cookies()
+        except Exception as e:
+            self._save_pending = True
+            logger.error("Failed to save cookies: %s", e)
+
+    def _ensure_renewal(self, context: SessionContext) -> None:
+        """Start the background renewal task for `context` if it is not running."""
+        if self.renew_margin is None or context.renew_task is not None:
+            return
+        context.renew_task = asyncio.create_task(self._renewal_loop(context))
+
+    def _cancel_renewal(self, context: SessionContext) -> None:
+        """Stop the renewal task so the next request reschedules it for the new token."""
+        task = context.renew_task
+        context.renew_task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _renewal_loop(self, context: SessionContext) -> None:
+        margin = self.renew_margin or 0.0
+        last_renewal: float | None = None
+
+        while True:
+            expiry = context.auth.token_expiry()
+            if expiry is None:
+                break
+
+            delay = expiry - margin - time.time()
+            if last_renewal is not None:
+                # A margin at or above the token lifetime would renew back-to-back.
+                delay = max(delay, last_renewal + MIN_RENEW_INTERVAL - time.monotonic())
+            await asyncio.sleep(max(0.0, delay))
+            if context.refresh_task is not None:
+                # A request-path refresh is already replacing the cookies.
+                await asyncio.wait([context.refresh_task])
+                continue
+
+            try:
+                last_renewal = time.monotonic()
+                await self.renew_cookies(context)
+            except VintedError as e:
+                logger.warning("Background cookie renewal failed for %s: %s", context.netloc, e)
+                await asyncio.sleep(min(RENEW_RETRY_DELAY, max(1.0, expiry - time.time())))
+                continue
+
+            renewed = context.auth.token_expiry()
+            if renewed is None or renewed <= expiry:
+                logger.warning("Renewal for %s returned no newer token", context.netloc)
+                break
+
+        if context.renew_task is asyncio.current_task():
+            context.renew_task = None
+
+    async def _refresh_once(self, context: SessionContext, generation: int) -> None:
+        """Refresh `context` cookies at most once for callers that saw `generation`.
+
+        If another request already refreshed the host's cookies since
+        `generation` was read, the call returns immediately. Otherwise all
+        callers await the same refresh task, so only one HEAD request is
+        sent per host and every waiter sees its result or its error.
+        """
+        if context.generation != generation:
+            logger.debug("Cookies already refreshed by a concurrent request")
+            return
+
+        if context.refresh_task is None:
+            task = asyncio.create_task(self._shared_refresh(context))
+            task.add_done_callback(lambda done: self._on_refresh_done(context, done))
+            context.refresh_task = task
+
+        await asyncio.shield(context.refresh_task)
+
+    async def _shared_refresh(self, context: SessionContext) -> None:
+        """Refresh `context` cookies under the cross-process `refresh_lock`, if any.
+
+        Another process may have refreshed and saved the shared cookies
+        while this one waited for the lock; a still-valid token from
+        storage is adopted instead of sending another HEAD.
+        """
+        if self.refresh_lock is None:
+            await self.refresh_cookies(context)
+            return
+
+        async with self.refresh_lock:
+            if await self._adopt_stored_cookies(context):
+                logger.debug("Adopted cookies refreshed by another process")
+                return
+            await self.refresh_cookies(context)
+            # Other processes can only adopt what is on disk when the lock is released.
+            await self.flush_cookies()
+
+    async def _adopt_stored_cookies(self, context: SessionContext) -> bool:
+        """Return True when storage changed since the last load and holds a valid token."""
+        if self.storage is None:
+            return False
+        try:
+            changed = await self._storage_call("revision") != self._cookies_revision
+        except Exception:
+            return False
+        return (
+            changed
+            and await self._load_cookies(force=True)
+            and not context.auth.is_token_expired()
+        )
 
-        logger.info("Session cookies refreshed successfully")
+    @staticmethod
+    def _on_refresh_done(context: SessionContext, task: "asyncio.Task[None]") -> None:
+        if context.refresh_task is task:
+            context.refresh_task = None
 
-    def _clear_cookies(self) -> None:
+    def _clear_cookies(self, context: SessionContext) -> None:
+        """Drop the cookies scoped to `context`'s host from memory.
+
+        Cookies of other hosts and persisted cookies are left alone.
+        """
+        jar = self.session.cookies.jar
+        for cookie in list(jar):
+            if context.owns_cookie(cookie.domain):
+                jar.clear(cookie.domain, cookie.path, cookie.name)
+        logger.debug("Cookies cleared for %s", context.netloc)
+
+    async def clear_cookies(self) -> None:
+        """Drop every cookie from memory and delete the persisted ones.
+
+        Pending write-behind saves are discarded, and the storage is
+        cleared through its async `aclear()` when it has one.
+        """
         self.session.cookies.clear()
+        self._cookies_ready = False
+        self._cookies_revision = None
+        self._save_pending = False
+        for context in self._contexts.values():
+            context.generation += 1
+            self._cancel_renewal(context)
         if self.storage:
-            self.storage.clear()
+            await self._storage_call("clear")
         logger.debug("Cookies cleared")
 
-    def _load_cookies(self) -> bool:
+    async def _load_cookies(self, force: bool = False) -> bool:
+        """Return True when the in-memory jar holds usable cookies.
+
+        The storage backend is read only when its revision differs from the
+        one seen at the last load or save. Once cookies are loaded the
+        revision itself is checked at most once per
+        `REVISION_CHECK_INTERVAL` unless `force` is set, so steady-state
+        requests rarely touch the storage.
+        """
         if not self.storage:
-            return False
+            return self._cookies_ready
+
+        now = time.monotonic()
+        if (
+            not force
+            and self._cookies_ready
+            and now - self._revision_checked_at < REVISION_CHECK_INTERVAL
+        ):
+            return True
 
         try:
-            self.storage.load(self.session.cookies.jar)
-            return True
+            revision = await self._storage_call("revision")
+            self._revision_checked_at = now
+            if self._cookies_ready and revision == self._cookies_revision:
+                return True
+
+            await self._storage_call("load", self.session.cookies.jar)
         except Exception as e:
             logger.error("Failed to load cookies: %s", e)
             return False
 
-    async def request(self, url: str, params: dict | None = None) -> Response:
-        cookies_loaded = self._load_cookies()
+        self._cookies_revision = revision
+        self._cookies_ready = True
+        for context in self._contexts.values():
+            context.generation += 1
+            self._cancel_renewal(context)
+        return True
+
+    async def _storage_call(self, operation: str, *args: Any) -> Any:
+        """Run a storage operation, off the event loop when the backend allows it.
+
+        The backend's `a<operation>` coroutine (see `AsyncCookieStorage`)
+        is preferred; otherwise the synchronous method runs on the loop.
+        Either way the call is timed into `storage_stats()`.
+        """
+        started = time.perf_counter()
+        offloaded = getattr(self.storage, "a" + operation, None)
+        if inspect.iscoroutinefunction(offloaded):
+            try:
+                return await offloaded(*args)
+            finally:
+                self._storage_stats.record(time.perf_counter() - started, blocking=False)
+
+        try:
+            return getattr(self.storage, operation)(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._storage_stats.record(elapsed, blocking=True)
+            if elapsed > SLOW_STORAGE_CALL:
+                logger.warning(
+                    "Cookie storage %s blocked the event loop for %.3fs", operation, elapsed
+                )
+
+    def storage_stats(self) -> StorageStats | None:
+        """Return timings of cookie storage calls, or None without a storage."""
+        return replace(self._storage_stats) if self.storage else None
+
+    async def request(
+        self, url: str, params: dict | None = None, use_cache: bool = True
+    ) -> Response:
+        """Perform a GET, answering from the response cache when possible.
+
+        With `use_cache=False` the response cache is not read (except in
+        offline mode, which never touches the network); the fresh
+        response is still stored.
+        """
+        if self.response_cache is not None and (use_cache or self.offline):
+            cached = await self._cached_response(url, params)
+            if cached is not None:
+                return cached
+
+        if self._coalescer:
+            return await self._coalescer.run(url, params, lambda: self._request(url, params))
+        return await self._request(url, params)
+
+    async def _cached_response(self, url: str, params: dict | None) -> Response | None:
+        """Return a response rebuilt from the response cache, or None on a miss.
+
+        In offline mode a miss raises `VintedNetworkError` instead.
+        """
+        if self.response_cache is None:
+            return None
+
+        key = cache_key(url, params)
+        try:
+            body = await self.response_cache.get(key)
+        except Exception as e:
+            logger.warning("Response cache read failed: %s", e)
+            body = None
+
+        if body is None:
+            if self.offline:
+                raise VintedNetworkError("Offline mode: response not cached", LookupError(key))
+            return None
+
+        response = CachedResponse()
+        response.url = url
+        response.status_code = HTTP_STATUS_OK
+        response.content = body
+        return response
+
+    def response_ttl(self, url: str) -> float:
+        """Return the response cache TTL for `url` (0 means not cached)."""
+        path = urlparse(url).path
+        matches = [prefix for prefix in self.response_cache_ttls if path.startswith(prefix)]
+        if not matches:
+            return self.response_cache_ttl
+        return self.response_cache_ttls[max(matches, key=len)]
+
+    async def _store_response(self, url: str, params: dict | None, response: Response) -> None:
+        if self.response_cache is None or response.status_code != HTTP_STATUS_OK:
+            return
+        ttl = self.response_ttl(url)
+        if ttl <= 0:
+            return
+        try:
+            await self.response_cache.set(cache_key(url, params), response.content, ttl)
+        except Exception as e:
+            logger.warning("Response cache write failed: %s", e)
+
+    async def _request(self, url: str, params: dict | None) -> Response:
+        response = await self._request_with_retries(url, params)
+        await self._store_response(url, params, response)
+        return response
+
+    async def _request_with_retries(self, url: str, params: dict | None) -> Response:
+        context = self.get_context(url)
+        if self._retry_budget:
+            self._retry_budget.deposit()
+
+        attempt = 1
+        while True:
+            try:
+                return await self._guarded_request(context, url, params)
+            except VintedError as e:
+                delay = self._retry_delay(attempt + 1, e)
+                if delay is None:
+                    raise
+
+                attempt += 1
+                self._report_retry(RetryAttempt(attempt=attempt, delay=delay, url=url, error=e))
+
+            await asyncio.sleep(delay)
+
+    def _report_retry(self, retry_attempt: RetryAttempt) -> None:
+        logger.warning(
+            "Retrying %s (attempt %d) in %.2fs: %s",
+            retry_attempt.url,
+            retry_attempt.attempt,
+            retry_attempt.delay,
+            retry_attempt.error,
+        )
+        if self.retry and self.retry.on_retry:
+            self.retry.on_retry(retry_attempt)
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float | None:
+        """Return the backoff before `attempt`, or None when it must not happen."""
+        if not self.retry or not self._retry_budget:
+            return None
+        if attempt > self.retry.max_attempts or not self.retry.is_retryable(error):
+            return None
+        if not self._retry_budget.try_spend():
+            logger.warning("Retry budget exhausted, not retrying: %s", error)
+            return None
+        return self.retry.backoff(attempt)
+
+    def circuit_open(self, netloc: str) -> bool:
+        """Return True while the breaker for `netloc` rejects calls outright."""
+        breaker = self._breakers.get(netloc)
+        return breaker is not None and breaker.retry_after() > 0
+
+    def get_breaker(self, netloc: str) -> CircuitBreaker | None:
+        """Return the circuit breaker for `netloc`, or None when disabled."""
+        if self.circuit_breaker is None:
+            return None
+
+        breaker = self._breakers.get(netloc)
+        if breaker is None:
+            breaker = CircuitBreaker(self.circuit_breaker, netloc, self.proxy)
+            self._breakers[netloc] = breaker
+        return breaker
+
+    async def _guarded_request(
+        self, context: SessionContext, url: str, params: dict | None
+    ) -> Response:
+        """Run one attempt through the host's circuit breaker, if enabled."""
+        breaker = self.get_breaker(context.netloc)
+        if breaker is None:
+            return await self._request_once(context, url, params)
+
+        probe = breaker.acquire()
+        try:
+            response = await self._request_once(context, url, params)
+        except VintedAPIError as e:
+            failed = e.status_code in breaker.config.failure_statuses
+            breaker.record(not failed, probe)
+            raise
+        except VintedNetworkError:
+            breaker.record(False, probe)
+            raise
+        except BaseException:
+            breaker.release(probe)
+            raise
+
+        breaker.record(True, probe)
+        return response
+
+    async def _request_once(
+        self, context: SessionContext, url: str, params: dict | None
+    ) -> Response:
+        waited = 0.0
+
+        while True:
+            if self._limiter:
+                await self._limiter.acquire(context.netloc)
+
+            response = await self._send_limited(context, url, params)
+            if response.status_code != HTTP_STATUS_RATE_LIMIT:
+                break
+
+            waited = self._handle_rate_limit(context, response, waited)
+
+        if response.status_code >= 400:
+            error_class = (
+                VintedNotFoundError
+                if response.status_code == HTTP_STATUS_NOT_FOUND
+                else VintedAPIError
+            )
+            raise error_class(
+                f"HTTP {response.status_code}: {response.reason}",
+                status_code=response.status_code,
+                response=response,
+            )
+
+        return response
+
+    async def _send_limited(
+        self, context: SessionContext, url: str, params: dict | None
+    ) -> Response:
+        """Send through the host's adaptive concurrency limit, if enabled."""
+        if self._concurrency is None:
+            return await self._send(context, url, params)
+
+        limiter = self._concurrency.limiter(context.netloc)
+        await limiter.acquire()
+        started = time.monotonic()
+
+        try:
+            response = await self._send(context, url, params)
+        except VintedNetworkError:
+            limiter.release(time.monotonic() - started, overloaded=True)
+            raise
+        except BaseException:
+            limiter.release()
+            raise
+
+        overloaded = response.status_code in (HTTP_STATUS_FORBIDDEN, HTTP_STATUS_RATE_LIMIT)
+        limiter.release(time.monotonic() - started, overloaded=overloaded)
+        return response
+
+    def concurrency_stats(self) -> list[ConcurrencyStats]:
+        """Return the adaptive limit and queue depth of every host seen so far."""
+        if self._concurrency is None:
+            return []
+        return [
+            ConcurrencyStats(
+                netloc=str(netloc),
+                proxy=self.proxy,
+                limit=limiter.limit,
+                in_flight=limiter.in_flight,
+                queued=limiter.queued,
+            )
+            for netloc, limiter in self._concurrency.items()
+        ]
+
+    async def _send(self, context: SessionContext, url: str, params: dict | None) -> Response:
+        """Send one GET with valid cookies, refreshing once on 401/403."""
+        cookies_loaded = await self._load_cookies()
+        generation = context.generation
 
         if cookies_loaded:
-            if self.auth.is_token_expired():
+            if context.auth.is_token_expired():
                 logger.info("Access token expired, refreshing cookies")
-                await self.refresh_cookies()
+                await self._refresh_once(context, generation)
         else:
             # Если куки не были загружены, то рефрешим
             logger.debug("No saved cookies, refreshing...")
-            await self.refresh_cookies()
+            await self._refresh_once(context, generation)
+
+        self._ensure_renewal(context)
+        generation = context.generation
 
         try:
             response: Response = await self.session.get(
                 url=url,
                 params=params,
+                headers=context.headers,
                 impersonate="chrome",
                 verify=True,
             )
@@ -156,12 +823,13 @@ class HttpSession:
 
         if response.status_code in (HTTP_STATUS_UNAUTHORIZED, HTTP_STATUS_FORBIDDEN):
             logger.warning("Auth failed, refreshing cookies...")
-            await self.refresh_cookies()
+            await self._refresh_once(context, generation)
 
             try:
                 retry_response: Response = await self.session.get(
                     url=url,
                     params=params,
+                    headers=context.headers,
                     impersonate="chrome",
                     verify=True,
                 )
@@ -174,14 +842,43 @@ class HttpSession:
             except Exception as e:
                 raise VintedNetworkError("Network error on retry", e)
 
-        if response.status_code >= 400:
-            raise VintedAPIError(
-                f"HTTP {response.status_code}: {response.reason}",
+        return response
+
+    def _handle_rate_limit(
+        self, context: SessionContext, response: Response, waited: float
+    ) -> float:
+        """Pause the host's bucket after a 429 and return the updated wait total.
+
+        Raises `VintedRateLimitError` when pacing is disabled or when honouring
+        `Retry-After` would exceed the configured wait budget.
+        """
+        if not self._limiter:
+            raise VintedRateLimitError(
+                "HTTP 429: rate limited", status_code=response.status_code, response=response
+            )
+
+        config = self._limiter.config
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = config.default_retry_after
+
+        self._limiter.pause(context.netloc, delay)
+
+        if waited + delay > config.max_wait:
+            raise VintedRateLimitError(
+                f"HTTP 429: rate limited, Retry-After {delay:.0f}s exceeds wait budget",
                 status_code=response.status_code,
                 response=response,
             )
 
-        return response
+        logger.warning("Rate limited on %s, pausing for %.1fs", context.netloc, delay)
+        return waited + delay
 
     async def close(self) -> None:
+        for context in self._contexts.values():
+            self._cancel_renewal(context)
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush_cookies()
         await self.session.close()
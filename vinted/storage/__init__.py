@@ -1,6 +1,18 @@
-from .base import CookieStorage
+from .base import AsyncCookieStorage, CookieStorage, StorageStats
 from .json import JsonStorage
+from .lock import FileLock
 from .mozilla import MozillaStorage
 from .pickle import PickleStorage
+from .sqlite import CookieDatabase, SqliteStorage
 
-__all__ = ["CookieStorage", "PickleStorage", "JsonStorage", "MozillaStorage"]
+__all__ = [
+    "AsyncCookieStorage",
+    "CookieStorage",
+    "StorageStats",
+    "FileLock",
+    "PickleStorage",
+    "JsonStorage",
+    "MozillaStorage",
+    "SqliteStorage",
+    "CookieDatabase",
+]
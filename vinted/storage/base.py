@@ -1,17 +1,73 @@
 """Abstract cookie storage interface.
 
 Provides an abstract base class for persisting a cookie jar to disk
-in different formats (pickle, json, mozilla). Implementations must
-implement `save` and `load` and receive a `filepath` to operate on.
+in different formats (pickle, json, mozilla, sqlite). Implementations
+must implement `save` and `load` and receive a `filepath` to operate
+on. The base class derives the async `aload`/`asave`/`aclear` methods
+of `AsyncCookieStorage` (and `arevision`) from them by running the I/O
+in a worker thread.
 """
 
+import asyncio
 import logging
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.cookiejar import CookieJar
 from pathlib import Path
+from typing import Protocol, runtime_checkable
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StorageStats:
+    """Timings of the cookie storage calls made by a session.
+
+    Attributes:
+        calls: Storage operations performed (load, save, clear, revision).
+        blocking_calls: Operations that ran synchronously on the event loop.
+        blocking_time: Total seconds the event loop was blocked by storage.
+        max_blocking: Longest single event loop stall in seconds.
+        offloaded_time: Total seconds spent awaiting storage I/O running in
+            worker threads; other tasks keep running meanwhile.
+    """
+
+    calls: int = 0
+    blocking_calls: int = 0
+    blocking_time: float = 0.0
+    max_blocking: float = 0.0
+    offloaded_time: float = 0.0
+
+    def record(self, elapsed: float, blocking: bool) -> None:
+        """Account one storage call that took `elapsed` seconds."""
+        self.calls += 1
+        if blocking:
+            self.blocking_calls += 1
+            self.blocking_time += elapsed
+            self.max_blocking = max(self.max_blocking, elapsed)
+        else:
+            self.offloaded_time += elapsed
+
+
+@runtime_checkable
+class AsyncCookieStorage(Protocol):
+    """Cookie storage whose I/O does not block the event loop.
+
+    `HttpSession` prefers these coroutines over the synchronous methods
+    whenever a storage provides them.
+    """
+
+    async def aload(self, cookies_jar) -> None: ...
+
+    async def asave(self, cookies_jar) -> None: ...
+
+    async def aclear(self) -> None: ...
+
+
 class CookieStorage(ABC):
     """Base interface for cookie storage backends.
 
@@ -25,6 +81,7 @@ class CookieStorage(ABC):
 
     def __init__(self, filepath: Path):
         self.filepath = filepath
+        self._io_lock = asyncio.Lock()
 
     @abstractmethod
     def save(self, cookies_jar) -> None:
@@ -35,18 +92,105 @@ class CookieStorage(ABC):
 
     @abstractmethod
     def load(self, cookies_jar) -> None:
-        """Load cookies from disk into the provided `cookies_jar`.
+        """Replace the contents of `cookies_jar` with the cookies on disk.
 
-        Implementations should be tolerant to missing or corrupted
-        files and raise only when appropriate.
+        When nothing is persisted the jar is left alone. Implementations
+        should be tolerant to missing or corrupted files and raise only
+        when appropriate.
         """
 
     def exists(self) -> bool:
         """Return True when the underlying cookie file exists on disk."""
         return self.filepath.is_file()
 
+    def revision(self) -> Hashable | None:
+        """Return an opaque marker that changes whenever persisted cookies change.
+
+        The default implementation combines the file modification time and
+        size, which is enough for `HttpSession` to skip re-reading a file it
+        has already loaded. Returns None when nothing is persisted.
+        """
+        try:
+            stat = self.filepath.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @contextmanager
+    def _atomic_target(self) -> Iterator[Path]:
+        """Yield a temp file next to `filepath` that replaces it on success.
+
+        The temp file is synced and then renamed over `filepath`, so the
+        cookie file is always either the old or the new version, never a
+        truncated one. On error the temp file is removed.
+        """
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(
+            dir=self.filepath.parent, prefix=f".{self.filepath.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        tmp = Path(name)
+        try:
+            yield tmp
+            with tmp.open("rb") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filepath)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
     def clear(self) -> None:
         """Delete the underlying cookie file if present and log the action."""
         if self.exists():
             self.filepath.unlink()
             logger.debug(f"Cookies file deleted: {self.filepath}")
+
+    async def aload(self, cookies_jar) -> None:
+        """Load cookies without blocking the event loop.
+
+        The file is read into a scratch jar in a worker thread; `cookies_jar`
+        is then replaced with its contents on the loop, so requests never
+        see a half-loaded jar and cookies deleted on disk do not linger.
+        The result is the same as with the synchronous `load()`.
+        """
+        scratch = CookieJar()
+
+        def read() -> bool:
+            if not self.exists():
+                return False
+            self.load(scratch)
+            return True
+
+        async with self._io_lock:
+            found = await asyncio.to_thread(read)
+        if not found:
+            return
+        cookies_jar.clear()
+        for cookie in scratch:
+            cookies_jar.set_cookie(cookie)
+
+    async def asave(self, cookies_jar) -> None:
+        """Persist a snapshot of `cookies_jar` from a worker thread.
+
+        The snapshot is taken on the loop so the jar can keep changing
+        while the write is in progress; saves and loads of one storage
+        never overlap.
+        """
+        snapshot = CookieJar()
+        for cookie in list(cookies_jar):
+            snapshot.set_cookie(cookie)
+        async with self._io_lock:
+            await asyncio.to_thread(self.save, snapshot)
+
+    async def arevision(self) -> Hashable | None:
+        """Return `revision()` from a worker thread.
+
+        Revision checks do not wait for an ongoing save or load; a check
+        racing a save simply sees the old or the new revision.
+        """
+        return await asyncio.to_thread(self.revision)
+
+    async def aclear(self) -> None:
+        """Delete persisted cookies from a worker thread."""
+        async with self._io_lock:
+            await asyncio.to_thread(self.clear)
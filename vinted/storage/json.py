@@ -19,8 +19,9 @@ class JsonStorage(CookieStorage):
     """Persist cookies as JSON.
 
     The JSON representation maps a composite key (`domain|path|name`) to
-    a small dictionary describing the cookie attributes. Both `save`
-    and `load` are synchronous and may raise on I/O errors.
+    a small dictionary describing the cookie attributes. It is written
+    compactly and replaced atomically. Both `save` and `load` are
+    synchronous and may raise on I/O errors.
     """
 
     def save(self, cookies_jar) -> None:
@@ -33,8 +34,8 @@ class JsonStorage(CookieStorage):
             jar = cast(Any, cookies_jar)
             cookies_dict = self._jar_to_dict(jar)
 
-            with self.filepath.open("w") as f:
-                json.dump(cookies_dict, f, indent=2)
+            with self._atomic_target() as target, target.open("w") as f:
+                json.dump(cookies_dict, f, separators=(",", ":"))
             logger.debug("Cookies saved (json): %s", self.filepath)
         except Exception as e:
             logger.error("Failed to save cookies: %s", e, exc_info=True)
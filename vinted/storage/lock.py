@@ -0,0 +1,91 @@
+"""Inter-process lock for shared cookie files.
+
+Several processes (or clients) persisting cookies to the same file
+would otherwise each refresh an expired token on their own. `FileLock`
+serialises those refreshes through an advisory lock on a sidecar file,
+so the first process refreshes and the others pick up its cookies.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+
+class FileLock:
+    """Advisory exclusive lock on `path`, usable across processes.
+
+    The lock is acquired asynchronously by polling a non-blocking lock,
+    so a cancelled waiter never leaves a thread behind that later grabs
+    it. Waiters within one process queue on an `asyncio.Lock` first.
+
+    Args:
+        path: Lock file; created on first use.
+        poll_interval: Seconds between attempts while another process
+            holds the lock.
+    """
+
+    def __init__(self, path: Path, poll_interval: float = 0.05):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self._local = asyncio.Lock()
+        self._fd: int | None = None
+
+    @property
+    def locked(self) -> bool:
+        """Return True while this instance holds the lock."""
+        return self._fd is not None
+
+    async def acquire(self) -> None:
+        """Wait until the lock is held by this process."""
+        await self._local.acquire()
+        try:
+            while not self._try_acquire():
+                await asyncio.sleep(self.poll_interval)
+        except BaseException:
+            self._local.release()
+            raise
+
+    def release(self) -> None:
+        """Release the lock; other processes may take it immediately."""
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            try:
+                if sys.platform == "win32":
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+        self._local.release()
+
+    def _try_acquire(self) -> bool:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        self._fd = fd
+        logger.debug("Lock acquired: %s", self.path)
+        return True
+
+    async def __aenter__(self) -> "FileLock":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
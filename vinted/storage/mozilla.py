@@ -51,7 +51,8 @@ class MozillaStorage(CookieStorage):
                         )
                         jar.set_cookie(new_cookie)
 
-            jar.save(ignore_discard=True, ignore_expires=True)
+            with self._atomic_target() as target:
+                jar.save(str(target), ignore_discard=True, ignore_expires=True)
             logger.debug("Cookies saved (mozilla): %s", self.filepath)
         except Exception as e:
             logger.error("Failed to save cookies: %s", e, exc_info=True)
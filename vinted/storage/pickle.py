@@ -26,7 +26,7 @@ class PickleStorage(CookieStorage):
         """Write internal cookie mapping to a binary pickle file."""
         try:
             jar = cast(Any, cookies_jar)
-            with self.filepath.open("wb") as f:
+            with self._atomic_target() as target, target.open("wb") as f:
                 pickle.dump(jar._cookies, f)  # noqa: S301 - intentional
             logger.debug("Cookies saved (pickle): %s", self.filepath)
         except Exception as e:
@@ -34,7 +34,7 @@ class PickleStorage(CookieStorage):
             raise
 
     def load(self, cookies_jar) -> None:
-        """Load and merge a pickled cookies mapping into `cookies_jar`."""
+        """Replace the contents of `cookies_jar` with the pickled cookies mapping."""
         if not self.exists():
             logger.debug("Cookies file not found: %s", self.filepath)
             return
@@ -43,7 +43,8 @@ class PickleStorage(CookieStorage):
             jar = cast(Any, cookies_jar)
             with self.filepath.open("rb") as f:
                 cookies = pickle.load(f)
-                jar._cookies.update(cookies)
+            jar.clear()
+            jar._cookies.update(cookies)
             logger.debug("Cookies loaded (pickle): %s", self.filepath)
         except Exception as e:
             logger.error("Failed to load cookies: %s", e, exc_info=True)
@@ -0,0 +1,232 @@
+"""SQLite-based cookie storage.
+
+Keeps the cookies of many identities (one per proxy) in a single SQLite
+database in WAL mode instead of one file per proxy. Rows are keyed by
+identity and cookie domain/path/name, each save replaces an identity's
+cookies in one transaction, and several processes can share the file.
+`CookieDatabase.preload()` reads every identity in one query so a
+client with hundreds of proxies starts with a single read.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Hashable
+from pathlib import Path
+
+from .base import CookieStorage
+from .json import JsonStorage
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cookies (
+    identity TEXT NOT NULL,
+    key TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (identity, key)
+);
+CREATE TABLE IF NOT EXISTS revisions (
+    identity TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL
+);
+"""
+
+BUSY_TIMEOUT_MS = 5000
+
+
+class CookieDatabase:
+    """Shared connection to a cookie database used by several `SqliteStorage`s.
+
+    Args:
+        filepath: Path to the SQLite database file.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = Path(filepath)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # Revision checks use their own connection and lock, so they are
+        # never stuck behind a save waiting for the write lock (WAL
+        # readers do not block on writers).
+        self._read_lock = threading.Lock()
+        self._reader: sqlite3.Connection | None = None
+        self._preloaded: dict[str, tuple[int, dict]] = {}
+
+    def _open(self) -> sqlite3.Connection:
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.filepath,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = self._open()
+        return self._conn
+
+    def preload(self) -> None:
+        """Read the cookies of every identity in one query.
+
+        Subsequent `load()` calls are served from this snapshot as long as
+        the identity's revision has not changed in the meantime.
+        """
+        with self._lock:
+            conn = self._connect()
+            revisions = dict(conn.execute("SELECT identity, revision FROM revisions"))
+            snapshot: dict[str, dict] = {identity: {} for identity in revisions}
+            for identity, key, data in conn.execute("SELECT identity, key, data FROM cookies"):
+                snapshot.setdefault(identity, {})[key] = json.loads(data)
+            self._preloaded = {
+                identity: (revisions.get(identity, 0), cookies)
+                for identity, cookies in snapshot.items()
+            }
+        logger.debug("Preloaded cookies for %d identities", len(self._preloaded))
+
+    def revision(self, identity: str) -> int | None:
+        """Return the identity's save counter, or None when nothing is stored."""
+        with self._read_lock:
+            if self._reader is None:
+                self._reader = self._open()
+            row = self._reader.execute(
+                "SELECT revision FROM revisions WHERE identity = ?", (identity,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def load(self, identity: str) -> dict:
+        """Return the identity's cookies as a `key -> attributes` mapping."""
+        with self._lock:
+            conn = self._connect()
+            preloaded = self._preloaded.pop(identity, None)
+            if preloaded is not None:
+                row = conn.execute(
+                    "SELECT revision FROM revisions WHERE identity = ?", (identity,)
+                ).fetchone()
+                if row is not None and row[0] == preloaded[0]:
+                    return preloaded[1]
+
+            rows = conn.execute("SELECT key, data FROM cookies WHERE identity = ?", (identity,))
+            return {key: json.loads(data) for key, data in rows}
+
+    def save(self, identity: str, cookies: dict) -> None:
+        """Replace the identity's cookies and bump its revision atomically."""
+        rows = [
+            (identity, key, data["domain"] or "", json.dumps(data, separators=(",", ":")))
+            for key, data in cookies.items()
+        ]
+        with self._lock:
+            self._preloaded.pop(identity, None)
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM cookies WHERE identity = ?", (identity,))
+                conn.executemany(
+                    "INSERT INTO cookies (identity, key, domain, data) VALUES (?, ?, ?, ?)", rows
+                )
+                self._bump_revision(conn, identity)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def clear(self, identity: str) -> None:
+        """Delete the identity's cookies."""
+        with self._lock:
+            self._preloaded.pop(identity, None)
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM cookies WHERE identity = ?", (identity,))
+                conn.execute("DELETE FROM revisions WHERE identity = ?", (identity,))
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    @staticmethod
+    def _bump_revision(conn: sqlite3.Connection, identity: str) -> None:
+        conn.execute(
+            "INSERT INTO revisions (identity, revision) VALUES (?, 1) "
+            "ON CONFLICT (identity) DO UPDATE SET revision = revision + 1",
+            (identity,),
+        )
+
+
+class SqliteStorage(CookieStorage):
+    """Persist one identity's cookies in a shared SQLite database.
+
+    Args:
+        filepath: Path to the SQLite database file.
+        identity: Key separating this storage's cookies from other
+            identities in the same file, e.g. the proxy `host:port`.
+        database: Optional `CookieDatabase` shared with other storages;
+            one is opened on `filepath` when omitted.
+    """
+
+    def __init__(
+        self, filepath: Path, identity: str = "default", database: CookieDatabase | None = None
+    ):
+        super().__init__(filepath)
+        self.identity = identity
+        self.database = database or CookieDatabase(filepath)
+
+    def save(self, cookies_jar) -> None:
+        """Replace this identity's stored cookies with the jar contents."""
+        try:
+            self.database.save(self.identity, JsonStorage._jar_to_dict(cookies_jar))
+            logger.debug("Cookies saved (sqlite): %s [%s]", self.filepath, self.identity)
+        except Exception as e:
+            logger.error("Failed to save cookies: %s", e, exc_info=True)
+            raise
+
+    def load(self, cookies_jar) -> None:
+        """Load this identity's cookies into `cookies_jar`.
+
+        If nothing is stored for the identity the method returns quietly.
+        """
+        try:
+            cookies = self.database.load(self.identity)
+        except Exception as e:
+            logger.error("Failed to load cookies: %s", e, exc_info=True)
+            raise
+
+        if not cookies:
+            logger.debug("No cookies stored for %s", self.identity)
+            return
+
+        JsonStorage._dict_to_jar(cookies, cookies_jar)
+        logger.debug("Cookies loaded (sqlite): %s [%s]", self.filepath, self.identity)
+
+    def exists(self) -> bool:
+        """Return True when cookies are stored for this identity."""
+        return self.revision() is not None
+
+    def revision(self) -> Hashable | None:
+        """Return the identity's save counter, which every save increments."""
+        try:
+            return self.database.revision(self.identity)
+        except sqlite3.Error:
+            return None
+
+    def clear(self) -> None:
+        """Delete this identity's cookies, leaving other identities alone."""
+        self.database.clear(self.identity)
+        logger.debug("Cookies cleared (sqlite): %s [%s]", self.filepath, self.identity)
@@ -0,0 +1,63 @@
+"""Apply `TransportConfig` to `curl_cffi` sessions.
+
+Per-transfer settings (timeouts, HTTP version, DNS cache, TCP
+keep-alive) are regular session options. Connection-pool limits are
+libcurl *multi* options, which live on the `AsyncCurl` handle that
+`curl_cffi` only creates once an event loop is running, so
+`TransportSession` applies them when that handle is created.
+"""
+
+from typing import Any
+
+from curl_cffi import AsyncCurl, AsyncSession, CurlMOpt, CurlOpt, ffi
+
+from .models.config import TransportConfig
+
+
+class TransportSession(AsyncSession):
+    """`AsyncSession` that applies connection-pool limits to its multi handle.
+
+    Args:
+        transport: `TransportConfig` whose settings are applied.
+        **kwargs: Forwarded to `AsyncSession`.
+    """
+
+    def __init__(self, transport: TransportConfig, **kwargs: Any):
+        super().__init__(**session_options(transport), **kwargs)
+        self.transport = transport
+
+    @property
+    def acurl(self) -> AsyncCurl:
+        if self._acurl is None:
+            acurl = AsyncCurl(loop=self.loop)
+            for option, value in multi_options(self.transport).items():
+                # The binding declares the argument as a pointer; libcurl reads a long.
+                acurl.setopt(option, ffi.cast("void *", value))
+            self._acurl = acurl
+        return self._acurl
+
+
+def session_options(transport: TransportConfig) -> dict[str, Any]:
+    """Return `AsyncSession` keyword arguments for `transport`."""
+    curl_options: dict[CurlOpt, int] = {CurlOpt.DNS_CACHE_TIMEOUT: transport.dns_cache_ttl}
+    if transport.keep_alive:
+        curl_options[CurlOpt.TCP_KEEPALIVE] = 1
+        curl_options[CurlOpt.TCP_KEEPIDLE] = transport.keep_alive_idle
+        curl_options[CurlOpt.TCP_KEEPINTVL] = transport.keep_alive_interval
+
+    return {
+        "max_clients": transport.max_clients,
+        "timeout": (transport.connect_timeout, transport.read_timeout),
+        "http_version": transport.http_version,
+        "curl_options": curl_options,
+    }
+
+
+def multi_options(transport: TransportConfig) -> dict[CurlMOpt, int]:
+    """Return the libcurl multi-handle options for `transport`."""
+    options: dict[CurlMOpt, int] = {}
+    if transport.pool_size is not None:
+        options[CurlMOpt.MAXCONNECTS] = transport.pool_size
+    if transport.max_host_connections is not None:
+        options[CurlMOpt.MAX_HOST_CONNECTIONS] = transport.max_host_connections
+    return options
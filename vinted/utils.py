@@ -1,9 +1,15 @@
 """Utility helpers.
 
-Small helpers used across the library for formatting proxy strings and
-resolving Accept-Language headers.
+Small helpers used across the library for formatting proxy strings,
+resolving Accept-Language headers and deriving per-domain settings from
+Vinted URLs.
 """
 
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import urlparse
+
 from .constants import LOCALE_TO_ACCEPT_LANGUAGE, VALID_LOCALES
 
 
@@ -49,3 +55,52 @@ def get_accept_language(locale: str) -> str:
     locale_code = LOCALE_TO_ACCEPT_LANGUAGE.get(locale, "en-US")
     lang_prefix = locale_code.split("-")[0]
     return "%s,%s;q=0.9" % (locale_code, lang_prefix)
+
+
+@lru_cache(maxsize=256)
+def get_base_url(url: str) -> str:
+    """Return the `https://<netloc>` base URL for a public Vinted URL."""
+    return f"https://{urlparse(url).netloc}"
+
+
+def extract_locale(netloc: str) -> str | None:
+    """Return the Vinted locale (TLD part) for a host such as `www.vinted.co.uk`.
+
+    Hosts that do not contain `vinted.` fall back to the last domain label.
+    Returns None for single-label hosts.
+    """
+    host = netloc.split(":")[0]
+    _, sep, tail = host.partition("vinted.")
+    if sep and tail:
+        return tail
+
+    parts = host.split(".")
+    return parts[-1] if len(parts) > 1 else None
+
+
+def cookie_domain_matches(host: str, cookie_domain: str) -> bool:
+    """Return True when a cookie set for `cookie_domain` applies to `host`."""
+    domain = cookie_domain.lstrip(".")
+    return host == domain or host.endswith("." + domain)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds described by a `Retry-After` header.
+
+    Accepts both delta-seconds (`"120"`) and HTTP-date forms. Returns None
+    when the header is missing or cannot be parsed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,81 @@
+"""Concurrent warm-up of proxy sessions.
+
+The first request to a Vinted domain pays for DNS, the TLS handshake
+and the cookie refresh HEAD. `warm_up_sessions` does that work ahead of
+time for every session and URL pair, with bounded parallelism, and
+reports how long each target took and whether it succeeded.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from .exceptions import VintedError
+from .session import HttpSession
+from .utils import extract_locale, format_proxy_for_log
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WarmUpResult:
+    """Outcome of warming up one proxy session for one domain.
+
+    Attributes:
+        url: Base URL of the domain, e.g. `https://www.vinted.fr`.
+        locale: Vinted locale of the domain.
+        proxy: Proxy the session uses (None for a direct connection).
+        ok: True when the session holds valid cookies and an open connection.
+        elapsed: Seconds the warm-up took.
+        error: The error that made the warm-up fail, if any.
+    """
+
+    url: str
+    locale: str | None
+    proxy: str | None
+    ok: bool
+    elapsed: float
+    error: VintedError | None = None
+
+
+async def warm_up_sessions(
+    sessions: list[HttpSession], urls: list[str], concurrency: int = 8
+) -> list[WarmUpResult]:
+    """Warm every session up for every URL, at most `concurrency` at a time.
+
+    Failures are reported in the results rather than raised, so one dead
+    proxy does not hide the state of the others.
+
+    Returns:
+        One `WarmUpResult` per (session, URL) pair, in session then URL order.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def warm(session: HttpSession, url: str) -> WarmUpResult:
+        async with semaphore:
+            started = time.monotonic()
+            error: VintedError | None = None
+            try:
+                await session.warm_up(url)
+            except VintedError as e:
+                error = e
+                logger.warning(
+                    "Warm-up of %s via %s failed: %s",
+                    url,
+                    format_proxy_for_log(session.proxy),
+                    e,
+                )
+            return WarmUpResult(
+                url=url,
+                locale=extract_locale(urlparse(url).netloc),
+                proxy=session.proxy,
+                ok=error is None,
+                elapsed=time.monotonic() - started,
+                error=error,
+            )
+
+    results = await asyncio.gather(*(warm(s, url) for s in sessions for url in urls))
+    logger.info("Warm-up finished: %d/%d targets ready", sum(r.ok for r in results), len(results))
+    return list(results)
@@ -0,0 +1,94 @@
+"""Building blocks of the new-listing watcher.
+
+`SeenWindow` remembers the most recently seen item ids in bounded
+memory, and `PollInterval` turns the observed arrival rate of new
+listings into the pause before the next poll. `CatalogAPI.watch()`
+combines both.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from .models.config import WatchConfig
+
+
+class SeenWindow:
+    """Set of the `capacity` most recently seen ids.
+
+    Adding an id beyond capacity evicts the id that was seen least
+    recently; seeing an id again makes it the most recent one.
+
+    Args:
+        capacity: Maximum number of ids remembered.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._ids: OrderedDict[Hashable, None] = OrderedDict()
+
+    def add(self, item_id: Hashable) -> bool:
+        """Remember `item_id` and return True when it was not seen before."""
+        if item_id in self._ids:
+            self._ids.move_to_end(item_id)
+            return False
+
+        self._ids[item_id] = None
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+        return True
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class PollInterval:
+    """Adaptive pause between polls of one search.
+
+    Keeps an exponentially weighted estimate of new items per second
+    and aims for `items_per_poll` new items per poll, within
+    `[min_interval, max_interval]`. The interval shrinks immediately
+    when listings speed up but grows by at most `backoff` per poll.
+
+    Args:
+        config: Watcher settings.
+    """
+
+    def __init__(self, config: WatchConfig):
+        self.config = config
+        self.rate = 0.0
+        self.interval = config.min_interval
+
+    def update(self, new_items: int, elapsed: float, saturated: bool = False) -> float:
+        """Record a poll and return the pause before the next one.
+
+        Args:
+            new_items: Unseen items the poll returned.
+            elapsed: Seconds since the previous poll.
+            saturated: True when every fetched item was unseen, so more
+                may have been missed; the next poll then comes as soon
+                as allowed.
+        """
+        config = self.config
+        observed = new_items / max(elapsed, 1e-3)
+        self.rate = config.smoothing * observed + (1 - config.smoothing) * self.rate
+
+        if saturated:
+            target = config.min_interval
+        elif self.rate > 0:
+            target = config.items_per_poll / self.rate
+        else:
+            target = config.max_interval
+
+        target = min(target, self.interval * config.backoff)
+        self.interval = max(config.min_interval, min(config.max_interval, target))
+        return self.interval
+
+    def back_off(self) -> float:
+        """Grow the interval after a failed poll and return it."""
+        self.interval = min(self.config.max_interval, self.interval * self.config.backoff)
+        return self.interval